@@ -1,49 +1,160 @@
 # -*- coding: utf-8 -*-
-import warnings
-from relevanceai.client import Client
-
-# Cluster _Base Utilities
-from relevanceai.operations.cluster.base import (
-    ClusterBase,
-    CentroidClusterBase,
-)
-from relevanceai.operations.cluster import ClusterOps
-from relevanceai.operations.dr.ops import ReduceDimensionsOps
-from relevanceai.operations.vector import Base2Vec
-
-# Fix the name
-from relevanceai.utils import datasets
-from relevanceai.utils.datasets import mock_documents
-import requests
-
-from relevanceai.constants.warning import Warning
-
-# Import useful utility if possible as well
-try:
-    from jsonshower import show_json
-except ModuleNotFoundError:
-    pass
+"""
+Public names are imported lazily (PEP 562) so that `import relevanceai` does
+not load the client, pandas, numpy or sklearn until they are used.
+"""
+import importlib
+import importlib.util
+import json
+import os
+import threading
+import time
+
+from typing import Any, Dict, Optional, Tuple
 
 __version__ = "2.6.6"
 
-try:
-    pypi_data = requests.get("https://pypi.org/pypi/relevanceai/json").json()
-    pypi_info = pypi_data.get("info", None)
-    if pypi_info is not None:
-        latest_version = pypi_info.get("version", None)
-    else:
-        latest_version = None
-
-    if __version__ < latest_version and latest_version is not None:
-        changelog_url: str = (
-            f"https://relevanceai.readthedocs.io/en/{__version__}/changelog.html"
-        )
-        warnings.warn(
-            Warning.LATEST_VERSION.format(
-                version=__version__,
-                latest_version=latest_version,
-                changelog_url=changelog_url,
+# Public name -> (module, attribute). An attribute of None means the module itself.
+_LAZY_IMPORTS: Dict[str, Tuple[str, Optional[str]]] = {
+    "Client": ("relevanceai.client", "Client"),
+    # Cluster _Base Utilities
+    "ClusterBase": ("relevanceai.operations.cluster.base", "ClusterBase"),
+    "CentroidClusterBase": (
+        "relevanceai.operations.cluster.base",
+        "CentroidClusterBase",
+    ),
+    "ClusterOps": ("relevanceai.operations.cluster", "ClusterOps"),
+    "ReduceDimensionsOps": ("relevanceai.operations.dr.ops", "ReduceDimensionsOps"),
+    "Base2Vec": ("relevanceai.operations.vector", "Base2Vec"),
+    # Fix the name
+    "datasets": ("relevanceai.utils.datasets", None),
+    "mock_documents": ("relevanceai.utils.datasets", "mock_documents"),
+    # Useful utility if it is installed
+    "show_json": ("jsonshower", "show_json"),
+}
+
+# Optional utilities are only exported by `from relevanceai import *` if they
+# are installed
+_OPTIONAL_IMPORTS = {"show_json"}
+
+__all__ = [
+    name
+    for name, (module_name, _) in _LAZY_IMPORTS.items()
+    if name not in _OPTIONAL_IMPORTS
+    or importlib.util.find_spec(module_name) is not None
+] + ["check_version"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_IMPORTS[name]
+    try:
+        module = importlib.import_module(module_name)
+    except ModuleNotFoundError as e:
+        if name not in _OPTIONAL_IMPORTS:
+            raise
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}, install {module_name} to use it"
+        ) from e
+    value = module if attribute is None else getattr(module, attribute)
+    # Cache it so that __getattr__ is not called for it again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
+
+
+# Set to "1" to check PyPI for a newer version in the background on import
+CHECK_VERSION_ENV_VAR = "RELEVANCEAI_CHECK_VERSION"
+VERSION_CHECK_CACHE_SECONDS = 24 * 60 * 60
+
+
+def _parse_version(version: str) -> Tuple[int, ...]:
+    parts = []
+    for part in version.split("."):
+        digits = "".join(c for c in part if c.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+def _version_cache_path() -> str:
+    from appdirs import user_cache_dir
+
+    return os.path.join(user_cache_dir("relevanceai"), "latest_version.json")
+
+
+def _get_latest_version(timeout: float) -> Optional[str]:
+    """The latest version on PyPI, cached for a day"""
+    path = _version_cache_path()
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        if time.time() - cached["checked_at"] < VERSION_CHECK_CACHE_SECONDS:
+            return cached["latest_version"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    from urllib.request import urlopen
+
+    with urlopen("https://pypi.org/pypi/relevanceai/json", timeout=timeout) as r:
+        latest_version = json.load(r).get("info", {}).get("version")
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"latest_version": latest_version, "checked_at": time.time()}, f)
+    except OSError:
+        pass
+    return latest_version
+
+
+def check_version(timeout: float = 2.0, background: bool = True):
+    """
+    Warn if a newer version of relevanceai is on PyPI. The latest version is
+    cached for a day and the request gives up after `timeout` seconds. Set
+    the RELEVANCEAI_CHECK_VERSION environment variable to "1" to run this
+    in the background on import.
+
+    Parameters
+    ----------
+    timeout: float
+        Seconds to wait for PyPI
+    background: bool
+        If True, check in a daemon thread and return immediately
+    """
+
+    def _check():
+        import warnings
+
+        try:
+            latest_version = _get_latest_version(timeout)
+            if latest_version is None or _parse_version(__version__) >= _parse_version(
+                latest_version
+            ):
+                return
+            from relevanceai.constants.warning import Warning
+
+            changelog_url: str = (
+                f"https://relevanceai.readthedocs.io/en/{__version__}/changelog.html"
             )
-        )
-except:
-    pass
+            warnings.warn(
+                Warning.LATEST_VERSION.format(
+                    version=__version__,
+                    latest_version=latest_version,
+                    changelog_url=changelog_url,
+                )
+            )
+        except Exception:
+            pass
+
+    if background:
+        threading.Thread(target=_check, daemon=True).start()
+    else:
+        _check()
+
+
+if os.getenv(CHECK_VERSION_ENV_VAR) == "1":
+    check_version()
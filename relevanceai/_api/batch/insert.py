@@ -838,7 +838,7 @@ class BatchInsertClient(BatchRetrieveClient):
 
         for i in range(int(self.config.get_option("retries.number_of_retries"))):
             if len(documents) > 0:
-                self.logger.info(f"Inserting with chunksize {chunksize}")
+                self.logger.info("Inserting with chunksize {}", chunksize)
                 if bulk_fn is not None:
                     insert_json = multiprocess(
                         func=bulk_fn,
@@ -0,0 +1,112 @@
+"""Coalesce single document lookups into batched requests.
+
+A lookup made while no other is in flight is sent straight away. Lookups
+that arrive while a request is in flight (for example from many threads
+calling ``Dataset.get``) are collected for a short window and sent together
+as one ``bulk_get`` request, DataLoader-style.
+"""
+import threading
+
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+
+class DocumentLoader:
+    """
+    Collects IDs requested through `load` and resolves them with a single
+    call to `batch_fn` once `wait_ms` has elapsed or `max_batch_size`
+    distinct IDs are pending. An ID requested while nothing is pending or in
+    flight is sent immediately.
+
+    Parameters
+    ----------
+    batch_fn: Callable
+        Takes a list of IDs and returns a list of documents. Documents that
+        are not returned resolve to None.
+    max_batch_size: int
+        The maximum number of distinct IDs to send in one batch
+    wait_ms: float
+        How long to wait for other lookups before sending a batch
+    single_fn: Optional[Callable]
+        If given, batches of a single ID are resolved with `single_fn(id)`
+        and its response is returned as is, e.g. the single document endpoint
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], List[Dict]],
+        max_batch_size: int = 500,
+        wait_ms: float = 5,
+        single_fn: Optional[Callable[[str], Any]] = None,
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.wait_ms = wait_ms
+        self.single_fn = single_fn
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Future]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._in_flight = 0
+
+    def load(self, id: str) -> Optional[Dict]:
+        """Return the document for an ID, blocking until its batch resolves."""
+        return self.load_async(id).result()
+
+    def load_async(self, id: str) -> Future:
+        """Queue an ID and return a future that resolves to its document."""
+        future: Future = Future()
+        batch = None
+        with self._lock:
+            idle = not self._pending and self._in_flight == 0
+            self._pending.setdefault(str(id), []).append(future)
+            if idle or len(self._pending) >= self.max_batch_size:
+                batch = self._take_batch()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.wait_ms / 1000, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if batch:
+            self._dispatch(batch)
+        return future
+
+    def flush(self):
+        """Send whatever is pending immediately."""
+        with self._lock:
+            batch = self._take_batch()
+        if batch:
+            self._dispatch(batch)
+
+    def _take_batch(self) -> Dict[str, List[Future]]:
+        # Must be called while holding the lock
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if batch:
+            self._in_flight += 1
+        return batch
+
+    def _dispatch(self, batch: Dict[str, List[Future]]):
+        try:
+            if self.single_fn is not None and len(batch) == 1:
+                results = {id: self.single_fn(id) for id in batch}
+            else:
+                documents = self.batch_fn(list(batch))
+                documents_by_id = {
+                    str(document["_id"]): document for document in documents
+                }
+                results = {id: documents_by_id.get(id) for id in batch}
+        except Exception as e:
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        for id, futures in batch.items():
+            for future in futures:
+                future.set_result(results[id])
@@ -2,20 +2,31 @@
 """Batch Retrieve"""
 
 import math
+import queue
+import threading
 import traceback
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
 
 from relevanceai._api.batch.chunk import Chunker
+from relevanceai._api.batch.loader import DocumentLoader
 from relevanceai._api.endpoints.api_client import APIEndpointsClient
 
 from relevanceai.utils.cache import lru_cache
+from relevanceai.utils.concurrency import multithread
+from relevanceai.utils.doc_utils.field_path import get_field_path
 from relevanceai.utils.progress_bar import progress_bar
 
 from relevanceai.constants.constants import MAX_CACHESIZE
 
 # ADD SUPPORT FOR SAVING TO JSON
 
+_LOADER_LOCK = threading.Lock()
+
+_DONE = object()
+
 
 class BatchRetrieveClient(APIEndpointsClient, Chunker):
     def __init__(self, *args, **kwargs):
@@ -119,10 +130,16 @@ class BatchRetrieveClient(APIEndpointsClient, Chunker):
         select_fields: Optional[List] = None,
         include_vector: bool = True,
         show_progress_bar: bool = True,
+        partition_field: Optional[str] = None,
+        number_of_partitions: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Retrieve all documents with filters. Filter is used to retrieve documents that match the conditions set in a filter query. This is used in advance search to filter the documents that are searched. For more details see documents.get_where.
 
+        If `partition_field` is given, the numeric range of that field is split
+        into partitions which are paged through concurrently. See _scan_documents.
+
         Example
         ---------
 
@@ -143,11 +160,35 @@ class BatchRetrieveClient(APIEndpointsClient, Chunker):
             Query for filtering the search results
         select_fields : list
             Fields to include in the search results, empty array/list means all fields.
+        partition_field: str
+            A numeric field to split the dataset by so that it is read concurrently
+        number_of_partitions: int
+            Number of ranges to split partition_field into. Defaults to config.scan.number_of_partitions
+        max_workers: int
+            Number of partitions to read at a time. Defaults to config.scan.max_workers
         """
         filters = [] if filters is None else filters
         sort = [] if sort is None else sort
         select_fields = [] if select_fields is None else select_fields
 
+        if partition_field is not None:
+            return [
+                document
+                for documents in self._scan_documents(
+                    dataset_id=dataset_id,
+                    chunksize=chunksize,
+                    filters=filters,
+                    sort=sort,
+                    select_fields=select_fields,
+                    include_vector=include_vector,
+                    partition_field=partition_field,
+                    number_of_partitions=number_of_partitions,
+                    max_workers=max_workers,
+                    ordered=True,
+                )
+                for document in documents
+            ]
+
         # Initialise values
         length = 1
         cursor = None
@@ -185,6 +226,324 @@ class BatchRetrieveClient(APIEndpointsClient, Chunker):
                 pass
         return full_data
 
+    def _get_field_range(
+        self, dataset_id: str, field: str, filters: Optional[List] = None
+    ) -> Optional[tuple]:
+        """The smallest and largest values of a numeric field, or None if no
+        document has it"""
+        filters = [] if filters is None else filters
+        path = get_field_path(field)
+        values = []
+        for order in ["asc", "desc"]:
+            documents = self.datasets.documents.get_where(
+                dataset_id,
+                filters=filters + [_exists_filter(field, "==")],
+                page_size=1,
+                sort=[{field: order}],
+                select_fields=[field],
+                include_vector=False,
+            )["documents"]
+            if len(documents) == 0:
+                return None
+            values.append(path.get(documents[0]))
+        return values[0], values[1]
+
+    def _get_partition_filters(
+        self,
+        dataset_id: str,
+        partition_field: str,
+        number_of_partitions: int,
+        filters: Optional[List] = None,
+    ) -> List[List[Dict]]:
+        """
+        Splits the range of a numeric field into `number_of_partitions` equal
+        ranges built with numeric filters. Documents without the field get a
+        partition of their own so that every document is in exactly one.
+        """
+        filters = [] if filters is None else filters
+        missing = [filters + [_exists_filter(partition_field, "!=")]]
+        value_range = self._get_field_range(dataset_id, partition_field, filters)
+        if value_range is None:
+            return missing
+
+        minimum, maximum = value_range
+        if minimum == maximum:
+            number_of_partitions = 1
+        width = (maximum - minimum) / number_of_partitions
+        partitions = []
+        for i in range(number_of_partitions):
+            partition = [_numeric_filter(partition_field, ">=", minimum + i * width)]
+            if i < number_of_partitions - 1:
+                partition.append(
+                    _numeric_filter(partition_field, "<", minimum + (i + 1) * width)
+                )
+            else:
+                partition.append(_numeric_filter(partition_field, "<=", maximum))
+            partitions.append(filters + partition)
+        return partitions + missing
+
+    def _page_documents(
+        self,
+        dataset_id: str,
+        chunksize: int = 1000,
+        filters: Optional[List] = None,
+        sort: Optional[List] = None,
+        select_fields: Optional[List] = None,
+        include_vector: bool = True,
+    ) -> Iterator[List[Dict]]:
+        """Pages through the documents that match the filters with after_id"""
+        after_id = None
+        while True:
+            response = self.datasets.documents.get_where(
+                dataset_id,
+                filters=filters,
+                page_size=chunksize,
+                sort=sort,
+                select_fields=select_fields,
+                include_vector=include_vector,
+                after_id=after_id,
+            )
+            documents = response["documents"]
+            if len(documents) == 0:
+                return
+            yield documents
+            after_id = response.get("after_id")
+            if not after_id or len(documents) < chunksize:
+                return
+
+    def _scan_documents(
+        self,
+        dataset_id: str,
+        chunksize: int = 1000,
+        filters: Optional[List] = None,
+        sort: Optional[List] = None,
+        select_fields: Optional[List] = None,
+        include_vector: bool = True,
+        partition_field: Optional[str] = None,
+        number_of_partitions: Optional[int] = None,
+        partitions: Optional[List[List[Dict]]] = None,
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
+    ) -> Iterator[List[Dict]]:
+        """
+        Reads a dataset in chunks, paging through several partitions of it at
+        the same time so that a full read is not bound by the round trip of a
+        single request.
+
+        Partitions are lists of filters that should not overlap, such as the
+        numeric ranges built from `partition_field`. Each one is paged through
+        on a thread pool of `max_workers` and its chunks are yielded as they
+        arrive, or partition by partition if `ordered` is True. At most a few
+        chunks per partition are held at a time.
+
+        Parameters
+        ----------
+        dataset_id: string
+            Unique name of dataset
+        chunksize: int
+            Number of documents to retrieve per request
+        filters: list
+            Query for filtering the documents
+        partition_field: str
+            A numeric field whose range is split into partitions
+        number_of_partitions: int
+            Number of ranges to split partition_field into. Defaults to config.scan.number_of_partitions
+        partitions: list
+            Lists of filters to use as partitions instead of partition_field
+        max_workers: int
+            Number of partitions to read at a time. Defaults to config.scan.max_workers
+        ordered: bool
+            If True, every chunk of a partition is yielded before the next one
+        """
+        filters = [] if filters is None else filters
+        sort = [] if sort is None else sort
+        select_fields = [] if select_fields is None else select_fields
+        if max_workers is None:
+            max_workers = int(self.config.get_option("scan.max_workers"))
+        if number_of_partitions is None:
+            number_of_partitions = int(
+                self.config.get_option("scan.number_of_partitions")
+            )
+
+        if partitions is None:
+            if partition_field is None:
+                partitions = [filters]
+            else:
+                partitions = self._get_partition_filters(
+                    dataset_id, partition_field, number_of_partitions, filters
+                )
+        else:
+            partitions = [filters + partition for partition in partitions]
+
+        page = partial(
+            self._page_documents,
+            dataset_id,
+            chunksize=chunksize,
+            sort=sort,
+            select_fields=select_fields,
+            include_vector=include_vector,
+        )
+        if len(partitions) == 1:
+            yield from page(filters=partitions[0])
+            return
+
+        stop = threading.Event()
+        shared_queue: queue.Queue = queue.Queue(maxsize=2 * max_workers)
+        queues = [
+            queue.Queue(maxsize=2) if ordered else shared_queue for _ in partitions
+        ]
+
+        def put(q: queue.Queue, item: Any):
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_partition(i: int, partition: List[Dict]):
+            if stop.is_set():
+                return
+            try:
+                for documents in page(filters=partition):
+                    if stop.is_set():
+                        break
+                    put(queues[i], documents)
+            except BaseException as e:
+                put(queues[i], e)
+            finally:
+                put(queues[i], _DONE)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            for i, partition in enumerate(partitions):
+                executor.submit(read_partition, i, partition)
+            if ordered:
+                streams = [(q, 1) for q in queues]
+            else:
+                streams = [(shared_queue, len(partitions))]
+            for q, remaining in streams:
+                while remaining > 0:
+                    item = q.get()
+                    if item is _DONE:
+                        remaining -= 1
+                    elif isinstance(item, BaseException):
+                        raise item
+                    else:
+                        yield item
+        finally:
+            stop.set()
+            executor.shutdown(wait=True)
+
+    def _bulk_get_documents(
+        self,
+        dataset_id: str,
+        ids: List,
+        include_vector: bool = True,
+        select_fields: Optional[List] = None,
+        chunksize: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        return_response: bool = False,
+    ) -> Any:
+        """
+        Retrieve documents by their IDs. IDs are de-duplicated and split into
+        batches of at most `chunksize` which are fetched concurrently.
+        Documents are returned in the order their IDs were first given and
+        IDs that do not exist are left out.
+
+        With `return_response`, the bulk_get response is returned instead.
+        If the IDs needed more than one request, it is the first response
+        with its documents replaced by those of every request.
+
+        Parameters
+        ----------
+        dataset_id: string
+            Unique name of dataset
+        ids: list
+            IDs of documents in the dataset.
+        include_vector: bool
+            Include vectors in the search results
+        select_fields: list
+            Fields to include in the search results, empty array/list means all fields.
+        chunksize: int
+            Maximum number of IDs per request. Defaults to config.lookup.max_ids_per_request
+        max_workers: int
+            Number of requests to send concurrently. Defaults to config.lookup.max_workers
+        return_response: bool
+            Return the bulk_get response rather than the list of documents
+        """
+        select_fields = [] if select_fields is None else select_fields
+        if chunksize is None:
+            chunksize = int(self.config.get_option("lookup.max_ids_per_request"))
+        if max_workers is None:
+            max_workers = int(self.config.get_option("lookup.max_workers"))
+
+        unique_ids = list(dict.fromkeys(str(i) for i in ids))
+        if len(unique_ids) == 0:
+            return {"documents": []} if return_response else []
+
+        def bulk_get(batch):
+            return self.datasets.documents.bulk_get(
+                dataset_id,
+                ids=batch,
+                include_vector=include_vector,
+                select_fields=select_fields,
+            )
+
+        if len(unique_ids) <= chunksize:
+            responses = [bulk_get(unique_ids)]
+            if return_response:
+                return responses[0]
+        else:
+            responses = multithread(
+                bulk_get,
+                unique_ids,
+                max_workers=max_workers,
+                chunksize=chunksize,
+            )
+
+        documents = {
+            str(document["_id"]): document
+            for response in responses
+            for document in _get_response_documents(response)
+        }
+        ordered_documents = [documents[i] for i in unique_ids if i in documents]
+        if return_response and isinstance(responses[0], dict):
+            return {**responses[0], "documents": ordered_documents}
+        return ordered_documents
+
+    def _get_document_loader(
+        self,
+        dataset_id: str,
+        include_vector: bool = True,
+    ) -> DocumentLoader:
+        """
+        Returns the loader that coalesces single ID lookups for a dataset into
+        shared bulk_get requests.
+        """
+        key = (dataset_id, include_vector)
+        with _LOADER_LOCK:
+            if not hasattr(self, "_document_loaders"):
+                self._document_loaders: Dict[tuple, DocumentLoader] = {}
+            if key not in self._document_loaders:
+                self._document_loaders[key] = DocumentLoader(
+                    partial(
+                        self._bulk_get_documents,
+                        dataset_id,
+                        include_vector=include_vector,
+                    ),
+                    max_batch_size=int(
+                        self.config.get_option("lookup.max_ids_per_request")
+                    ),
+                    wait_ms=float(self.config.get_option("lookup.coalesce_wait_ms")),
+                    single_fn=partial(
+                        self.datasets.documents.get,
+                        dataset_id,
+                        include_vector=include_vector,
+                    ),
+                )
+            return self._document_loaders[key]
+
     def get_number_of_documents(self, dataset_id, filters: Optional[List] = None):
         """
         Get number of documents in a dataset. Filter can be used to select documents that match the conditions set in a filter query. For more details see documents.get_where.
@@ -201,3 +560,27 @@ class BatchRetrieveClient(APIEndpointsClient, Chunker):
         return self.datasets.documents.get_where(
             dataset_id, page_size=1, filters=filters
         )["count"]
+
+
+def _get_response_documents(response: Any) -> List[Dict]:
+    if isinstance(response, dict):
+        return response.get("documents", [])
+    return response
+
+
+def _exists_filter(field: str, condition: str) -> Dict:
+    return {
+        "field": field,
+        "filter_type": "exists",
+        "condition": condition,
+        "condition_value": " ",
+    }
+
+
+def _numeric_filter(field: str, condition: str, value: Any) -> Dict:
+    return {
+        "field": field,
+        "filter_type": "numeric",
+        "condition": condition,
+        "condition_value": value,
+    }
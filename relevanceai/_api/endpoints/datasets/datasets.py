@@ -1,9 +1,11 @@
 """All Dataset related functions
 """
+from functools import partial
 from typing import List, Optional
 
 from relevanceai.client.helpers import Credentials
 from relevanceai.utils.base import _Base
+from relevanceai.utils.concurrency import multithread
 from relevanceai._api.endpoints.datasets.documents import DocumentsClient
 from relevanceai._api.endpoints.datasets.monitor import MonitorClient
 from relevanceai._api.endpoints.datasets.tasks import TasksClient
@@ -239,16 +241,31 @@ class DatasetsClient(_Base):
         dataset_exists = dataset_id in self.list()["datasets"]
 
         if dataset_exists:
-            return self.make_http_request(
-                endpoint=f"/datasets/{dataset_id}/documents/get_missing",
-                method="GET",
-                parameters={"ids": ids},
+            # IDs are sent as query parameters so keep each request small
+            chunksize = int(self.config.get_option("lookup.max_ids_per_missing_check"))
+            unique_ids = list(dict.fromkeys(ids))
+            if len(unique_ids) <= chunksize:
+                return self._get_missing_ids(dataset_id, unique_ids)
+
+            results = multithread(
+                partial(self._get_missing_ids, dataset_id),
+                unique_ids,
+                max_workers=int(self.config.get_option("lookup.max_workers")),
+                chunksize=chunksize,
             )
+            return [i for missing_ids in results for i in missing_ids]
 
         else:
             print("Dataset does not exist")
             return
 
+    def _get_missing_ids(self, dataset_id: str, ids: list):
+        return self.make_http_request(
+            endpoint=f"/datasets/{dataset_id}/documents/get_missing",
+            method="GET",
+            parameters={"ids": ids},
+        )
+
     def insert(
         self,
         dataset_id: str,
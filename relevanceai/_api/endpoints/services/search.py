@@ -1,7 +1,41 @@
-from typing import List, Optional
+import hashlib
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import orjson
 
 from relevanceai.client.helpers import Credentials
 from relevanceai.utils.base import _Base
+from relevanceai.utils.cache import TTLCache
+from relevanceai.utils.transport import get_host_semaphore
+
+BULK_SEARCH_MODES = [
+    "vector",
+    "hybrid",
+    "semantic",
+    "diversity",
+    "traditional",
+    "chunk",
+    "multistep_chunk",
+    "advanced_chunk",
+    "advanced_multistep_chunk",
+]
+
+
+def _hash_query(payload: Dict[str, Any]) -> str:
+    """A hash of the canonical JSON of a query, the same for equal queries"""
+    return hashlib.sha256(
+        orjson.dumps(
+            payload,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        )
+    ).hexdigest()
 
 
 class SearchClient(_Base):
@@ -1052,6 +1086,156 @@ class SearchClient(_Base):
             },
         )
 
+    _bulk_search_cache: Optional[TTLCache] = None
+    _bulk_search_cache_lock = threading.Lock()
+
+    def bulk_search(
+        self,
+        queries: List[Dict[str, Any]],
+        mode: str = "vector",
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        return_stats: bool = False,
+    ):
+        """
+        Run many searches concurrently. Each query is a dictionary of the
+        parameters of the search method named by `mode`.
+
+        Identical queries are only sent once, and results are kept in a cache
+        shared by every client for `search.cache_ttl` seconds, so repeating a
+        query does not repeat the request. Requests are sent from a pool of
+        `max_workers` threads, and at most `search.max_connections_per_host`
+        requests are in flight to a host at a time.
+
+        Example
+        ---------
+
+        .. code-block::
+
+            from relevanceai import Client
+            client = Client()
+            queries = [
+                {
+                    "dataset_id": "sample",
+                    "multivector_query": [{"vector": v, "fields": ["text_vector_"]}],
+                }
+                for v in query_vectors
+            ]
+            results, stats = client.services.search.bulk_search(
+                queries, mode="vector", return_stats=True
+            )
+            stats["latency_p90"], stats["cache_hit_rate"]
+
+        Parameters
+        ----------
+        queries: list
+            The parameters of every search
+        mode: str
+            One of vector, hybrid, semantic, diversity, traditional, chunk,
+            multistep_chunk, advanced_chunk or advanced_multistep_chunk
+        max_workers: int
+            The number of searches to run at a time. Defaults to config.search.max_workers
+        use_cache: bool
+            If False, every unique query is sent and nothing is cached
+        return_stats: bool
+            If True, also return the number of requests, cache hits, failed
+            queries and the latency percentiles of the requests in seconds
+
+        Returns
+        -------
+        The result of every query, in order. Identical queries share the
+        same result object, so copy a result before changing it. A query
+        that fails has the failed response or the error it raised in place
+        of its result, and is not cached.
+        """
+        if mode not in BULK_SEARCH_MODES:
+            raise ValueError(f"mode must be one of {BULK_SEARCH_MODES}")
+        search = getattr(self, mode)
+        if max_workers is None:
+            max_workers = int(self.config.get_option("search.max_workers"))
+        semaphore = get_host_semaphore(
+            self.base_url,  # type: ignore
+            int(self.config.get_option("search.max_connections_per_host")),
+        )
+
+        start_time = time.perf_counter()
+        keys = [
+            _hash_query(
+                {
+                    "base_url": self.base_url,  # type: ignore
+                    "project": self.project,
+                    "mode": mode,
+                    "query": query,
+                }
+            )
+            for query in queries
+        ]
+        unique_queries = dict(zip(keys, queries))
+
+        if use_cache:
+            cache = self._get_bulk_search_cache()
+            results, missing = cache.get_many(list(unique_queries))
+        else:
+            results, missing = {}, list(unique_queries)
+
+        def run(key: str):
+            with semaphore:
+                request_start = time.perf_counter()
+                try:
+                    result = search(**unique_queries[key])
+                except Exception as e:
+                    result = e
+                return result, time.perf_counter() - request_start
+
+        latencies = []
+        failed = set()
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for key, (result, latency) in zip(missing, executor.map(run, missing)):
+                    results[key] = result
+                    latencies.append(latency)
+                    # Requests that fail every retry return the response
+                    if not isinstance(result, dict):
+                        failed.add(key)
+            if use_cache:
+                cache.set_many(
+                    (key, results[key]) for key in missing if key not in failed
+                )
+            if failed:
+                self.logger.warning(f"{len(failed)} of {len(missing)} searches failed.")
+
+        ordered_results = [results[key] for key in keys]
+        if not return_stats:
+            return ordered_results
+
+        number_of_cache_hits = len(unique_queries) - len(missing)
+        stats: Dict[str, Any] = {
+            "number_of_queries": len(queries),
+            "number_of_unique_queries": len(unique_queries),
+            "number_of_requests": len(missing),
+            "number_of_cache_hits": number_of_cache_hits,
+            "failed_queries": [i for i, key in enumerate(keys) if key in failed],
+            "cache_hit_rate": number_of_cache_hits / len(unique_queries)
+            if unique_queries
+            else 0.0,
+            "total_time": time.perf_counter() - start_time,
+        }
+        for percentile in [50, 90, 99]:
+            stats[f"latency_p{percentile}"] = (
+                float(np.percentile(latencies, percentile)) if latencies else None
+            )
+        return ordered_results, stats
+
+    def _get_bulk_search_cache(self) -> TTLCache:
+        # Shared by every client, its size and ttl are set by the first one
+        with SearchClient._bulk_search_cache_lock:
+            if SearchClient._bulk_search_cache is None:
+                SearchClient._bulk_search_cache = TTLCache(
+                    maxsize=int(self.config.get_option("search.cache_size")),
+                    ttl=float(self.config.get_option("search.cache_ttl")),
+                )
+            return SearchClient._bulk_search_cache
+
     def _init_experiment_helper(self, categories: Optional[List[str]] = None):
         categories = (
             ["chunk", "vector", "diversity", "traditional"]
@@ -1,2 +1,16 @@
-from relevanceai.client.client import Client
+from typing import TYPE_CHECKING
+
 from relevanceai.client.helpers import Credentials
+
+if TYPE_CHECKING:
+    from relevanceai.client.client import Client
+
+
+def __getattr__(name):
+    # Client is imported on first use, so that modules the client depends on
+    # can import relevanceai.client.helpers without importing the client
+    if name == "Client":
+        from relevanceai.client.client import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,3 +3,4 @@ from relevanceai.constants.warning import *
 from relevanceai.constants.errors import *
 from relevanceai.constants.messages import Messages
 from relevanceai.constants.stopwords import *
+from relevanceai.constants.labels import *
@@ -1,6 +1,8 @@
 """Configuration Settings"""
 import configparser
 
+from typing import Callable, Dict, List
+
 from doc_utils.doc_utils import DocUtils
 
 
@@ -21,6 +23,12 @@ class Config(DocUtils):
     - Upload - Set the behaviour of uploads to RelevanceAI
         - target_chunk_mb - Maximum upload size per request
 
+    - Lookup - Set the behaviour of document lookups by ID
+        - max_ids_per_request - Maximum number of IDs sent in one bulk_get request
+        - max_ids_per_missing_check - Maximum number of IDs sent in one get_missing request
+        - max_workers - Number of lookup requests sent concurrently
+        - coalesce_wait_ms - How long single ID lookups wait to be batched together
+
     - API - Set the behaviour of API requests
         - base_url - The base url to access
         - output_format - The format of API responses
@@ -29,6 +37,9 @@ class Config(DocUtils):
 
     """
 
+    # Called with the new value whenever these options are set on any config
+    _option_listeners: Dict[str, List[Callable]] = {}
+
     def __init__(self, config_path):
         self.config_path = config_path
         self.config = configparser.ConfigParser()
@@ -74,10 +85,31 @@ class Config(DocUtils):
             New setting
         """
         self.set_field(option, self.config, str(value))
+        for listener in self._option_listeners.get(option, []):
+            listener(str(value))
+
+    @classmethod
+    def add_option_listener(cls, option: str, listener: Callable):
+        """
+        Call a function with the new value of an option whenever it is set,
+        so that hot paths can cache options instead of reading them
+
+        Parameters
+        ----------
+        option : string
+            Setting key
+        listener : Callable
+            Function to call with the new setting
+        """
+        cls._option_listeners.setdefault(option, []).append(listener)
 
     def reset_to_default(self):
         """Reset config to default"""
         self._read_config(self.config_path)
+        for option, listeners in self._option_listeners.items():
+            if self.is_field(option, self.config):
+                for listener in listeners:
+                    listener(self.get_option(option))
 
     reset = reset_to_default
 
@@ -0,0 +1,36 @@
+"""
+    Labels of the TweetEval tasks, in the order the cardiffnlp models output
+    them, so that they do not have to be downloaded.
+"""
+
+# From https://github.com/cardiffnlp/tweeteval/tree/main/datasets/{task}/mapping.txt
+TWEETEVAL_LABELS = {
+    "emoji": [
+        "❤",
+        "😍",
+        "😂",
+        "💕",
+        "🔥",
+        "😊",
+        "😎",
+        "✨",
+        "💙",
+        "😘",
+        "📷",
+        "🇺🇸",
+        "☀",
+        "💜",
+        "😉",
+        "💯",
+        "😁",
+        "🎄",
+        "📸",
+        "😜",
+    ],
+    "emotion": ["anger", "joy", "optimism", "sadness"],
+    "hate": ["not-hate", "hate"],
+    "irony": ["non_irony", "irony"],
+    "offensive": ["not-offensive", "offensive"],
+    "sentiment": ["negative", "neutral", "positive"],
+    "stance": ["none", "against", "favor"],
+}
@@ -1 +1,14 @@
-from relevanceai.dataset.dataset import Dataset
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from relevanceai.dataset.dataset import Dataset
+
+
+def __getattr__(name):
+    # Dataset is imported on first use, as importing it here would import the
+    # operations before the dataset submodules they depend on
+    if name == "Dataset":
+        from relevanceai.dataset.dataset import Dataset
+
+        return Dataset
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -45,7 +45,7 @@ class Dataset(OperationsNew, Operations, LaunchApps):
             # avoid re-inserting if it already exists
             if self.shape[0] == 0:
                 from relevanceai.utils.datasets import mock_documents
-                from relevanceai.utils.decorators.analytics import fire_and_forget
+                from relevanceai.utils.decorators.thread import fire_and_forget
 
                 @fire_and_forget
                 def add_mock_dataset():
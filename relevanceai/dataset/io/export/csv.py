@@ -1,21 +1,44 @@
-import pandas as pd
+import csv
 
-from relevanceai.dataset.read import Read
+from typing import List, Optional
+
+from relevanceai.dataset.io.export.streaming import StreamingExport, flatten_documents
 from relevanceai.utils.decorators.analytics import track
 
 
-class CSVExport(Read):
+class CSVExport(StreamingExport):
     @track
-    def to_csv(self, filename: str, **kwargs):
+    def to_csv(
+        self,
+        filename: str,
+        chunksize: int = 1000,
+        select_fields: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        include_vector: bool = True,
+        **kwargs,
+    ):
         """
-        Download a dataset from Relevance AI to a local .csv file
+        Download a dataset from Relevance AI to a local .csv file.
+        Documents are written one chunk at a time so that the whole dataset
+        is never held in memory. Nested fields are written to their own
+        dotted columns and dicts or lists are written as JSON.
 
         Parameters
         ----------
         filename: str
             path to downloaded .csv file
+        chunksize: int
+            Number of documents to retrieve and write at a time
+        select_fields: list
+            Fields to export. Defaults to every field in the schema.
+        filters: list
+            Query for filtering the exported documents
+        include_vector: bool
+            If False, vector fields are left out
         kwargs: Optional
-            see client.get_all_documents() for extra args
+            partition_field, number_of_partitions and max_workers are passed
+            on to chunk_dataset. Other get_all_documents arguments are ignored
+            with a DeprecationWarning.
 
         Example
         -------
@@ -29,8 +52,18 @@ class CSVExport(Read):
             df = client.Dataset(dataset_id)
 
             csv_fname = "path/to/csv/file.csv"
-            df.to_csv(csv_fname)
+            df.to_csv(csv_fname, include_vector=False)
         """
-        documents = self.get_all_documents(**kwargs)
-        df = pd.DataFrame(documents)
-        df.to_csv(filename)
+        columns, chunks = self._iterate_export(
+            chunksize=chunksize,
+            select_fields=select_fields,
+            filters=filters,
+            include_vector=include_vector,
+            **kwargs,
+        )
+        assert columns is not None
+        with open(filename, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            for chunk in chunks:
+                writer.writerows(flatten_documents(chunk, columns))
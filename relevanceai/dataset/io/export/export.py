@@ -4,10 +4,12 @@ from relevanceai.utils.decorators.analytics import track
 from relevanceai.utils.decorators.version import added
 from relevanceai.dataset.io.export.csv import CSVExport
 from relevanceai.dataset.io.export.dict import DictExport
+from relevanceai.dataset.io.export.jsonl import JSONLExport
 from relevanceai.dataset.io.export.pandas import PandasExport
+from relevanceai.dataset.io.export.parquet import ParquetExport
 
 
-class Export(CSVExport, DictExport, PandasExport):
+class Export(CSVExport, JSONLExport, ParquetExport, DictExport, PandasExport):
     """Exports"""
 
     @track
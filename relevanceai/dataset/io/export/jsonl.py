@@ -0,0 +1,67 @@
+import orjson
+
+from typing import List, Optional
+
+from relevanceai.dataset.io.export.streaming import StreamingExport
+from relevanceai.utils.decorators.analytics import track
+from relevanceai.utils.decorators.version import added
+
+
+class JSONLExport(StreamingExport):
+    @track
+    @added(version="2.6.6")
+    def to_jsonl(
+        self,
+        filename: str,
+        chunksize: int = 1000,
+        select_fields: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        include_vector: bool = True,
+    ):
+        """
+        Download a dataset from Relevance AI to a local .jsonl file with one
+        document per line. Documents keep their nesting and are written one
+        chunk at a time so that the whole dataset is never held in memory.
+
+        Parameters
+        ----------
+        filename: str
+            path to downloaded .jsonl file
+        chunksize: int
+            Number of documents to retrieve and write at a time
+        select_fields: list
+            Fields to export. Defaults to every field.
+        filters: list
+            Query for filtering the exported documents
+        include_vector: bool
+            If False, vector fields are left out
+
+        Example
+        -------
+        .. code-block::
+
+            from relevanceai import Client
+
+            client = Client()
+
+            dataset_id = "sample_dataset_id"
+            df = client.Dataset(dataset_id)
+
+            df.to_jsonl("path/to/file.jsonl")
+        """
+        _, chunks = self._iterate_export(
+            chunksize=chunksize,
+            select_fields=select_fields,
+            filters=filters,
+            include_vector=include_vector,
+            flatten=False,
+        )
+        with open(filename, "wb") as f:
+            for chunk in chunks:
+                f.writelines(
+                    orjson.dumps(
+                        d,
+                        option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                    for d in chunk
+                )
@@ -0,0 +1,117 @@
+from typing import Any, Dict, List, Optional
+
+from relevanceai.dataset.io.export.streaming import (
+    StreamingExport,
+    flatten_documents,
+    to_json_string,
+)
+from relevanceai.utils.decorators.analytics import track
+from relevanceai.utils.decorators.version import added
+
+
+def _get_arrow_schema(columns: List[str], schema: Dict[str, Any]):
+    """Arrow types from the dataset schema. Vectors are lists of floats and
+    dicts, chunks and anything else are stored as JSON strings."""
+    import pyarrow as pa
+
+    fields = []
+    for column in columns:
+        field_type = schema.get(column, "text")
+        if column == "_id":
+            arrow_type = pa.string()
+        elif isinstance(field_type, dict):
+            arrow_type = pa.list_(pa.float64())
+        elif field_type == "numeric":
+            arrow_type = pa.float64()
+        elif field_type == "bool":
+            arrow_type = pa.bool_()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column, arrow_type))
+    return pa.schema(fields)
+
+
+def _to_arrow_value(value: Any, arrow_type) -> Any:
+    import pyarrow as pa
+
+    if value is None or not pa.types.is_string(arrow_type) or isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        return to_json_string(value)
+    return str(value)
+
+
+class ParquetExport(StreamingExport):
+    @track
+    @added(version="2.6.6")
+    def to_parquet(
+        self,
+        filename: str,
+        chunksize: int = 1000,
+        select_fields: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        include_vector: bool = True,
+    ):
+        """
+        Download a dataset from Relevance AI to a local .parquet file. Each
+        chunk of documents is written as a row group so that the whole
+        dataset is never held in memory. Nested fields are written to their
+        own dotted columns with types from the dataset schema.
+
+        Parameters
+        ----------
+        filename: str
+            path to downloaded .parquet file
+        chunksize: int
+            Number of documents to retrieve and write per row group
+        select_fields: list
+            Fields to export. Defaults to every field in the schema.
+        filters: list
+            Query for filtering the exported documents
+        include_vector: bool
+            If False, vector fields are left out
+
+        Example
+        -------
+        .. code-block::
+
+            from relevanceai import Client
+
+            client = Client()
+
+            dataset_id = "sample_dataset_id"
+            df = client.Dataset(dataset_id)
+
+            df.to_parquet("path/to/file.parquet", include_vector=False)
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                f"{e}\nInstall pyarrow\n \
+                pip install -U relevanceai[parquet]"
+            )
+
+        schema = self.schema
+        columns, chunks = self._iterate_export(
+            chunksize=chunksize,
+            select_fields=select_fields,
+            filters=filters,
+            include_vector=include_vector,
+            schema=schema,
+        )
+        assert columns is not None
+        arrow_schema = _get_arrow_schema(columns, schema)
+        types = [f.type for f in arrow_schema]
+        with pq.ParquetWriter(filename, arrow_schema) as writer:
+            for chunk in chunks:
+                rows = flatten_documents(chunk, columns, encode_json=False)
+                arrays = [
+                    pa.array(
+                        [_to_arrow_value(row[i], types[i]) for row in rows],
+                        type=types[i],
+                    )
+                    for i in range(len(columns))
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=arrow_schema))
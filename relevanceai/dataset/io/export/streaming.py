@@ -0,0 +1,130 @@
+"""
+Helpers for exports that write a dataset one chunk at a time, so that memory
+use does not grow with the size of the dataset.
+"""
+import warnings
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+from relevanceai.dataset.read import Read
+from relevanceai.utils.doc_utils.field_path import get_field_path
+
+
+# get_all_documents arguments that chunk_dataset also accepts
+CHUNK_DATASET_ARGS = ("partition_field", "number_of_partitions", "max_workers")
+
+
+def is_vector_field(field: str, field_type: Any = None) -> bool:
+    """Vector fields end in _vector_/_chunkvector_ and have dict types in the schema"""
+    return (
+        field.endswith("_vector_")
+        or field.endswith("_chunkvector_")
+        or isinstance(field_type, dict)
+    )
+
+
+def get_export_columns(
+    schema: Dict[str, Any],
+    select_fields: Optional[List[str]] = None,
+    include_vector: bool = True,
+) -> List[str]:
+    """
+    The columns of an export, in a stable order that does not depend on the
+    documents. Nested fields get their own dotted columns, parent dicts are
+    left out and fields inside chunks are kept in their chunk field.
+
+    Parameters
+    ----------
+    schema: dict
+        The dataset schema
+    select_fields: list
+        The fields to export. Defaults to every field in the schema.
+    include_vector: bool
+        If False, vector fields are left out
+    """
+    fields = sorted(schema) if not select_fields else list(select_fields)
+    chunk_fields = [f + "." for f, t in schema.items() if t == "chunks"]
+    fields = [f for f in fields if not any(f.startswith(c) for c in chunk_fields)]
+    parents = set()
+    for field in fields:
+        parts = field.split(".")
+        for i in range(1, len(parts)):
+            parents.add(".".join(parts[:i]))
+
+    columns = ["_id"]
+    for field in fields:
+        if field == "_id" or field in parents:
+            continue
+        if not include_vector and is_vector_field(field, schema.get(field)):
+            continue
+        columns.append(field)
+    return columns
+
+
+def to_json_string(value: Any) -> Any:
+    """Encode dicts and lists as JSON so that they fit in a single cell"""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode("utf-8")
+    return value
+
+
+def flatten_documents(
+    documents: List[Dict], columns: List[str], encode_json: bool = True
+) -> List[List[Any]]:
+    """The row of each document, with one value (or None) per column"""
+    paths = [get_field_path(c) for c in columns]
+    if not encode_json:
+        return [
+            [path.get(d, missing_treatment="return_none") for path in paths]
+            for d in documents
+        ]
+    return [
+        [to_json_string(path.get(d, missing_treatment="return_none")) for path in paths]
+        for d in documents
+    ]
+
+
+class StreamingExport(Read):
+    def _iterate_export(
+        self,
+        chunksize: int = 1000,
+        select_fields: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        include_vector: bool = True,
+        flatten: bool = True,
+        schema: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Tuple[Optional[List[str]], Iterator[List[Dict]]]:
+        """
+        The export columns and an iterator over chunks of documents. Columns
+        are only worked out from the schema if the documents are to be
+        flattened or some fields are left out. Other get_all_documents
+        arguments are passed on to chunk_dataset where it supports them.
+        """
+        chunk_kwargs = {}
+        for key, value in kwargs.items():
+            if key in CHUNK_DATASET_ARGS:
+                chunk_kwargs[key] = value
+            else:
+                warnings.warn(
+                    f"{key} is no longer supported when exporting and is ignored",
+                    DeprecationWarning,
+                )
+
+        columns = None
+        if flatten or select_fields or not include_vector:
+            columns = get_export_columns(
+                self.schema if schema is None else schema,
+                select_fields=select_fields,
+                include_vector=include_vector,
+            )
+        chunks = self.chunk_dataset(
+            select_fields=columns,
+            chunksize=chunksize,
+            filters=filters,
+            include_vector=include_vector,
+            **chunk_kwargs,
+        )
+        return columns, chunks
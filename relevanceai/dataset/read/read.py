@@ -361,6 +361,9 @@ class Read(ClusterRead):
         select_fields: Optional[List] = None,
         include_vector: bool = True,
         show_progress_bar: bool = True,
+        partition_field: Optional[str] = None,
+        number_of_partitions: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Retrieve all documents with filters. Filter is used to retrieve documents that match the conditions set in a filter query. This is used in advance search to filter the documents that are searched. For more details see documents.get_where.
@@ -377,6 +380,12 @@ class Read(ClusterRead):
             Query for filtering the search results
         select_fields : list
             Fields to include in the search results, empty array/list means all fields.
+        partition_field: str
+            A numeric field to split the dataset by so that it is read concurrently
+        number_of_partitions: int
+            Number of ranges to split partition_field into
+        max_workers: int
+            Number of ranges to read at a time
 
         Example
         ----------
@@ -389,6 +398,9 @@ class Read(ClusterRead):
             df = client.Dataset(dataset_id)
             documents = df.get_all_documents()
 
+            # Read 8 ranges of a numeric field at the same time
+            documents = df.get_all_documents(partition_field="price", max_workers=8)
+
         """
         filters = [] if filters is None else filters
         sort = [] if sort is None else sort
@@ -402,14 +414,42 @@ class Read(ClusterRead):
             select_fields=select_fields,
             include_vector=include_vector,
             show_progress_bar=show_progress_bar,
+            partition_field=partition_field,
+            number_of_partitions=number_of_partitions,
+            max_workers=max_workers,
         )
 
+    def _get_by_ids(self, document_ids: Union[List, str], include_vector: bool = True):
+        if isinstance(document_ids, str):
+            # Single lookups from concurrent callers are coalesced into
+            # shared bulk_get requests. A lookup with nothing else in flight
+            # goes straight to the single document endpoint.
+            document = self._get_document_loader(
+                self.dataset_id, include_vector=include_vector
+            ).load(document_ids)
+            if document is not None:
+                return document
+            # An ID missing from a coalesced batch is looked up on its own so
+            # that missing IDs surface the same way they always have
+            return self.datasets.documents.get(
+                self.dataset_id, id=document_ids, include_vector=include_vector
+            )
+        elif isinstance(document_ids, list):
+            return self._bulk_get_documents(
+                self.dataset_id,
+                ids=document_ids,
+                include_vector=include_vector,
+                return_response=True,
+            )
+        raise TypeError("Document IDs needs to be a string or a list")
+
     @track
     def get_documents_by_ids(
         self, document_ids: Union[List, str], include_vector: bool = True
     ):
         """
         Retrieve a document by its ID ("_id" field). This will retrieve the document faster than a filter applied on the "_id" field.
+        Lists of IDs are de-duplicated and fetched in concurrent batches, with documents returned in the order the IDs were given.
 
         Parameters
         ----------
@@ -429,15 +469,7 @@ class Read(ClusterRead):
             df = client.Dataset(dataset_id)
             df.get_documents_by_ids(["sample_id"], include_vector=False)
         """
-        if isinstance(document_ids, str):
-            return self.datasets.documents.get(
-                self.dataset_id, id=document_ids, include_vector=include_vector
-            )
-        elif isinstance(document_ids, list):
-            return self.datasets.documents.bulk_get(
-                self.dataset_id, ids=document_ids, include_vector=include_vector
-            )
-        raise TypeError("Document IDs needs to be a string or a list")
+        return self._get_by_ids(document_ids, include_vector=include_vector)
 
     @track
     def get(self, document_ids: Union[List, str], include_vector: bool = True):
@@ -463,15 +495,7 @@ class Read(ClusterRead):
             df = client.Dataset(dataset_id)
             df.get(["sample_id"], include_vector=False)
         """
-        if isinstance(document_ids, str):
-            return self.datasets.documents.get(
-                self.dataset_id, id=document_ids, include_vector=include_vector
-            )
-        elif isinstance(document_ids, list):
-            return self.datasets.documents.bulk_get(
-                self.dataset_id, ids=document_ids, include_vector=include_vector
-            )
-        raise TypeError("Document IDs needs to be a string or a list")
+        return self._get_by_ids(document_ids, include_vector=include_vector)
 
     @property  # type: ignore
     @track
@@ -705,11 +729,23 @@ class Read(ClusterRead):
 
     @track
     def chunk_dataset(
-        self, select_fields: List = None, chunksize: int = 100, filters: list = None
+        self,
+        select_fields: List = None,
+        chunksize: int = 100,
+        filters: list = None,
+        include_vector: bool = True,
+        partition_field: Optional[str] = None,
+        number_of_partitions: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        ordered: bool = False,
     ):
         """
 
-        Function for chunking a dataset
+        Function for chunking a dataset. If `partition_field` is given, the
+        numeric range of that field is split into `number_of_partitions`
+        ranges which are paged through concurrently by `max_workers` threads.
+        Chunks are then yielded as they arrive, or range by range if `ordered`
+        is True.
 
         Example
         ----------
@@ -730,16 +766,44 @@ class Read(ClusterRead):
                     d.update({"value": 3})
                 ds.upsert_documents(docs)
 
+            # Read 8 ranges of a numeric field at the same time
+            for docs in ds.chunk_dataset(
+                partition_field="price",
+                number_of_partitions=8,
+                chunksize=100
+            ):
+                ...
+
         """
+        number_of_documents = self.get_number_of_documents(
+            self.dataset_id, filters=filters
+        )
+        if partition_field is not None:
+            chunks = self._scan_documents(
+                dataset_id=self.dataset_id,
+                chunksize=chunksize,
+                filters=filters,
+                select_fields=select_fields,
+                include_vector=include_vector,
+                partition_field=partition_field,
+                number_of_partitions=number_of_partitions,
+                max_workers=max_workers,
+                ordered=ordered,
+            )
+            with tqdm(total=math.ceil(number_of_documents / chunksize)) as pbar:
+                for documents in chunks:
+                    yield documents
+                    pbar.update(1)
+                    self._update_workflow_progress(metadata=pbar.format_dict)
+            return
+
         docs = self.get_documents(
             number_of_documents=chunksize,
             filters=filters,
             select_fields=select_fields,
+            include_vector=include_vector,
             include_after_id=True,
         )
-        number_of_documents = self.get_number_of_documents(
-            self.dataset_id, filters=filters
-        )
         with tqdm(range(math.ceil(number_of_documents / chunksize))) as pbar:
             # update after we get the first batch
             pbar.update(1)
@@ -758,6 +822,7 @@ class Read(ClusterRead):
                     after_id=docs["after_id"],
                     filters=filters,
                     select_fields=select_fields,
+                    include_vector=include_vector,
                 )
                 # Final update at the end
                 pbar.update(1)
@@ -7,7 +7,9 @@ import pandas as pd
 from typing import Optional, Union
 
 from relevanceai.client.helpers import Credentials
+from relevanceai.constants.constants import MAX_CACHESIZE
 from relevanceai.dataset.series import Series
+from relevanceai.utils.cache import lru_cache
 from relevanceai.utils.decorators.version import added
 from relevanceai.utils.decorators.analytics import track
 from relevanceai._api import APIClient
@@ -96,6 +98,34 @@ class Statistics(APIClient):
         else:
             raise ValueError("invalid return_type, should be `dict` or `pandas`")
 
+    @lru_cache(maxsize=MAX_CACHESIZE)
+    def _get_correlation_aggregate(
+        self,
+        X: str,
+        Y: str,
+        vector_field: str,
+        alias: str,
+        groupby: Optional[str] = None,
+    ) -> dict:
+        """
+        Per-cluster (and per-category if `groupby` is set) correlations
+        between two fields. The result is cached so that plotting the same
+        correlations again does not repeat the aggregation.
+        """
+        cclient = ClusterClient(self.credentials)
+        groupby_agg = (
+            []
+            if groupby is None
+            else [{"name": groupby, "field": groupby, "agg": "correlation"}]
+        )
+        return cclient.aggregate(
+            dataset_id=self.dataset_id,
+            vector_fields=[vector_field],
+            metrics=[{"name": "correlation", "fields": [X, Y], "agg": "correlation"}],
+            groupby=groupby_agg,
+            alias=alias,
+        )["results"]
+
     @added(version="1.2.2")
     def corr(
         self,
@@ -129,42 +159,35 @@ class Statistics(APIClient):
 
         fontsize: int
             The font size of the values in the image
-        """
-        import matplotlib as mpl
-        import matplotlib.pyplot as plt
 
+        show_plot: bool
+            If False, nothing is plotted and a DataFrame of the correlations
+            is returned, with a column per cluster and a row per category
+        """
         # todo: how to cover cases when fields are in schema but not "calculable" fields like clusters and deployables
-        cclient = ClusterClient(self.credentials)
-        groupby_agg = (
-            []
-            if groupby is None
-            else [{"name": groupby, "field": groupby, "agg": "correlation"}]
+        res = self._get_correlation_aggregate(
+            X=X, Y=Y, vector_field=vector_field, alias=alias, groupby=groupby
         )
-        res = cclient.aggregate(
-            dataset_id=self.dataset_id,
-            vector_fields=[vector_field],
-            metrics=[{"name": "correlation", "fields": [X, Y], "agg": "correlation"}],
-            groupby=groupby_agg,
-            alias=alias,
-        )["results"]
 
         clusters = sorted(res.keys())
 
         if groupby is None:
             categories = ["cluster"]
         else:
-            series = Series(
-                credentials=self.credentials,
-                dataset_id=self.dataset_id,
-                field=groupby,
-            ).all(show_progress_bar=False)
-
+            # The aggregate already returns every category of each cluster
             categories = sorted(
-                pd.Series(map(lambda _: _[groupby], series)).drop_duplicates()
+                {
+                    value[groupby]
+                    for values in res.values()
+                    for value in values
+                    if groupby in value
+                }
             )
 
         # Use a pandas DataFrame for easy indexing
-        dataframe = pd.DataFrame(data=[], columns=clusters, index=categories)
+        dataframe = pd.DataFrame(
+            data=float("nan"), columns=clusters, index=categories, dtype=float
+        )
 
         for cluster, values in res.items():
             for value in values:
@@ -172,6 +195,25 @@ class Statistics(APIClient):
                 category = value.get(groupby, "cluster")
                 dataframe.at[category, cluster] = correlation_value
 
+        if not show_plot:
+            return dataframe
+
+        import matplotlib.pyplot as plt
+
+        self._plot_correlation(dataframe, fontsize=fontsize)
+        plt.show()
+
+    @staticmethod
+    def _plot_correlation(dataframe: pd.DataFrame, fontsize: int = 16):
+        """
+        Draws a heatmap of correlations with a column per cluster and a row
+        per category, and returns the figure.
+        """
+        import matplotlib as mpl
+        import matplotlib.pyplot as plt
+
+        clusters = list(dataframe.columns)
+        categories = list(dataframe.index)
         # Only needed pandas DataFrame for indexing, now convert to numpy
         # ndarray for convenience.
         data = dataframe.to_numpy(dtype=float)
@@ -214,11 +256,8 @@ class Statistics(APIClient):
                     fontsize=fontsize,
                 )
 
-        if show_plot:
-            fig.tight_layout()
-            plt.show()
-        else:
-            return fig
+        fig.tight_layout()
+        return fig
 
     def health(self, output_format="dataframe") -> Union[pd.DataFrame, dict]:
         """
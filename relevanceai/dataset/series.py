@@ -438,32 +438,31 @@ class Series(APIClient):
             asc=ascending,
         )["results"]
 
-        total = self.get_number_of_documents(dataset_id=self.dataset_id)
         aggregation = pd.DataFrame(aggregation)
 
         if normalize:
+            total = self.get_number_of_documents(dataset_id=self.dataset_id)
             aggregation["frequency"] /= total
 
         if bins is not None:
-            vals = []
-            for agg in [[agg[0]] * int(agg[1]) for agg in aggregation.values]:
-                vals += agg
-
-            vals = pd.cut(vals, bins)
-
-            categories = [
-                "({}, {}]".format(interval.left, interval.right) for interval in vals
-            ]
-            unique_categories = list(set(categories))
-
+            # Bin the distinct values and add up their frequencies rather
+            # than repeating every value once per document
+            values, frequencies = aggregation.values[:, 0], aggregation.values[:, 1]
+            intervals = pd.cut(values.astype(float), bins)
+            counts: dict = {}
+            for interval, frequency in zip(intervals, frequencies):
+                counts[interval] = counts.get(interval, 0) + frequency
+
+            unique_intervals = list(counts)
             if sort:
-                categories = sorted(
-                    categories, key=lambda x: float(x.split(",")[0][1:])
-                )
+                unique_intervals = sorted(unique_intervals, key=lambda x: x.left)
 
             aggregation = pd.DataFrame(
-                [categories.count(cat) for cat in unique_categories],
-                index=unique_categories,
+                [counts[interval] for interval in unique_intervals],
+                index=[
+                    "({}, {}]".format(interval.left, interval.right)
+                    for interval in unique_intervals
+                ],
             )
             aggregation.columns = ["Frequency"]
 
@@ -0,0 +1,218 @@
+"""
+Uploads media files to a dataset concurrently. Files are streamed from disk
+(or from their URL into a temporary file) rather than read into memory, and
+hashed with sha256 on the way so that content uploaded earlier in the run,
+or recorded in a local manifest by an earlier run, is not uploaded again.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from relevanceai.utils.transport import DO_NOT_REPEAT_STATUS_CODES, get_session
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def is_media_url(source: str) -> bool:
+    return source.startswith("http://") or source.startswith("https://")
+
+
+def hash_file(f: IO[bytes], chunk_size: int = CHUNK_SIZE) -> str:
+    """The sha256 of a binary file, read chunk by chunk from the start"""
+    f.seek(0)
+    sha256 = hashlib.sha256()
+    for chunk in iter(lambda: f.read(chunk_size), b""):
+        sha256.update(chunk)
+    f.seek(0)
+    return sha256.hexdigest()
+
+
+class MediaManifest:
+    """
+    A JSON lines file recording the sha256 and hosted URL of every media
+    uploaded to a dataset, so that later runs can skip identical content.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._urls: Dict[Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        key = (record["dataset_id"], record["sha256"])
+                        self._urls[key] = record["url"]
+
+    def get(self, dataset_id: str, sha256: str) -> Optional[str]:
+        return self._urls.get((dataset_id, sha256))
+
+    def add(self, dataset_id: str, sha256: str, url: str, source: str):
+        record = {"dataset_id": dataset_id, "sha256": sha256, "url": url}
+        record["source"] = source
+        with self._lock:
+            self._urls[(dataset_id, sha256)] = url
+            with open(self.path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def __len__(self):
+        return len(self._urls)
+
+
+class MediaUploader:
+    """
+    Uploads batches of local files or media URLs with `max_workers` threads
+    sharing the SDK's pooled session. Every upload is retried up to
+    `number_of_retries` times.
+
+    Parameters
+    ----------
+    dataset_id: str
+        The dataset the media belongs to
+    get_upload_urls: Callable
+        Called with a list of file names, returns a dictionary with `url`
+        and `upload_url` for each, like datasets.get_file_upload_urls
+    max_workers: int
+        The number of files to read and upload at a time
+    manifest_path: str
+        A JSON lines file of media uploaded by earlier runs to skip
+    """
+
+    def __init__(
+        self,
+        dataset_id: str,
+        get_upload_urls: Callable[[List[str]], List[Dict]],
+        max_workers: int = 8,
+        number_of_retries: int = 3,
+        seconds_between_retries: float = 1,
+        manifest_path: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self.dataset_id = dataset_id
+        self.get_upload_urls = get_upload_urls
+        self.max_workers = max_workers
+        self.number_of_retries = max(number_of_retries, 1)
+        self.seconds_between_retries = seconds_between_retries
+        self.manifest = None if manifest_path is None else MediaManifest(manifest_path)
+        self.session = get_session() if session is None else session
+        self.chunk_size = chunk_size
+        # Hosted URLs of the content uploaded in this run, by sha256
+        self.uploaded: Dict[str, str] = {}
+        self.number_of_skipped_uploads = 0
+
+    def upload(
+        self, sources: List[str]
+    ) -> List[Tuple[Optional[str], Optional[BaseException]]]:
+        """
+        Upload local files or media URLs. Returns the hosted URL of every
+        source, or the error that stopped it from being uploaded.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            staged = list(executor.map(self._stage, sources))
+            try:
+                results: List[Tuple[Optional[str], Optional[BaseException]]] = [
+                    (None, error) for _, _, error in staged
+                ]
+                # The first source of each new sha256 is uploaded, the others
+                # (and content uploaded before) reuse its URL
+                new: Dict[str, List[int]] = {}
+                for i, (f, sha256, error) in enumerate(staged):
+                    if error is not None or sha256 is None:
+                        continue
+                    url = self._get_uploaded_url(sha256)
+                    if url is not None:
+                        results[i] = (url, None)
+                        self.number_of_skipped_uploads += 1
+                    elif sha256 in new:
+                        new[sha256].append(i)
+                        self.number_of_skipped_uploads += 1
+                    else:
+                        new[sha256] = [i]
+                if not new:
+                    return results
+
+                first = [indices[0] for indices in new.values()]
+                upload_urls = self.get_upload_urls([sources[i] for i in first])
+                uploads = executor.map(
+                    self._put,
+                    [upload_url["upload_url"] for upload_url in upload_urls],
+                    [staged[i][0] for i in first],
+                )
+                for (sha256, indices), upload_url, error in zip(
+                    new.items(), upload_urls, uploads
+                ):
+                    if error is None:
+                        self._add_uploaded_url(
+                            sha256, upload_url["url"], sources[indices[0]]
+                        )
+                    for i in indices:
+                        results[i] = (
+                            upload_url["url"] if error is None else None,
+                            error,
+                        )
+                return results
+            finally:
+                for f, _, _ in staged:
+                    if f is not None:
+                        f.close()
+
+    def _get_uploaded_url(self, sha256: str) -> Optional[str]:
+        if sha256 in self.uploaded:
+            return self.uploaded[sha256]
+        if self.manifest is not None:
+            return self.manifest.get(self.dataset_id, sha256)
+        return None
+
+    def _add_uploaded_url(self, sha256: str, url: str, source: str):
+        self.uploaded[sha256] = url
+        if self.manifest is not None:
+            self.manifest.add(self.dataset_id, sha256, url, source)
+
+    def _stage(
+        self, source: str
+    ) -> Tuple[Optional[IO[bytes]], Optional[str], Optional[BaseException]]:
+        """Opens and hashes the source, downloading it first if it is a URL"""
+        f = None
+        try:
+            if is_media_url(source):
+                f = tempfile.TemporaryFile()
+                with self.session.get(source, stream=True) as response:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(self.chunk_size):
+                        f.write(chunk)
+            else:
+                f = open(source, "rb")
+            return f, hash_file(f, self.chunk_size), None
+        except Exception as e:
+            if f is not None:
+                f.close()
+            return None, None, e
+
+    def _put(self, upload_url: str, f: IO[bytes]) -> Optional[BaseException]:
+        """Streams the file to the upload URL, returns the error if all tries fail"""
+        error: Optional[BaseException] = None
+        for attempt in range(self.number_of_retries):
+            if attempt > 0:
+                time.sleep(self.seconds_between_retries)
+            f.seek(0)
+            try:
+                response = self.session.put(upload_url, data=f)
+                response.raise_for_status()
+                return None
+            except requests.exceptions.HTTPError as e:
+                error = e
+                if e.response.status_code in DO_NOT_REPEAT_STATUS_CODES:
+                    break
+            except requests.exceptions.RequestException as e:
+                error = e
+        return error
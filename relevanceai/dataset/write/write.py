@@ -2,6 +2,7 @@
 """
 Pandas like dataset API
 """
+import contextlib
 import os
 import warnings
 import requests
@@ -9,13 +10,12 @@ import pandas as pd
 import threading
 import time
 import uuid
-import concurrent.futures
 
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Union
-from tqdm.auto import tqdm
+from typing import Any, BinaryIO, Callable, ContextManager, Dict, List, Optional, Union
 
 from relevanceai.dataset.read import Read
+from relevanceai.dataset.write.media import MediaUploader
 
 from relevanceai.utils import DocUtils
 from relevanceai.utils.logger import FileLogger
@@ -24,6 +24,35 @@ from relevanceai.utils import make_id
 from relevanceai.utils import fire_and_forget
 from relevanceai.constants.warning import Warning
 from relevanceai.utils.progress_bar import progress_bar
+from relevanceai.utils.concurrency import pipeline_chunks
+from relevanceai.utils.transport import get_session
+
+EXECUTORS = ["thread", "process"]
+
+
+def _apply_to_documents(
+    documents: list, func: Callable, apply_args: dict, track_changes: bool = False
+):
+    # Module level so that it can be sent to a process pool
+    snapshots = DocUtils().snapshot_documents(documents) if track_changes else None
+    new_documents = []
+    for d in documents:
+        new_d = func(d, **apply_args)
+        new_documents.append(d if new_d is None else new_d)
+    if track_changes:
+        return DocUtils().diff_documents(snapshots, new_documents)
+    return new_documents
+
+
+def _bulk_apply_to_documents(
+    documents: list, bulk_func: Callable, track_changes: bool = False
+):
+    # Module level so that it can be sent to a process pool
+    snapshots = DocUtils().snapshot_documents(documents) if track_changes else None
+    new_documents = bulk_func(documents)
+    if track_changes:
+        return DocUtils().diff_documents(snapshots, new_documents)
+    return new_documents
 
 
 class Write(Read):
@@ -410,6 +439,10 @@ class Write(Read):
         axis: int = 0,
         log_to_file: bool = True,
         log_file: Optional[str] = None,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        prefetch: int = 2,
+        track_changes: bool = False,
         **apply_args,
     ):
         """
@@ -433,6 +466,17 @@ class Write(Read):
             Axis along which the function is applied.
             - 9 or 'index': apply function to each column
             - 1 or 'columns': apply function to each row
+        executor: str
+            "thread" runs the function in the calling thread. "process" sends
+            chunks to a pool of max_workers processes while the next chunks are
+            fetched and finished ones are upserted, for CPU heavy functions.
+            The function must be picklable (defined at module level) to use processes.
+        prefetch: int
+            The number of chunks to fetch ahead when executor="process"
+        track_changes: bool
+            If True, only the fields the function changed or added are sent back
+            and documents it did not change are skipped. Fields the function
+            deletes are not removed from the dataset.
 
         Example
         ---------
@@ -466,7 +510,27 @@ class Write(Read):
         if axis == 1:
             raise ValueError("We do not support column-wise operations!")
 
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}")
+
+        if executor == "process":
+            return self._apply_in_processes(
+                _apply_to_documents,
+                func_args=(func, apply_args, track_changes),
+                retrieve_chunksize=retrieve_chunksize,
+                filters=filters,
+                select_fields=select_fields,
+                show_progress_bar=show_progress_bar,
+                use_json_encoder=use_json_encoder,
+                max_workers=max_workers,
+                prefetch=prefetch,
+            )
+
         def bulk_fn(documents):
+            if track_changes:
+                return _apply_to_documents(
+                    documents, func, apply_args, track_changes=True
+                )
             new_documents = []
             for d in documents:
                 new_d = func(d, **apply_args)
@@ -501,6 +565,12 @@ class Write(Read):
         filters: Optional[list] = None,
         select_fields: Optional[list] = None,
         max_active_threads: int = 2,
+        executor: str = "thread",
+        max_workers: Optional[int] = None,
+        prefetch: int = 2,
+        show_progress_bar: bool = False,
+        use_json_encoder: bool = True,
+        track_changes: bool = False,
     ):
         """
         Apply a bulk function along an axis of the DataFrame.
@@ -521,6 +591,17 @@ class Write(Read):
             Axis along which the function is applied.
             - 9 or 'index': apply function to each column
             - 1 or 'columns': apply function to each row
+        executor: str
+            "thread" runs the function in the calling thread. "process" sends
+            chunks to a pool of max_workers processes while the next chunks are
+            fetched and finished ones are upserted, for CPU heavy functions.
+            The function must be picklable (defined at module level) to use processes.
+        prefetch: int
+            The number of chunks to fetch ahead when executor="process"
+        track_changes: bool
+            If True, only the fields the function changed or added are sent back
+            and documents it did not change are skipped. Fields the function
+            deletes are not removed from the dataset.
 
         Example
         ---------
@@ -543,14 +624,35 @@ class Write(Read):
         filters = [] if filters is None else filters
         select_fields = [] if select_fields is None else select_fields
 
+        if executor not in EXECUTORS:
+            raise ValueError(f"executor must be one of {EXECUTORS}")
+
+        if executor == "process":
+            return self._apply_in_processes(
+                _bulk_apply_to_documents,
+                func_args=(bulk_func, track_changes),
+                retrieve_chunksize=retrieve_chunksize,
+                filters=filters,
+                select_fields=select_fields,
+                show_progress_bar=show_progress_bar,
+                use_json_encoder=use_json_encoder,
+                max_workers=max_workers,
+                prefetch=prefetch,
+                max_pending_upserts=max_active_threads,
+            )
+
         for chunk in self.chunk_dataset(
             select_fields=select_fields,
             filters=filters,
             chunksize=retrieve_chunksize,
         ):
-            updated_chunk = bulk_func(
+            updated_chunk = _bulk_apply_to_documents(
                 chunk,
+                bulk_func,
+                track_changes=track_changes,
             )
+            if track_changes and len(updated_chunk) == 0:
+                continue
 
             @fire_and_forget
             def fire_upsert_docs():
@@ -566,6 +668,64 @@ class Write(Read):
 
             fire_upsert_docs()
 
+    def _apply_in_processes(
+        self,
+        bulk_func: Callable,
+        retrieve_chunksize: int,
+        filters: list,
+        select_fields: list,
+        func_args: tuple = (),
+        show_progress_bar: bool = True,
+        use_json_encoder: bool = True,
+        max_workers: Optional[int] = None,
+        prefetch: int = 2,
+        max_pending_upserts: int = 2,
+    ):
+        """
+        Fetch, process and upsert chunks concurrently, with bulk_func running
+        in a process pool. Logs the time spent in each stage and returns the
+        documents that failed to upsert along with those timings.
+        """
+
+        def upsert(documents):
+            return self._update_documents(
+                self.dataset_id,
+                documents=documents,
+                use_json_encoder=use_json_encoder,
+            )
+
+        results, timings = pipeline_chunks(
+            bulk_func,
+            self.chunk_dataset(
+                select_fields=select_fields,
+                filters=filters,
+                chunksize=retrieve_chunksize,
+            ),
+            upsert,
+            func_args=func_args,
+            max_workers=max_workers,
+            prefetch=prefetch,
+            max_pending_pushes=max_pending_upserts,
+            show_progress_bar=show_progress_bar,
+        )
+        self.logger.info(
+            f"Processed {timings['documents']} documents in {timings['chunks']} chunks "
+            f"in {timings['total']:.1f}s (fetch {timings['fetch']:.1f}s, "
+            f"compute {timings['compute']:.1f}s across workers, upsert {timings['push']:.1f}s)"
+        )
+
+        failed_documents = [
+            document
+            for result in results
+            if isinstance(result, dict)
+            for document in result.get("failed_documents", [])
+        ]
+        if failed_documents:
+            print("️❗❗Errors detected when running apply.")
+        else:
+            print("✅ Successfully ran!")
+        return {"failed_documents": failed_documents, "timings": timings}
+
     @track
     def cat(self, vector_name: Union[str, None] = None, fields: Optional[List] = None):
         """
@@ -732,19 +892,104 @@ class Write(Read):
         """
         return self.datasets.delete(self.dataset_id)
 
-
     def _upload_media(
-        self, presigned_url: str, media_content: bytes, verbose: bool = True
+        self,
+        presigned_url: str,
+        media_content: Union[bytes, BinaryIO],
+        verbose: bool = True,
     ):
-        if not isinstance(media_content, bytes):
+        if not isinstance(media_content, bytes) and not hasattr(media_content, "read"):
             raise ValueError(
-                f"media needs to be in a bytes format. Currently in {type(media_content)}"
+                f"media needs to be in a bytes format or a binary file. Currently in {type(media_content)}"
             )
-        response = requests.put(presigned_url, data=media_content)
+        response = get_session().put(presigned_url, data=media_content)
         if response.status_code == 200:
             if verbose:
                 print("media successfully uploaded.")
 
+    def _get_media_uploader(
+        self,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+    ) -> MediaUploader:
+        if max_workers is None:
+            max_workers = int(self.config.get_option("upload.media_max_workers"))
+        return MediaUploader(
+            dataset_id=self.dataset_id,
+            get_upload_urls=lambda files: self.datasets.get_file_upload_urls(
+                self.dataset_id, files=files
+            )["files"],
+            max_workers=max_workers,
+            number_of_retries=int(self.config.get_option("retries.number_of_retries")),
+            seconds_between_retries=int(
+                self.config.get_option("retries.seconds_between_retries")
+            ),
+            manifest_path=manifest_path,
+        )
+
+    def _iterate_media_documents(
+        self,
+        media_fns: List[str],
+        verbose: bool = False,
+        batch_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        show_progress_bar: bool = True,
+    ):
+        """
+        Uploads medias batch by batch and yields the media documents and
+        failed medias of each batch as soon as their URLs resolve.
+        """
+        if batch_size is None:
+            batch_size = int(self.config.get_option("upload.media_batch_size"))
+        uploader = self._get_media_uploader(
+            max_workers=max_workers, manifest_path=manifest_path
+        )
+        for i in progress_bar(
+            range(0, len(media_fns), batch_size),
+            show_progress_bar=show_progress_bar,
+        ):
+            batch = media_fns[i : i + batch_size]
+            response_docs: dict = {"media_documents": [], "failed_medias": []}
+            for media_fn, (url, error) in zip(batch, uploader.upload(batch)):
+                response_doc = {
+                    "_id": str(uuid.uuid4()),
+                    "media_file": media_fn,
+                    "media_url": url,
+                }
+                if error is None:
+                    response_docs["media_documents"].append(response_doc)
+                else:
+                    if verbose:
+                        print(f"Failed to upload {media_fn}.")
+                        print(error)
+                    response_docs["failed_medias"].append(response_doc)
+            yield response_docs
+        if verbose and uploader.number_of_skipped_uploads:
+            print(
+                f"Skipped {uploader.number_of_skipped_uploads} uploads of media that was already uploaded."
+            )
+
+    def _host_medias(
+        self,
+        media_fns: List[str],
+        verbose: bool = False,
+        file_log: str = "media_upload.log",
+        logging: bool = True,
+        **kwargs,
+    ) -> dict:
+        response_docs: dict = {"media_documents": [], "failed_medias": []}
+        logger: ContextManager = contextlib.nullcontext()
+        if logging:
+            logger = FileLogger(file_log)
+        with logger:
+            for batch_docs in self._iterate_media_documents(
+                media_fns, verbose=verbose, **kwargs
+            ):
+                response_docs["media_documents"] += batch_docs["media_documents"]
+                response_docs["failed_medias"] += batch_docs["failed_medias"]
+        return response_docs
+
     @track
     def insert_media_bytes(self, bytes: bytes, filename: str, verbose: bool = True):
         """
@@ -787,58 +1032,31 @@ class Write(Read):
         verbose: bool = True,
         file_log: str = "insert_media_urls.log",
         logging: bool = True,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
     ):
         """
-        Insert a single media URL
-        """
-        # media to download
-        response = self.datasets.get_file_upload_urls(self.dataset_id, files=media_urls)
-        response_docs: dict = {"media_documents": [], "failed_medias": []}
-        if logging:
-            with FileLogger(file_log):
-                for i, im in enumerate(tqdm(media_urls)):
-                    response_doc = {"_id": str(uuid.uuid4())}
-                    response_doc["media_file"] = im
-                    response_doc["media_url"] = response["files"][i]["url"]
-                    try:
-                        self._upload_media(
-                            presigned_url=response["files"][i]["upload_url"],
-                            media_content=requests.get(im).content,
-                            verbose=verbose,
-                        )
-                        response_docs["media_documents"].append(response_doc)
-                    except Exception as e:
-                        if verbose:
-                            print(f"Failed to upload {im}.")
-                        if verbose:
-                            print(e)
-                        response_docs["failed_medias"].append(response_doc)
-        else:
-            for i, im in enumerate(tqdm(media_urls)):
-                response_doc = {"_id": str(uuid.uuid4())}
-                response_doc["media_file"] = im
-                response_doc["media_url"] = response["files"][i]["url"]
-                try:
-                    self._upload_media(
-                        presigned_url=response["files"][i]["upload_url"],
-                        media_content=requests.get(im).content,
-                        verbose=verbose,
-                    )
-                    response_docs["media_documents"].append(response_doc)
-                except Exception as e:
-                    if verbose:
-                        print(f"Failed to upload {im}.")
-                    if verbose:
-                        print(e)
-                    response_docs["failed_medias"].append(response_doc)
-        # Return the media URLs
-        return response_docs
+        Insert a list of media URLs. They are downloaded and uploaded
+        concurrently, and media with the same content is only uploaded once.
 
-    def _open_local_media(self, fn: str) -> bytes:
-        with open(fn, "rb") as fn_byte:
-            f = fn_byte.read()
-            b = bytes(f)
-        return b
+        Parameters
+        ------------
+        media_urls: List[str]
+            A list of media URLs
+        max_workers: int
+            The number of medias to download and upload at a time. Defaults to config.upload.media_max_workers
+        manifest_path: str
+            A JSON lines file recording the content hash of uploaded medias,
+            to skip medias uploaded by earlier runs
+        """
+        return self._host_medias(
+            media_urls,
+            verbose=verbose,
+            file_log=file_log,
+            logging=logging,
+            max_workers=max_workers,
+            manifest_path=manifest_path,
+        )
 
     @track
     def insert_local_media(self, media_fn: str, verbose: bool = True):
@@ -855,11 +1073,12 @@ class Write(Read):
         # media to download
         response = self.datasets.get_file_upload_urls(self.dataset_id, files=[media_fn])
         url = response["files"][0]["url"]
-        self._upload_media(
-            presigned_url=response["files"][0]["upload_url"],
-            media_content=self._open_local_media(media_fn),
-            verbose=verbose,
-        )
+        with open(media_fn, "rb") as f:
+            self._upload_media(
+                presigned_url=response["files"][0]["upload_url"],
+                media_content=f,
+                verbose=verbose,
+            )
         if verbose:
             print(f"media is hosted at {url}.")
         return url
@@ -871,56 +1090,35 @@ class Write(Read):
         verbose: bool = False,
         file_log="local_media_upload.log",
         logging: bool = True,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
     ):
-        """Insert a list of local medias.
+        """Insert a list of local medias. Files are streamed from disk and
+        uploaded concurrently, and files with the same content are only
+        uploaded once.
 
         Parameters
         ------------
         media_fns: List[str]
             A list of local medias
         verbose: bool
-            If True, this will print after each successful upload.
+            If True, this will print after each failed upload.
         file_log: str
             The log to write
+        max_workers: int
+            The number of files to upload at a time. Defaults to config.upload.media_max_workers
+        manifest_path: str
+            A JSON lines file recording the content hash of uploaded medias,
+            to skip medias uploaded by earlier runs
         """
-        response = self.datasets.get_file_upload_urls(self.dataset_id, files=media_fns)
-        response_docs: dict = {"media_documents": [], "failed_medias": []}
-
-        if logging:
-            with FileLogger(file_log) as f:
-                for i, media_fn in enumerate(tqdm(media_fns)):
-                    response_doc = {"_id": str(uuid.uuid4())}
-                    response_doc["media_file"] = media_fn
-                    response_doc["media_url"] = response["files"][i]["url"]
-                    try:
-                        self._upload_media(
-                            presigned_url=response["files"][i]["upload_url"],
-                            media_content=self._open_local_media(media_fn),
-                            verbose=verbose,
-                        )
-                        response_docs["media_documents"].append(response_doc)
-                    except Exception as e:
-                        print(f"failed to upload {media_fn}")
-                        print(e)
-                        response_docs["failed_medias"].append(response_doc)
-        else:
-            for i, media_fn in enumerate(tqdm(media_fns)):
-                response_doc = {"_id": str(uuid.uuid4())}
-                response_doc["media_file"] = media_fn
-                response_doc["media_url"] = response["files"][i]["url"]
-                try:
-                    self._upload_media(
-                        presigned_url=response["files"][i]["upload_url"],
-                        media_content=self._open_local_media(media_fn),
-                        verbose=verbose,
-                    )
-                    response_docs["media_documents"].append(response_doc)
-                except Exception as e:
-                    print(f"failed to upload {media_fn}")
-                    print(e)
-                    response_docs["failed_medias"].append(response_doc)
-
-        return response_docs
+        return self._host_medias(
+            media_fns,
+            verbose=verbose,
+            file_log=file_log,
+            logging=logging,
+            max_workers=max_workers,
+            manifest_path=manifest_path,
+        )
 
     def get_media_documents(
         self,
@@ -928,6 +1126,8 @@ class Write(Read):
         verbose: bool = False,
         file_log: str = "media_upload.log",
         logging: bool = True,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
     ) -> dict:
         """
         Bulk insert medias. Returns a link to once it has been hosted
@@ -935,27 +1135,24 @@ class Write(Read):
         Parameters
         --------------
         media_fns: List[str]
-            List of medias to upload
+            List of local medias or media URLs to upload
         verbose: bool
             If True, prints statements after uploading
         file_log: str
             The file log to write
+        max_workers: int
+            The number of medias to upload at a time
+        manifest_path: str
+            A JSON lines file recording the content hash of uploaded medias
         """
-        # Algorithm aims to insert local or hosted medias
-        if "http" in media_fns[0]:
-            return self.insert_media_urls(
-                media_fns,
-                verbose=verbose,
-                file_log=file_log,
-                logging=logging,
-            )
-        else:
-            return self.insert_local_medias(
-                media_fns,
-                verbose=verbose,
-                file_log=file_log,
-                logging=logging,
-            )
+        return self._host_medias(
+            media_fns,
+            verbose=verbose,
+            file_log=file_log,
+            logging=logging,
+            max_workers=max_workers,
+            manifest_path=manifest_path,
+        )
 
     host_media_documents = get_media_documents
 
@@ -966,10 +1163,15 @@ class Write(Read):
         verbose: bool = False,
         file_log: str = "media_upload.log",
         logging: bool = True,
+        max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
+        batch_size: Optional[int] = None,
         **kw,
     ):
         """
-        Insert medias into a dataset.
+        Insert medias into a dataset. Medias are uploaded in batches of
+        `batch_size` and the documents of each batch are upserted as soon as
+        its media URLs resolve.
 
         Parameters
         -------------
@@ -980,14 +1182,49 @@ class Write(Read):
             If True, prints statements after uploading
         file_log: str
             The file log to write
+        max_workers: int
+            The number of medias to upload at a time. Defaults to config.upload.media_max_workers
+        manifest_path: str
+            A JSON lines file recording the content hash of uploaded medias,
+            to skip medias uploaded by earlier runs
+        batch_size: int
+            The number of medias to upload before upserting their documents. Defaults to config.upload.media_batch_size
+
+        Returns
+        -------
+            The upsert_documents responses of every batch added together, plus
+            the medias that failed to upload under "failed_medias".
         """
-        documents = self.get_media_documents(
-            media_fns=media_fns,
-            verbose=verbose,
-            file_log=file_log,
-            logging=logging,
-        )
-        return self.upsert_documents(documents["media_documents"], create_id=True, **kw)
+        results: dict = {
+            "inserted": 0,
+            "failed_documents": [],
+            "failed_documents_detailed": [],
+            "failed_medias": [],
+        }
+        logger: ContextManager = contextlib.nullcontext()
+        if logging:
+            logger = FileLogger(file_log)
+        with logger:
+            for batch_docs in self._iterate_media_documents(
+                media_fns,
+                verbose=verbose,
+                batch_size=batch_size,
+                max_workers=max_workers,
+                manifest_path=manifest_path,
+            ):
+                results["failed_medias"] += batch_docs["failed_medias"]
+                if not batch_docs["media_documents"]:
+                    continue
+                result = self.upsert_documents(
+                    batch_docs["media_documents"], create_id=True, **kw
+                )
+                if isinstance(result, dict):
+                    for key, value in result.items():
+                        if isinstance(value, (int, float, list)) and key in results:
+                            results[key] += value
+                        else:
+                            results[key] = value
+        return results
 
     def delete_documents(self, document_ids: List[str]):
         """
@@ -1049,10 +1286,11 @@ class Write(Read):
         images: List[str],
         show_progress_bar: bool = False,
         n_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
     ) -> List[str]:
         """
-        It takes a list of images, splits it into batches, and then uses a thread pool to upsert the
-        images in parallel
+        It uploads a list of images with a pool of workers, upserting a
+        document for each batch of images as soon as they are hosted
 
         Parameters
         ----------
@@ -1060,49 +1298,34 @@ class Write(Read):
             A list of media src paths to upload
         show_progress_bar : bool
             Show the progress bar
-        max_workers : Optional[int]
-            The number of workers to use. If None, this is set to the max number in ThreadPoolExecutor
+        n_workers : Optional[int]
+            The number of images to upload at a time. Defaults to config.upload.media_max_workers
+        manifest_path: str
+            A JSON lines file recording the content hash of uploaded medias
 
         Returns
         -------
             List[str]: A list of media_urls
 
         """
-
-        if n_workers is None:
-            max_workers = os.cpu_count() + 4  # type: ignore
-        else:
-            max_workers = n_workers
-
-        bs = int(len(images) / max_workers)
-        nb = int(len(images) / bs)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = []
-            for i in range(int(nb)):
-                futures.append(
-                    executor.submit(
-                        self.upsert_media,
-                        images[i * bs : (i + 1) * bs],
-                        False,
-                        "",
-                        False,
-                    )
-                )
-
-            for future in progress_bar(
-                concurrent.futures.as_completed(futures),
-                show_progress_bar=show_progress_bar,
-            ):
-                res = future.result()
-
-        return [document["media_url"] for document in self.get_all_documents()]
+        media_urls = []
+        for batch_docs in self._iterate_media_documents(
+            images,
+            max_workers=n_workers,
+            manifest_path=manifest_path,
+            show_progress_bar=show_progress_bar,
+        ):
+            if batch_docs["media_documents"]:
+                self.upsert_documents(batch_docs["media_documents"], create_id=True)
+            media_urls += [d["media_url"] for d in batch_docs["media_documents"]]
+        return media_urls
 
     def prepare_media_documents(
         self,
         documents: List[Dict[str, Any]],
         media_fields: List[str],
         max_workers: Optional[int] = None,
+        manifest_path: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
 
         list_of_media_url_mappings = []
@@ -1115,39 +1338,19 @@ class Write(Read):
                     flat_paths.append(path)
                 elif isinstance(path, list):
                     flat_paths += path
-            paths = list(set(flat_paths))
-
-            def upload_media(path, url):
-
-                response_doc = {"_id": str(uuid.uuid4())}
-                response_doc["media_file"] = path
+            paths = list(dict.fromkeys(flat_paths))
 
-                with open(path, "rb") as f:
-                    img = bytes(f.read())
-
-                requests.put(
-                    url["upload_url"],
-                    data=img,
-                )
-
-                del img
-
-                return url["url"]
-
-            urls = self.datasets.get_file_upload_urls(self.dataset_id, files=paths)[
-                "files"
-            ]
-
-            def upload():
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=max_workers
-                ) as executor:
-                    data = list(
-                        tqdm(executor.map(upload_media, paths, urls), total=len(paths))
-                    )
-                return data
-
-            url_mapping = {path: url for path, url in zip(paths, upload())}
+            url_mapping = {}
+            for batch_docs in self._iterate_media_documents(
+                paths, max_workers=max_workers, manifest_path=manifest_path
+            ):
+                for media_document in batch_docs["media_documents"]:
+                    url_mapping[media_document["media_file"]] = media_document[
+                        "media_url"
+                    ]
+                for failed_media in batch_docs["failed_medias"]:
+                    warnings.warn(f"Failed to upload {failed_media['media_file']}")
+                    url_mapping[failed_media["media_file"]] = None
 
             list_of_media_url_mappings.append(url_mapping)
 
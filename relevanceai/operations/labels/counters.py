@@ -0,0 +1,83 @@
+"""Counters and tokenizers for counting phrases in one pass
+"""
+import heapq
+import re
+
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+# Words, numbers and contractions such as "don't"
+TOKEN_PATTERN = re.compile(r"\w+(?:'\w+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """A fast regex stand in for nltk's word_tokenize that leaves out punctuation"""
+    return TOKEN_PATTERN.findall(text)
+
+
+class SpaceSavingCounter:
+    """
+    Approximate counter that keeps at most `capacity` items (Space-Saving,
+    Metwally et al.). When a new item arrives and the counter is full, the
+    least frequent item is replaced and the new item inherits its count, so
+    counts can be overestimated by at most the count of the item replaced.
+    Any item that occurs more than total / capacity times is always kept.
+
+    It has the same `update` and `most_common` methods as collections.Counter.
+
+    Parameters
+    ----------
+    capacity: int
+        The maximum number of items to keep track of
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+        self.capacity = capacity
+        self.counts: Dict[Hashable, float] = {}
+        self.errors: Dict[Hashable, float] = {}
+        # Min-heap of (count, item). Entries go stale when an item's count
+        # changes and are skipped when popped.
+        self._heap: List[Tuple[float, Hashable]] = []
+
+    def _push(self, item: Hashable):
+        heapq.heappush(self._heap, (self.counts[item], item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(count, i) for i, count in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[float, Hashable]:
+        while True:
+            count, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return count, item
+
+    def add(self, item: Hashable, count: float = 1):
+        if item in self.counts:
+            self.counts[item] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+        else:
+            min_count, min_item = self._pop_min()
+            del self.counts[min_item]
+            del self.errors[min_item]
+            self.counts[item] = min_count + count
+            self.errors[item] = min_count
+        self._push(item)
+
+    def update(self, items):
+        """Add items from an iterable or the counts from a mapping"""
+        if hasattr(items, "items"):
+            for item, count in items.items():
+                self.add(item, count)
+        else:
+            for item in items:
+                self.add(item)
+
+    def most_common(self, n: int = None) -> List[Tuple[Hashable, float]]:
+        ranked = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)
+        return ranked if n is None else ranked[:n]
+
+    def __len__(self):
+        return len(self.counts)
@@ -18,6 +18,7 @@ from relevanceai.dataset.write.write import Write
 from relevanceai.operations.vector.local_nearest_neighbours import NearestNeighbours
 from relevanceai.operations.preprocessing.text.base_text_processing import MLStripper
 from relevanceai.operations.cluster.constants import NEAREST_NEIGHBOURS
+from relevanceai.operations.labels.counters import SpaceSavingCounter, tokenize
 
 from relevanceai.utils.decorators.analytics import track
 from relevanceai.utils.logger import FileLogger
@@ -689,6 +690,35 @@ class LabelOps(BaseOps, Write):
         return counter
         # return dict(counter.most_common(most_common))
 
+    def _get_ngrams_fast(
+        self,
+        text,
+        n: int = 2,
+        min_word_length: int = 2,
+        preprocess_hooks: Optional[list] = None,
+    ) -> Counter:
+        """Same as _get_ngrams but tokenizes with a compiled regex instead of
+        nltk and drops stopwords and short words before building n-grams"""
+        preprocess_hooks = [] if preprocess_hooks is None else preprocess_hooks
+
+        counter: Counter = Counter()
+        for line in text:
+            if not isinstance(line, str):
+                continue
+            for p_hook in preprocess_hooks:
+                line = p_hook(line)
+            tokens = tokenize(line)
+            is_clean = [
+                len(t) >= min_word_length and t not in self.eng_stopwords
+                for t in tokens
+            ]
+            counter.update(
+                " ".join(tokens[i : i + n])
+                for i in range(len(tokens) - n + 1)
+                if all(is_clean[i : i + n])
+            )
+        return counter
+
     @track
     @beta
     def keyphrases(
@@ -854,10 +884,18 @@ class LabelOps(BaseOps, Write):
         n: int = 2,
         deployable_id: Optional[str] = None,
         dataset_id: Optional[str] = None,
+        single_pass: bool = True,
+        max_phrases_per_cluster: Optional[int] = None,
+        batch_size: int = 1000,
     ):
         """
         Simple implementation of the cluster keyphrases.
 
+        By default the dataset is read once, with the cluster field alongside
+        the text fields, and the phrases of every cluster are counted as the
+        documents stream past. Set single_pass=False to instead run one filtered
+        scan per cluster.
+
         Example
         -----------
 
@@ -892,6 +930,13 @@ class LabelOps(BaseOps, Write):
             The algorithm to use
         n: int
             The number of words
+        single_pass: bool
+            If True, count the phrases of every cluster in one scan of the dataset
+        max_phrases_per_cluster: Optional[int]
+            If set, only track this many phrases per cluster with an approximate
+            heavy hitter counter so memory stays bounded
+        batch_size: int
+            The number of documents to retrieve in a chunk
 
         """
         if cluster_alias is None:
@@ -902,6 +947,22 @@ class LabelOps(BaseOps, Write):
 
         vector_fields_str = ".".join(sorted(vector_fields))
         field = f"{cluster_field}.{vector_fields_str}.{cluster_alias}"
+        if single_pass:
+            cluster_counters = self._cluster_keyphrases_single_pass(
+                text_fields=text_fields,
+                field=field,
+                num_clusters=num_clusters,
+                most_common=most_common,
+                preprocess_hooks=preprocess_hooks,
+                algorithm=algorithm,
+                n=n,
+                max_phrases_per_cluster=max_phrases_per_cluster,
+                batch_size=batch_size,
+            )
+            return self._return_cluster_keyphrases(
+                cluster_counters, deployable_id=deployable_id, dataset_id=dataset_id
+            )
+
         all_clusters = self.datasets.facets(
             self.dataset_id, [field], page_size=num_clusters
         )
@@ -925,8 +986,94 @@ class LabelOps(BaseOps, Write):
                 most_common=most_common,
                 preprocess_hooks=preprocess_hooks,
                 algorithm=algorithm,
+                batch_size=batch_size,
             )
             cluster_counters[cluster_value] = top_words
+        return self._return_cluster_keyphrases(
+            cluster_counters, deployable_id=deployable_id, dataset_id=dataset_id
+        )
+
+    def _cluster_keyphrases_single_pass(
+        self,
+        text_fields: List[str],
+        field: str,
+        num_clusters: int = 100,
+        most_common: int = 10,
+        preprocess_hooks: Optional[List[callable]] = None,
+        algorithm: str = "rake",
+        n: int = 2,
+        max_phrases_per_cluster: Optional[int] = None,
+        batch_size: int = 1000,
+    ) -> Dict[str, list]:
+        """Counts the keyphrases of every cluster in one scan of the dataset and
+        returns the top phrases of the num_clusters largest clusters"""
+        self._check_keyphrase_algorithm_requirements(algorithm)
+        if not hasattr(self, "_is_set_up"):
+            self._set_up_nltk()
+
+        cluster_sizes: Counter = Counter()
+        cluster_counters: Dict[str, Counter] = {}
+        # Documents are scored batch_size at a time per cluster, the same
+        # batches a filtered scan of that cluster would return
+        cluster_batches: Dict[str, list] = {}
+
+        def new_counter():
+            if max_phrases_per_cluster is None:
+                return Counter()
+            return SpaceSavingCounter(max_phrases_per_cluster)
+
+        def count_phrases(cluster_value: str, documents: list):
+            text = self.generate_text_list_from_documents(
+                documents=documents, text_fields=text_fields
+            )
+            if algorithm == "nltk":
+                ngram_counter = self._get_ngrams_fast(
+                    text,
+                    n=n,
+                    preprocess_hooks=preprocess_hooks,
+                )
+            elif algorithm == "rake":
+                ngram_counter = self._get_rake_keyphrases(text)
+            if cluster_value not in cluster_counters:
+                cluster_counters[cluster_value] = new_counter()
+            cluster_counters[cluster_value].update(ngram_counter)
+
+        for chunk in self.chunk_dataset(
+            select_fields=text_fields + [field],
+            filters=[
+                {
+                    "field": field,
+                    "filter_type": "exists",
+                    "condition": "==",
+                    "condition_value": " ",
+                }
+            ],
+            chunksize=batch_size,
+        ):
+            for document in chunk:
+                cluster_value = self.get_field(field, document)
+                cluster_sizes[cluster_value] += 1
+                batch = cluster_batches.setdefault(cluster_value, [])
+                batch.append(document)
+                if len(batch) == batch_size:
+                    count_phrases(cluster_value, batch)
+                    cluster_batches[cluster_value] = []
+
+        for cluster_value, batch in cluster_batches.items():
+            if batch:
+                count_phrases(cluster_value, batch)
+
+        return {
+            cluster_value: cluster_counters[cluster_value].most_common(most_common)
+            for cluster_value, _ in cluster_sizes.most_common(num_clusters)
+        }
+
+    def _return_cluster_keyphrases(
+        self,
+        cluster_counters: Dict[str, list],
+        deployable_id: Optional[str] = None,
+        dataset_id: Optional[str] = None,
+    ):
         if deployable_id is not None:
             if dataset_id is None:
                 if not hasattr(self, "dataset_id"):
@@ -1,5 +1,6 @@
 import warnings
-from typing import List, Dict, Optional, Any, Union, Callable
+from contextlib import nullcontext
+from typing import List, Dict, Optional, Any, Union, Callable, ContextManager
 from tqdm.auto import tqdm
 
 from relevanceai.client.helpers import Credentials
@@ -754,9 +755,13 @@ class Operations(Write, IO):
         verbose: bool = True,
         log_to_file: bool = True,
         filters: Optional[list] = None,
+        chunksize: int = 100,
+        batch_size: int = 32,
     ):
         """
-        Question your dataset and retrieve answers from it.
+        Question your dataset and retrieve answers from it. Documents are
+        streamed through the model in chunks and each question's answer and
+        score are upserted under its own field.
 
         Example
         ----------
@@ -778,44 +783,57 @@ class Operations(Write, IO):
         field: str
             The field to add sentiment to
         output_field: str
-            Where to store the sentiment values
+            Where to store the answers. With several questions, each answer is
+            stored under output_field.{question}. Defaults to _question_.{question}
         model_name: str
             The HuggingFace Model name.
         verbose: bool
-            If True, prints progress bar workflow
+            If True, prints where the answers to each question are stored
         log_to_file: bool
-            If True, puts the logs in a file.
+            If True, puts the logs in workflow-run.txt.
+        chunksize: int
+            Number of documents to retrieve and upsert at a time
+        batch_size: int
+            Number of context windows to run through the model at a time
 
         """
-        from relevanceai.workflow.sequential import SequentialWorkflow, Input, Output
-        from relevanceai.operations.text.qa.qa import QAOps
+        from relevanceai.operations_new.question_answer.ops import QuestionAnswerOps
 
         if isinstance(questions, str):
             # Force listing so it loops through multiple question
             questions = [questions]
 
-        model = QAOps(model_name=model_name)
-
-        for question in tqdm(questions):
-            print(f"Processing `{question}`...")
-
-            def bulk_question_answer(contexts: list):
-                return model.bulk_question_answer(question=question, contexts=contexts)
-
-            if output_field is None:
-                output_field = "_question_." + "-".join(
-                    question.lower().strip().split()
-                )
-                print(f"No output field is detected. Setting to {output_field}")
-
-            workflow = SequentialWorkflow(
-                list_of_operations=[
-                    Input([input_field], filters=filters),
-                    bulk_question_answer,
-                    Output(output_field),
+        ops = QuestionAnswerOps(
+            credentials=self.credentials,
+            text_field=input_field,
+            questions=questions,
+            model_name=model_name,
+            batch_size=batch_size,
+        )
+        if output_field is not None:
+            if len(questions) == 1:
+                ops.output_fields = [output_field]
+            else:
+                ops.output_fields = [
+                    output_field + "." + "-".join(q.lower().strip().split())
+                    for q in questions
                 ]
+        if verbose:
+            for question, field in zip(questions, ops._get_output_fields()):
+                print(f"Answering `{question}` in {field}")
+
+        logger: ContextManager = nullcontext()
+        if log_to_file:
+            logger = FileLogger("workflow-run.txt", verbose=verbose)
+        with logger:
+            ops.run(
+                self,
+                filters=filters,
+                select_fields=[input_field],
+                chunksize=chunksize,
+                batched=True,
             )
-            workflow.run(self, verbose=verbose, log_to_file=log_to_file)
+        return ops
 
     # def summarize(
     #     self,
@@ -925,6 +943,56 @@ class Operations(Write, IO):
 
     advanced_search = search
 
+    @track
+    def bulk_search(
+        self,
+        queries: List[Dict],
+        mode: str = "vector",
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        return_stats: bool = False,
+    ):
+        """
+        Run many searches on this dataset concurrently, sending identical
+        queries once and caching results. See services.search.bulk_search.
+
+        Example
+        -----------
+
+        .. code-block::
+
+            from relevanceai import Client
+            client = Client()
+            ds = client.Dataset("sample")
+            results = ds.bulk_search(
+                [
+                    {"multivector_query": [{"vector": v, "fields": ["text_vector_"]}]}
+                    for v in query_vectors
+                ],
+                mode="vector",
+            )
+
+        Parameters
+        -----------
+        queries: list
+            The parameters of every search, without the dataset_id
+        mode: str
+            The search to run, e.g. vector, hybrid or semantic
+        max_workers: int
+            The number of searches to run at a time
+        use_cache: bool
+            If False, every unique query is sent and nothing is cached
+        return_stats: bool
+            If True, also return request counts, cache hits and latency percentiles
+        """
+        return self.services.search.bulk_search(
+            [{"dataset_id": self.dataset_id, **query} for query in queries],
+            mode=mode,
+            max_workers=max_workers,
+            use_cache=use_cache,
+            return_stats=return_stats,
+        )
+
     @track
     def list_deployables(self):
         """
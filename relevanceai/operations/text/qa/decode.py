@@ -0,0 +1,66 @@
+"""
+Span decoding for extractive question answering. This only needs numpy so
+that it can be used (and tested) without transformers.
+"""
+import numpy as np
+
+from typing import Tuple
+
+
+def _masked_softmax(logits: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    logits = np.where(mask, logits, -np.inf)
+    logits = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=1, keepdims=True)
+
+
+def decode_spans(
+    start_logits: np.ndarray,
+    end_logits: np.ndarray,
+    context_mask: np.ndarray,
+    max_answer_length: int = 30,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    The most likely answer span of every row of a batch, all at once.
+
+    Like the transformers question-answering pipeline, start and end scores
+    are a softmax over the context tokens and the first ([CLS]) token, and
+    a span's score is the product of its start and end probabilities. Spans
+    must lie in the context, end after they start and be at most
+    `max_answer_length` tokens long.
+
+    Parameters
+    ----------
+    start_logits: np.ndarray
+        (batch, length) logits of each token starting the answer
+    end_logits: np.ndarray
+        (batch, length) logits of each token ending the answer
+    context_mask: np.ndarray
+        (batch, length) True for tokens in the context
+    max_answer_length: int
+        The longest answer in tokens
+
+    Returns
+    -------
+    The start token, end token and score of the best span of every row.
+    """
+    context_mask = np.asarray(context_mask, dtype=bool)
+    softmax_mask = context_mask.copy()
+    softmax_mask[:, 0] = True
+    start_probs = np.where(
+        context_mask, _masked_softmax(np.asarray(start_logits), softmax_mask), 0.0
+    ).astype(np.float32)
+    end_probs = np.where(
+        context_mask, _masked_softmax(np.asarray(end_logits), softmax_mask), 0.0
+    ).astype(np.float32)
+
+    length = context_mask.shape[1]
+    upper = np.ones((length, length), dtype=bool)
+    # end >= start and end < start + max_answer_length
+    band = np.triu(upper) & ~np.triu(upper, k=max_answer_length)
+    spans = (start_probs[:, :, None] * end_probs[:, None, :] * band).reshape(
+        len(context_mask), -1
+    )
+    best = spans.argmax(axis=1)
+    starts, ends = np.divmod(best, length)
+    return starts, ends, spans[np.arange(len(spans)), best]
@@ -8,7 +8,14 @@ try:
 except:
     raise MissingPackageError("transformers[sentencepiece]")
 
+import numpy as np
+
+from typing import Dict, List, Optional
+
 from relevanceai.operations.base import BaseOps
+from relevanceai.operations.text.qa.decode import decode_spans
+
+EMPTY_ANSWER = {"score": 0.0, "start": 0, "end": 0, "answer": ""}
 
 
 class QAOps(BaseOps):
@@ -16,15 +23,139 @@ class QAOps(BaseOps):
     QAOps
     """
 
-    def __init__(self, model_name: str = "mrm8488/deberta-v3-base-finetuned-squadv2"):
+    def __init__(
+        self,
+        model_name: str = "mrm8488/deberta-v3-base-finetuned-squadv2",
+        batch_size: int = 32,
+        max_length: int = 384,
+        stride: int = 128,
+        max_answer_length: int = 30,
+    ):
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.stride = stride
+        self.max_answer_length = max_answer_length
         self.qa_model = pipeline("question-answering", model=model_name)
 
     def question_answer(self, question: str, context: str):
         output = self.qa_model(question=question, context=context)
         return {"answer": output["answer"], "score": output["score"]}
 
-    def bulk_question_answer(self, question, contexts):
-        return [
-            self.qa_model(question=question, context=context) for context in contexts
+    def bulk_question_answer(
+        self, question: str, contexts: List[str], batch_size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Answer a question against many contexts at once. The question is
+        tokenized against every context in one call. Long contexts are split
+        into windows of `max_length` tokens that overlap by `stride`. The
+        windows are sorted by length and run through the model in padded
+        batches, and the best span in each window is decoded for the whole
+        batch at once. Every context gets the best answer of its windows.
+
+        Parameters
+        ----------
+        question: str
+            The question to ask
+        contexts: list
+            The texts to find answers in. Empty contexts get an empty answer.
+        batch_size: int
+            Number of windows to run through the model at a time
+
+        Returns
+        -------
+        A dictionary with the answer, its score and its start and end
+        characters for every context, like the question-answering pipeline.
+        """
+        import torch
+
+        batch_size = self.batch_size if batch_size is None else batch_size
+        tokenizer = self.qa_model.tokenizer
+        model = self.qa_model.model
+        if not tokenizer.is_fast:
+            # Character offsets of tokens need a fast tokenizer
+            return [
+                self.qa_model(question=question, context=context)
+                for context in contexts
+            ]
+
+        results = [dict(EMPTY_ANSWER) for _ in contexts]
+        indices = [
+            i for i, c in enumerate(contexts) if isinstance(c, str) and c.strip()
         ]
+        if len(indices) == 0:
+            return results
+        texts = [contexts[i] for i in indices]
+        questions = [question] * len(texts)
+
+        # Some models pad (and put the context) on the left
+        pad_on_right = tokenizer.padding_side == "right"
+        context_index = 1 if pad_on_right else 0
+        encodings = tokenizer(
+            questions if pad_on_right else texts,
+            texts if pad_on_right else questions,
+            truncation="only_second" if pad_on_right else "only_first",
+            max_length=self.max_length,
+            stride=self.stride,
+            return_overflowing_tokens=True,
+            return_offsets_mapping=True,
+        )
+        sample_mapping = encodings["overflow_to_sample_mapping"]
+        offsets = encodings["offset_mapping"]
+        input_names = [k for k in tokenizer.model_input_names if k in encodings]
+        number_of_windows = len(encodings["input_ids"])
+        context_masks = [
+            np.array([s == context_index for s in encodings.sequence_ids(w)])
+            for w in range(number_of_windows)
+        ]
+
+        # Windows of similar length are batched together to reduce padding
+        order = sorted(range(number_of_windows), key=lambda w: len(context_masks[w]))
+        best: Dict[int, tuple] = {}
+        for i in range(0, number_of_windows, batch_size):
+            batch = order[i : i + batch_size]
+            inputs = tokenizer.pad(
+                [{k: encodings[k][w] for k in input_names} for w in batch],
+                return_tensors="pt",
+            ).to(model.device)
+            with torch.no_grad():
+                outputs = model(**inputs)
+            start_logits = outputs.start_logits.float().cpu().numpy()
+            end_logits = outputs.end_logits.float().cpu().numpy()
+
+            context_mask = np.zeros(start_logits.shape, dtype=bool)
+            for row, w in enumerate(batch):
+                mask = context_masks[w]
+                if pad_on_right:
+                    context_mask[row, : len(mask)] = mask
+                else:
+                    context_mask[row, len(context_mask[row]) - len(mask) :] = mask
+            starts, ends, scores = decode_spans(
+                start_logits, end_logits, context_mask, self.max_answer_length
+            )
+
+            for row, w in enumerate(batch):
+                sample = sample_mapping[w]
+                if sample not in best or scores[row] > best[sample][0]:
+                    padding = (
+                        0
+                        if pad_on_right
+                        else context_mask.shape[1] - len(context_masks[w])
+                    )
+                    best[sample] = (
+                        scores[row],
+                        w,
+                        starts[row] - padding,
+                        ends[row] - padding,
+                    )
+
+        for sample, (score, w, start, end) in best.items():
+            start_char = offsets[w][start][0]
+            end_char = offsets[w][end][1]
+            results[indices[sample]] = {
+                "score": float(score),
+                "start": int(start_char),
+                "end": int(end_char),
+                "answer": texts[sample][start_char:end_char],
+            }
+        return results
@@ -3,15 +3,25 @@
 
 # Running a function across each subcluster
 import numpy as np
-import csv
-from typing import Optional
-from urllib.request import urlopen
+from typing import Any, Dict, List, Optional
 from relevanceai.constants.errors import MissingPackageError
+from relevanceai.constants.labels import TWEETEVAL_LABELS
 from relevanceai.operations.base import BaseOps
 
 
 class SentimentOps(BaseOps):
-    def __init__(self, model_name: str = "cardiffnlp/twitter-roberta-base-sentiment"):
+    # Class defaults so that subclasses which skip __init__ still have them
+    batch_size: int = 32
+    shap_max_evals: int = 200
+    shap_batch_size: int = 32
+
+    def __init__(
+        self,
+        model_name: str = "cardiffnlp/twitter-roberta-base-sentiment",
+        batch_size: int = 32,
+        shap_max_evals: int = 200,
+        shap_batch_size: int = 32,
+    ):
         """
         Sentiment Ops.
 
@@ -20,9 +30,18 @@ class SentimentOps(BaseOps):
 
         model_name: str
             The name of the model
+        batch_size: int
+            Number of texts to classify at a time
+        shap_max_evals: int
+            The most times SHAP can call the model to explain one text
+        shap_batch_size: int
+            Number of masked texts SHAP sends to the model at a time
 
         """
         self.model_name = model_name
+        self.batch_size = batch_size
+        self.shap_max_evals = shap_max_evals
+        self.shap_batch_size = shap_batch_size
 
     def preprocess(self, text: str):
         new_text = []
@@ -40,7 +59,7 @@ class SentimentOps(BaseOps):
             self._classifier = transformers.pipeline(
                 "sentiment-analysis",
                 return_all_scores=True,
-                model="cardiffnlp/twitter-roberta-base-sentiment",
+                model=self.model_name,
             )
         return self._classifier
 
@@ -54,22 +73,19 @@ class SentimentOps(BaseOps):
         self.classifier = transformers.pipeline(
             "sentiment-analysis",
             return_all_scores=True,
-            model="cardiffnlp/twitter-roberta-base-sentiment",
+            model=self.model_name,
         )
 
     def _get_label_mapping(self, task: str):
         # Note: this is specific to the current model
-        labels = []
-        mapping_link = f"https://raw.githubusercontent.com/cardiffnlp/tweeteval/main/datasets/{task}/mapping.txt"
-        with urlopen(mapping_link) as f:
-            html = f.read().decode("utf-8").split("\n")
-            csvreader = csv.reader(html, delimiter="\t")
-        labels = [row[1] for row in csvreader if len(row) > 1]
-        return labels
+        return list(TWEETEVAL_LABELS[task])
 
     @property
     def label_mapping(self):
-        return {"LABEL_0": "negative", "LABEL_1": "neutral", "LABEL_2": "positive"}
+        return {
+            f"LABEL_{i}": label
+            for i, label in enumerate(self._get_label_mapping("sentiment"))
+        }
 
     def analyze_sentiment(
         self,
@@ -79,35 +95,101 @@ class SentimentOps(BaseOps):
         max_number_of_shap_documents: Optional[int] = None,
         min_abs_score: float = 0.1,
     ):
-        labels = self.classifier([text])
-        ind_max = np.argmax([l["score"] for l in labels[0]])
-        sentiment = labels[0][ind_max]["label"]
-        max_score = labels[0][ind_max]["score"]
-        sentiment = self.label_mapping.get(sentiment, sentiment)
-        if sentiment == "neutral":
-            overall_sentiment = 0
-        else:
-            overall_sentiment = (
-                max_score if sentiment == positive_sentiment_name else -max_score
-            )
-        if not highlight:
-            return {
-                "sentiment": sentiment,
-                "score": max_score,
-                "overall_sentiment": overall_sentiment,
-            }
-        shap_documents = self.get_shap_values(
-            text,
-            sentiment_ind=ind_max,
+        return self.analyze_sentiment_batch(
+            [text],
+            highlight=highlight,
+            positive_sentiment_name=positive_sentiment_name,
             max_number_of_shap_documents=max_number_of_shap_documents,
             min_abs_score=min_abs_score,
+        )[0]
+
+    def _classify(self, texts: List[str]):
+        """The labels and an (n_texts, n_labels) array of their scores"""
+        # Texts of similar length are batched together to reduce padding
+        order = np.argsort([len(t) for t in texts], kind="stable")
+        outputs = self.classifier(
+            [texts[i] for i in order], batch_size=self.batch_size, truncation=True
         )
-        return {
-            "sentiment": sentiment,
-            "score": max_score,
-            "overall_sentiment": overall_sentiment,
-            "highlight_chunk_": shap_documents,
-        }
+        labels = [l["label"] for l in outputs[0]]
+        scores = np.empty((len(texts), len(labels)))
+        scores[order] = [[l["score"] for l in output] for output in outputs]
+        return labels, scores
+
+    def analyze_sentiment_batch(
+        self,
+        texts: List[str],
+        highlight: bool = False,
+        positive_sentiment_name: str = "positive",
+        max_number_of_shap_documents: Optional[int] = None,
+        min_abs_score: float = 0.1,
+        max_number_of_highlighted_texts: Optional[int] = 32,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze the sentiment of many texts at once. Texts are classified in
+        padded batches of `batch_size`.
+
+        If `highlight` is True, SHAP explains what is causing the sentiment.
+        This is much slower than classifying, so only the
+        `max_number_of_highlighted_texts` texts with the strongest sentiment
+        are explained, in a single SHAP call bounded by `shap_max_evals` and
+        `shap_batch_size`.
+
+        Parameters
+        ----------
+        texts: list
+            The texts to analyze
+        highlight: bool
+            If True, add the words that cause the sentiment under highlight_chunk_
+        positive_sentiment_name: str
+            The label whose score counts towards a positive overall_sentiment
+        max_number_of_shap_documents: int
+            The most words to highlight in a text
+        min_abs_score: float
+            The minimum absolute SHAP score for a word to be highlighted
+        max_number_of_highlighted_texts: int
+            The most texts to explain. If None, every text is explained.
+        """
+        texts = ["" if t is None else t for t in texts]
+        if len(texts) == 0:
+            return []
+        labels, scores = self._classify(texts)
+        label_indices = scores.argmax(axis=1)
+        max_scores = scores[np.arange(len(texts)), label_indices]
+        sentiments = np.array([self.label_mapping.get(l, l) for l in labels])[
+            label_indices
+        ]
+        overall_sentiments = np.where(
+            sentiments == "neutral",
+            0,
+            np.where(sentiments == positive_sentiment_name, max_scores, -max_scores),
+        )
+        results: List[Dict[str, Any]] = [
+            {
+                "sentiment": str(sentiments[i]),
+                "score": float(max_scores[i]),
+                "overall_sentiment": float(overall_sentiments[i]),
+            }
+            for i in range(len(texts))
+        ]
+        if not highlight:
+            return results
+
+        highlighted = np.argsort(-np.abs(overall_sentiments), kind="stable")
+        if max_number_of_highlighted_texts is not None:
+            highlighted = highlighted[:max_number_of_highlighted_texts]
+        shap_values = self.explainer(
+            [texts[i] for i in highlighted],
+            max_evals=self.shap_max_evals,
+            batch_size=self.shap_batch_size,
+        )
+        for j, i in enumerate(highlighted):
+            results[i]["highlight_chunk_"] = self._get_shap_documents(
+                shap_values[j].data,
+                shap_values[j].values[:, label_indices[i]],
+                max_number_of_shap_documents=max_number_of_shap_documents,
+                min_abs_score=min_abs_score,
+            )
+        return results
 
     @property
     def explainer(self):
@@ -121,6 +203,19 @@ class SentimentOps(BaseOps):
             self._explainer = shap.Explainer(self.classifier)
             return self._explainer
 
+    def _get_shap_documents(
+        self,
+        tokens,
+        scores,
+        max_number_of_shap_documents: Optional[int] = None,
+        min_abs_score: float = 0.1,
+    ):
+        shap_docs = [{"text": t, "score": float(s)} for t, s in zip(tokens, scores)]
+        sorted_scores = sorted(shap_docs, key=lambda x: x["score"], reverse=True)[
+            :max_number_of_shap_documents
+        ]
+        return [d for d in sorted_scores if abs(d["score"]) > min_abs_score]
+
     def get_shap_values(
         self,
         text: str,
@@ -129,26 +224,15 @@ class SentimentOps(BaseOps):
         min_abs_score: float = 0.1,
     ):
         """Get SHAP values"""
-        shap_values = self.explainer([text])
-        cohorts = {"": shap_values}
-        cohort_labels = list(cohorts.keys())
-        cohort_exps = list(cohorts.values())
-        features = cohort_exps[0].data
-        feature_names = cohort_exps[0].feature_names
-        values = np.array([cohort_exps[i].values for i in range(len(cohort_exps))])
-        shap_docs = [
-            {"text": v, "score": f}
-            for f, v in zip(
-                [x[sentiment_ind] for x in values[0][0].tolist()], feature_names[0]
-            )
-        ]
-        if max_number_of_shap_documents is not None:
-            sorted_scores = sorted(shap_docs, key=lambda x: x["score"], reverse=True)
-        else:
-            sorted_scores = sorted(shap_docs, key=lambda x: x["score"], reverse=True)[
-                :max_number_of_shap_documents
-            ]
-        return [d for d in sorted_scores if abs(d["score"]) > min_abs_score]
+        shap_values = self.explainer(
+            [text], max_evals=self.shap_max_evals, batch_size=self.shap_batch_size
+        )
+        return self._get_shap_documents(
+            shap_values[0].data,
+            shap_values[0].values[:, sentiment_ind],
+            max_number_of_shap_documents=max_number_of_shap_documents,
+            min_abs_score=min_abs_score,
+        )
 
     # def analyze_sentiment(self, text, highlight:bool= True):
     #     try:
@@ -28,9 +28,8 @@ You can find out more about different types of TripletLoss on https://www.sbert.
 import os
 import json
 import random
-import copy
 import logging
-from typing import List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 try:
     from sentence_transformers import (
@@ -53,6 +52,8 @@ except ModuleNotFoundError:
 from relevanceai.operations.base import BaseOps
 from relevanceai._api.api_client import APIClient
 from relevanceai.client.helpers import Credentials
+from relevanceai.utils.doc_utils.field_path import get_field_path
+from relevanceai.utils.sampling import ReservoirSampler
 
 
 class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
@@ -98,35 +99,50 @@ class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
         )
 
     @staticmethod
-    def build_triple_data(text_data, labels):
+    def build_triple_data(
+        text_data: Iterable[str],
+        labels: Iterable[Any],
+        n: int = 2,
+        sample_size_per_label: int = 100,
+        random_state: Optional[int] = None,
+    ):
         # Only used for evaluation
         # anchors: Sentences to check similarity to
         # positives: List of positive sentences
         # negatives:  List of negative sentences
-
-        n = 2  # ToDo: add checks, so that n can be an argument
-        label_data_dict = {l: set() for l in set(labels)}
+        # text_data and labels are streamed, only a reservoir sample of
+        # sample_size_per_label texts is kept for every label.
+        if sample_size_per_label < 2 * n + 1:
+            raise ValueError("sample_size_per_label must be at least 2 * n + 1")
+        rng = random.Random(random_state)
+        samplers: Dict[Any, ReservoirSampler] = {}
         for d, l in zip(text_data, labels):
-            label_data_dict[l].add(d)
-        label_data_dict = {l: list(label_data_dict[l]) for l in label_data_dict}
-        all_cls = copy.deepcopy(label_data_dict)
-        all_cls = list(all_cls.keys())
-        for l in all_cls:
-            if len(label_data_dict[l]) < 2 * n + 1:
-                del label_data_dict[l]
+            if l not in samplers:
+                samplers[l] = ReservoirSampler(
+                    sample_size_per_label, random_state=rng.getrandbits(32)
+                )
+            samplers[l].add(d)
+
+        label_data_dict = {}
+        for l, sampler in samplers.items():
+            texts = list(dict.fromkeys(sampler.sample))
+            if len(texts) >= 2 * n + 1:
+                label_data_dict[l] = texts
 
         anchors = []
         positives = []
         negatives = []
-        for l in label_data_dict:
-            neg_list = list(label_data_dict.keys())
-            neg_list.remove(l)
+        labels_with_data = list(label_data_dict)
+        for l in labels_with_data:
+            neg_list = [nl for nl in labels_with_data if nl != l]
+            if len(neg_list) == 0:
+                continue
             anchors.extend(label_data_dict[l][:n])
-            for idx in random.sample([j for j in range(n, len(label_data_dict[l]))], n):
+            for idx in rng.sample(range(n, len(label_data_dict[l])), n):
                 positives.append(label_data_dict[l][idx])
-            for nl in random.sample(neg_list, n):
-                idx = random.choice([j for j in range(n, len(label_data_dict[nl]))])
-                negatives.append(label_data_dict[nl][idx])
+            for _ in range(n):
+                nl = rng.choice(neg_list)
+                negatives.append(rng.choice(label_data_dict[nl][n:]))
         return anchors, positives, negatives
 
     def prepare_data_for_finetuning(self, text_data: List[str], labels: List[int]):
@@ -176,14 +192,23 @@ class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
         elif output_path:
             return SentenceTransformer(self.output_path)
 
-    def fetch_text_and_labels_from_dataset(self, text_field, label_field):
+    def fetch_text_and_labels_from_dataset(
+        self, text_field: str, label_field: str, chunksize: int = 1000
+    ):
         print("Fetching documents...")
-        docs = self.dataset.get_all_documents(select_fields=[text_field, label_field])
-        text_data = [doc[text_field] for doc in docs]
-        labels = [self.client.get_field(label_field, doc) for doc in docs]
-        labels_cls = set(labels)
-        label_maps = {cl: i for i, cl in enumerate(labels_cls)}
-        labels = [label_maps[l] for l in labels]
+        text_path = get_field_path(text_field)
+        label_path = get_field_path(label_field)
+        text_data: List[str] = []
+        labels: List[int] = []
+        label_maps: Dict[Any, int] = {}
+        for chunk in self.dataset.chunk_dataset(
+            select_fields=[text_field, label_field],
+            chunksize=chunksize,
+            include_vector=False,
+        ):
+            text_data.extend(text_path.get_many(chunk))
+            for label in label_path.get_many(chunk):
+                labels.append(label_maps.setdefault(label, len(label_maps)))
         return text_data, labels
 
     def run(
@@ -193,6 +218,7 @@ class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
         epochs: int = 3,
         output_dir: str = "trained_model",
         percentage_for_dev: float = None,
+        chunksize: int = 1000,
     ):
         """
         Supervised finetuning a model using TripleLoss
@@ -221,11 +247,13 @@ class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
             The path of the output directory
         percentage_for_dev: float
             a number between 0 and 1 showing how much of the data should be used for evaluation. No evaluation if None
+        chunksize: int
+            The number of documents to fetch at a time
 
         """
 
         text_data, labels = self.fetch_text_and_labels_from_dataset(
-            text_field, label_field
+            text_field, label_field, chunksize=chunksize
         )
 
         if percentage_for_dev:
@@ -255,6 +283,7 @@ class SupervisedTripleLossFinetuneOps(APIClient, BaseOps):
         **kwargs,
     ):
         cls = self(
+            dataset=dataset,
             credentials=dataset.credentials,
             base_model=base_model,
             **kwargs,
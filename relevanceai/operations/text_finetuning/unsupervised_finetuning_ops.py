@@ -31,7 +31,7 @@ You can find out more about GPL from: https://github.com/UKPLab/gpl
 import os
 import json
 import logging
-from typing import List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 try:
     import gpl
@@ -71,14 +71,14 @@ class GPLOps(APIClient, BaseOps):
 
     def prepare_data_for_finetuning(
         self,
-        documents: List[dict],
+        documents: Iterable[Dict],
         text_field: str,
         dir_to_save_corpus: str,
         title_field: Optional[str] = None,
         corpus_filename: str = "corpus.jsonl",
     ):
-        # Writes a corpus in the format compatible to the GPL library to later make Pos/Neg pairs
-        corpus = []
+        # Writes a corpus in the format compatible to the GPL library to later make Pos/Neg pairs.
+        # Documents can be any iterable (e.g. streamed chunk by chunk) and are never held in memory.
         i = 0
         with open(f"{dir_to_save_corpus}/{corpus_filename}", "w") as jsonl:
             for doc in documents:
@@ -98,10 +98,10 @@ class GPLOps(APIClient, BaseOps):
                 # iteratively write lines to the JSON lines corpus.jsonl file
                 jsonl.write(json.dumps(line) + "\n")
                 i += 1
-                corpus.append(line)
         logging.info(
-            f"A corpus of {len(corpus)} documents is saved at {dir_to_save_corpus}/corpus.jsonl"
+            f"A corpus of {i} documents is saved at {dir_to_save_corpus}/{corpus_filename}"
         )
+        return i
 
     def fine_tune(
         self,
@@ -151,6 +151,7 @@ class GPLOps(APIClient, BaseOps):
         output_dir: str = "trained_model",
         dir_to_save_corpus: str = ".",
         do_evaluation: bool = False,
+        chunksize: int = 1000,
     ):
         """
         Finetune a model using Generative Pseudo-Labelling
@@ -186,16 +187,19 @@ class GPLOps(APIClient, BaseOps):
             The directory to save corpus
         do_evaluation: bool
             If True, it performs the evaluation
+        chunksize: int
+            The number of documents to fetch at a time while writing the corpus
 
         """
-        print("Fetching documents...")
-        docs = self._get_all_documents(
-            dataset_id=self._get_dataset_id(dataset), select_fields=[text_field]
+        print("Fetching documents and preparing training data...")
+        chunks = self._scan_documents(
+            dataset_id=self._get_dataset_id(dataset),
+            select_fields=[text_field],
+            chunksize=chunksize,
+            include_vector=False,
         )
-
-        print("Preparing training data...")
         self.prepare_data_for_finetuning(
-            documents=docs,
+            documents=(doc for chunk in chunks for doc in chunk),
             text_field=text_field,
             dir_to_save_corpus=dir_to_save_corpus,
         )
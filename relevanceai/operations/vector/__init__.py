@@ -2,3 +2,4 @@ from relevanceai.operations.vector.vectorize import VectorizeOps
 from relevanceai.operations.vector.search import SearchOps
 from relevanceai.operations.vector.base import Base2Vec
 from relevanceai.operations.vector.vectorizer import Vectorizer
+from relevanceai.operations.vector.local_index import LocalVectorIndex
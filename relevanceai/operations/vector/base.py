@@ -280,6 +280,21 @@ class Base2Vec(DocUtils):
             >>> chunk_docs = enc.encode_chunk_documents(chunk_field="value", fields=["text"], documents=chunk_docs)
 
         """
+        if hasattr(self, "bulk_encode") and vector_error_treatment == "zero_vector":
+            # Encode the chunks of every document together
+            chunk_documents = [d for d in documents if self.is_field(chunk_field, d)]
+            for f in fields:
+                self.run_function_across_chunks_batched(
+                    self.bulk_encode,
+                    chunk_field=chunk_field,
+                    field=f,
+                    output_field=self.get_default_vector_field_name(
+                        f, field_type="chunkvector"
+                    ),
+                    docs=chunk_documents,
+                )
+            return documents
+
         # Replace with case-switch in future
         for f in fields:
             [
@@ -0,0 +1,666 @@
+"""
+A local index of one vector field for nearest neighbour search without a
+network round trip per query.
+
+Example
+---------
+
+.. code-block::
+
+    from relevanceai import Client
+    from relevanceai.operations.vector import LocalVectorIndex
+
+    client = Client()
+    ds = client.Dataset("ecommerce")
+
+    index = LocalVectorIndex.from_dataset(
+        ds, vector_field="product_image_clip_vector_", fields=["brand", "price"]
+    )
+    cheap = [
+        {"field": "price", "filter_type": "numeric", "condition": "<", "condition_value": 50}
+    ]
+    results = index.search(query_vector, k=10, filters=cheap)
+
+    # Approximate search over 100 k-means lists, 8 of which are scored per query
+    index.train(number_of_lists=100)
+    results = index.search(query_vector, k=10, number_of_probes=8)
+
+    index.save("ecommerce_index")
+    index = LocalVectorIndex.load("ecommerce_index")  # memory-mapped
+
+"""
+import json
+import os
+
+import numpy as np
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from relevanceai.utils.doc_utils.field_path import get_field_path
+
+METRICS = ["cosine", "dot", "l2"]
+
+
+class LocalVectorIndex:
+    """
+    Vectors are kept in one float32 matrix. Exact search scores the matrix
+    in blocks of `block_size` rows with a matrix multiply and keeps the top
+    k of every block with `argpartition`, so the whole score matrix is never
+    materialised. After `train`, vectors are also assigned to the nearest of
+    `number_of_lists` k-means centroids (an IVF index) and only the lists
+    closest to a query are scored. If `use_faiss` is True, search is handed
+    to faiss instead.
+
+    Scalar fields stored alongside the vectors can be filtered on with the
+    same filters as the API.
+
+    Parameters
+    ----------
+    dimension: int
+        The number of dimensions of the vectors
+    metric: str
+        One of "cosine", "dot" or "l2"
+    block_size: int
+        The number of vectors to score at a time during exact search
+    use_faiss: bool
+        If True, search with faiss. Requires faiss to be installed.
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        metric: str = "cosine",
+        block_size: int = 65536,
+        use_faiss: bool = False,
+    ):
+        if metric not in METRICS:
+            raise ValueError(f"metric must be one of {METRICS}")
+        self.dimension = dimension
+        self.metric = metric
+        self.block_size = block_size
+        self.use_faiss = use_faiss
+
+        self.ids: List[str] = []
+        self.fields: Dict[str, List[Any]] = {}
+        self._vectors = np.zeros((0, dimension), dtype=np.float32)
+        self._size = 0
+        self._field_arrays: Dict[str, np.ndarray] = {}
+
+        self.centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int64)
+        self._list_order: Optional[np.ndarray] = None
+        self._list_offsets: Optional[np.ndarray] = None
+
+        self._faiss_index = None
+        self._faiss_quantizer = None
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        return self._vectors[: self._size]
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset,
+        vector_field: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        chunksize: int = 1000,
+        **kwargs,
+    ):
+        """
+        Build an index from a scan of one vector field of a dataset. Documents
+        without the vector field are skipped.
+
+        Parameters
+        ----------
+        dataset: Dataset
+            The dataset to read
+        vector_field: str
+            The vector field to index
+        fields: list
+            Scalar fields to store alongside the vectors for filtering
+        filters: list
+            Query for filtering the documents that are indexed
+        chunksize: int
+            The number of documents to read at a time
+        kwargs:
+            Passed to LocalVectorIndex
+        """
+        fields = [] if fields is None else fields
+        vector_path = get_field_path(vector_field)
+        field_paths = {field: get_field_path(field) for field in fields}
+        index = None
+        for chunk in dataset.chunk_dataset(
+            select_fields=[vector_field] + fields,
+            filters=filters,
+            chunksize=chunksize,
+        ):
+            vectors = vector_path.get_many(chunk, "return_none")
+            documents = [d for d, v in zip(chunk, vectors) if v is not None]
+            if len(documents) == 0:
+                continue
+            vectors = [v for v in vectors if v is not None]
+            if index is None:
+                index = cls(dimension=len(vectors[0]), **kwargs)
+            index.add(
+                ids=[d["_id"] for d in documents],
+                vectors=vectors,
+                fields={
+                    field: path.get_many(documents, "return_none")
+                    for field, path in field_paths.items()
+                },
+            )
+        if index is None:
+            raise ValueError(f"No documents with {vector_field} were found.")
+        return index
+
+    def add(
+        self,
+        ids: List[str],
+        vectors: Iterable,
+        fields: Optional[Dict[str, List[Any]]] = None,
+    ):
+        """
+        Add vectors to the index. If the index is trained, the new vectors
+        are assigned to their nearest list.
+
+        Parameters
+        ----------
+        ids: list
+            The _id of every vector
+        vectors: list or np.ndarray
+            A vector per _id
+        fields: dict
+            Scalar values per _id to filter on, by field name
+        """
+        prepared = self._prepare(vectors)
+        if len(ids) != len(prepared):
+            raise ValueError("There must be an _id for every vector.")
+        fields = {} if fields is None else fields
+        for field, values in fields.items():
+            if len(values) != len(ids):
+                raise ValueError(f"There must be a value of {field} for every vector.")
+
+        start, end = self._size, self._size + len(prepared)
+        if end > len(self._vectors) or not self._vectors.flags.writeable:
+            capacity = max(end, 2 * len(self._vectors), 1024)
+            grown = np.empty((capacity, self.dimension), dtype=np.float32)
+            grown[:start] = self._vectors[:start]
+            self._vectors = grown
+        self._vectors[start:end] = prepared
+        self._size = end
+
+        for field in set(self.fields) | set(fields):
+            if field not in self.fields:
+                self.fields[field] = [None] * start
+            self.fields[field].extend(fields.get(field, [None] * len(ids)))
+        self.ids.extend(ids)
+        self._field_arrays = {}
+
+        if self.is_trained:
+            self._assignments = np.concatenate(
+                [self._assignments, self._assign(prepared)]
+            )
+            self._list_order = None
+        if self._faiss_index is not None:
+            self._faiss_index.add(prepared)
+
+    def train(
+        self,
+        number_of_lists: Optional[int] = None,
+        sample_size: Optional[int] = None,
+        random_state: int = 0,
+    ):
+        """
+        Fit a k-means coarse quantizer and assign every vector to its nearest
+        centroid, so that search only scores the lists nearest to a query.
+
+        Parameters
+        ----------
+        number_of_lists: int
+            The number of k-means clusters. Defaults to sqrt(n).
+        sample_size: int
+            The number of vectors to fit k-means on. Defaults to 64 per list.
+        random_state: int
+            Seed for sampling and k-means
+        """
+        if number_of_lists is None:
+            number_of_lists = int(np.sqrt(self._size))
+        number_of_lists = max(1, min(number_of_lists, self._size))
+        if sample_size is None:
+            sample_size = 64 * number_of_lists
+        rng = np.random.RandomState(random_state)
+        sample = self.vectors
+        if sample_size < self._size:
+            rows = rng.choice(self._size, sample_size, replace=False)
+            sample = sample[np.sort(rows)]
+
+        if self.use_faiss:
+            faiss = self._import_faiss()
+            kmeans = faiss.Kmeans(
+                self.dimension,
+                number_of_lists,
+                niter=20,
+                seed=random_state,
+                spherical=self.metric == "cosine",
+            )
+            kmeans.train(np.ascontiguousarray(sample))
+            self.centroids = kmeans.centroids
+        else:
+            from sklearn.cluster import MiniBatchKMeans
+
+            kmeans = MiniBatchKMeans(
+                n_clusters=number_of_lists,
+                random_state=random_state,
+                batch_size=max(1024, 4 * number_of_lists),
+                n_init=1,
+            )
+            kmeans.fit(sample)
+            self.centroids = kmeans.cluster_centers_.astype(np.float32)
+        if self.metric == "cosine":
+            self.centroids = self._normalize(self.centroids)
+
+        self._assignments = np.concatenate(
+            [
+                self._assign(self.vectors[start : start + self.block_size])
+                for start in range(0, self._size, self.block_size)
+            ]
+            or [np.zeros(0, dtype=np.int64)]
+        )
+        self._list_order = None
+        self._faiss_index = None
+
+    def search(
+        self,
+        vectors,
+        k: int = 10,
+        filters: Optional[list] = None,
+        number_of_probes: Optional[int] = None,
+        exact: bool = False,
+        asc: bool = False,
+        include_fields: bool = True,
+    ):
+        """
+        Find the nearest neighbours of one or more query vectors.
+
+        Parameters
+        ----------
+        vectors: list or np.ndarray
+            A query vector, or a list of them
+        k: int
+            The number of neighbours to return per query
+        filters: list
+            Filters on the stored scalar fields
+        number_of_probes: int
+            The number of lists to score per query if the index is trained.
+            Defaults to 10% of the lists.
+        exact: bool
+            If True, score every vector even if the index is trained
+        asc: bool
+            If True, return the furthest vectors instead
+        include_fields: bool
+            If True, the stored scalar fields are returned with each result
+
+        Returns
+        -------
+        A list of results, each with `_id` and `_search_score`, or a list of
+        them for every query if several query vectors were given. Higher
+        scores are nearer, except for "l2" where the score is the distance.
+        """
+        queries = np.asarray(vectors, dtype=np.float32)
+        is_single_query = queries.ndim == 1
+        indices, scores = self.search_indices(
+            queries.reshape(1, -1) if is_single_query else queries,
+            k=k,
+            filters=filters,
+            number_of_probes=number_of_probes,
+            exact=exact,
+            asc=asc,
+        )
+        results = [
+            self._format_results(row_indices, row_scores, include_fields)
+            for row_indices, row_scores in zip(indices, scores)
+        ]
+        return results[0] if is_single_query else results
+
+    def search_indices(
+        self,
+        queries: np.ndarray,
+        k: int = 10,
+        filters: Optional[list] = None,
+        number_of_probes: Optional[int] = None,
+        exact: bool = False,
+        asc: bool = False,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Like search, but returns the row indices and scores of the neighbours
+        as (number of queries, k) arrays. Rows with fewer than k matches are
+        padded with -1 and NaN.
+        """
+        queries = self._prepare(queries)
+        mask = None if not filters else self._get_filter_mask(filters)
+        # Scores are ranked highest first, so negate them to find the furthest
+        sign = -1.0 if asc else 1.0
+
+        if self.use_faiss and mask is None and not asc:
+            indices, scores = self._faiss_search(queries, k, number_of_probes, exact)
+        elif self.is_trained and not exact:
+            indices, scores = self._ivf_search(queries, k, mask, sign, number_of_probes)
+        else:
+            indices, scores = self._exact_search(queries, k, mask, sign)
+
+        if self.metric == "l2":
+            scores = np.sqrt(np.maximum(-scores, 0))
+        return indices, scores
+
+    def save(self, directory: str):
+        """
+        Save the index to a directory. The vectors are saved as a .npy file
+        so that `load` can memory-map them.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "vectors.npy"), self.vectors)
+        if self.is_trained:
+            np.save(os.path.join(directory, "centroids.npy"), self.centroids)
+            np.save(os.path.join(directory, "assignments.npy"), self._assignments)
+        with open(os.path.join(directory, "index.json"), "w") as f:
+            json.dump(
+                {
+                    "dimension": self.dimension,
+                    "metric": self.metric,
+                    "block_size": self.block_size,
+                    "use_faiss": self.use_faiss,
+                    "ids": self.ids,
+                    "fields": self.fields,
+                },
+                f,
+            )
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True):
+        """
+        Load an index saved with `save`. If `mmap` is True, vectors are read
+        from disk as they are searched instead of being loaded into memory.
+        They are copied into memory if more vectors are added.
+        """
+        with open(os.path.join(directory, "index.json")) as f:
+            config = json.load(f)
+        index = cls(
+            dimension=config["dimension"],
+            metric=config["metric"],
+            block_size=config["block_size"],
+            use_faiss=config["use_faiss"],
+        )
+        mmap_mode = "r" if mmap else None
+        index._vectors = np.load(
+            os.path.join(directory, "vectors.npy"), mmap_mode=mmap_mode
+        )
+        index._size = len(index._vectors)
+        index.ids = config["ids"]
+        index.fields = config["fields"]
+        centroids_file = os.path.join(directory, "centroids.npy")
+        if os.path.exists(centroids_file):
+            index.centroids = np.load(centroids_file)
+            index._assignments = np.load(os.path.join(directory, "assignments.npy"))
+        return index
+
+    def _prepare(self, vectors) -> np.ndarray:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.dimension:
+            raise ValueError(f"Vectors must have {self.dimension} dimensions.")
+        if self.metric == "cosine":
+            vectors = self._normalize(vectors)
+        return vectors
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return (vectors / norms).astype(np.float32)
+
+    def _score(self, vectors: np.ndarray, queries: np.ndarray) -> np.ndarray:
+        """Scores of shape (len(queries), len(vectors)), higher is nearer"""
+        scores = queries @ vectors.T
+        if self.metric == "l2":
+            # -|v - q|^2 without materialising the differences
+            scores = (
+                2 * scores
+                - np.einsum("ij,ij->i", vectors, vectors)[None, :]
+                - np.einsum("ij,ij->i", queries, queries)[:, None]
+            )
+        return scores
+
+    @staticmethod
+    def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+        """Column indices of the k highest scores of every row, unsorted"""
+        if scores.shape[1] <= k:
+            return np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        return np.argpartition(-scores, k - 1, axis=1)[:, :k]
+
+    def _exact_search(
+        self, queries: np.ndarray, k: int, mask: Optional[np.ndarray], sign: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        number_of_queries = len(queries)
+        best_indices = np.zeros((number_of_queries, 0), dtype=np.int64)
+        best_scores = np.zeros((number_of_queries, 0), dtype=np.float32)
+        for start in range(0, self._size, self.block_size):
+            block = np.asarray(self.vectors[start : start + self.block_size])
+            scores = sign * self._score(block, queries)
+            if mask is not None:
+                scores[:, ~mask[start : start + len(block)]] = -np.inf
+            top = self._top_k(scores, k)
+            # Merge the block's top k with the best so far
+            candidate_scores = np.concatenate(
+                [best_scores, np.take_along_axis(scores, top, axis=1)], axis=1
+            )
+            candidate_indices = np.concatenate([best_indices, top + start], axis=1)
+            top = self._top_k(candidate_scores, k)
+            best_scores = np.take_along_axis(candidate_scores, top, axis=1)
+            best_indices = np.take_along_axis(candidate_indices, top, axis=1)
+        return self._sort_results(best_indices, best_scores, sign, k)
+
+    def _ivf_search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        mask: Optional[np.ndarray],
+        sign: float,
+        number_of_probes: Optional[int],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        centroids = self.centroids
+        assert centroids is not None
+        number_of_lists = len(centroids)
+        if number_of_probes is None:
+            number_of_probes = max(1, number_of_lists // 10)
+        number_of_probes = min(number_of_probes, number_of_lists)
+        if self._list_order is None or self._list_offsets is None:
+            self._list_order = np.argsort(self._assignments, kind="stable")
+            self._list_offsets = np.searchsorted(
+                self._assignments[self._list_order], np.arange(number_of_lists + 1)
+            )
+        list_order, list_offsets = self._list_order, self._list_offsets
+
+        probes = self._top_k(sign * self._score(centroids, queries), number_of_probes)
+        indices = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for row, lists in enumerate(probes):
+            rows = np.concatenate(
+                [list_order[list_offsets[l] : list_offsets[l + 1]] for l in lists]
+            )
+            if mask is not None:
+                rows = rows[mask[rows]]
+            if len(rows) == 0:
+                continue
+            rows.sort()
+            row_scores = sign * self._score(
+                np.asarray(self._vectors[rows]), queries[row : row + 1]
+            )
+            top = self._top_k(row_scores, k)[0]
+            indices[row, : len(top)] = rows[top]
+            scores[row, : len(top)] = row_scores[0, top]
+        return self._sort_results(indices, scores, sign, k)
+
+    @staticmethod
+    def _sort_results(
+        indices: np.ndarray, scores: np.ndarray, sign: float, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(-scores, axis=1, kind="stable")
+        scores = np.take_along_axis(scores, order, axis=1)
+        indices = np.take_along_axis(indices, order, axis=1)
+        # Pad queries with fewer than k matches
+        padding = k - indices.shape[1]
+        if padding > 0:
+            indices = np.pad(indices, ((0, 0), (0, padding)), constant_values=-1)
+            scores = np.pad(scores, ((0, 0), (0, padding)), constant_values=-np.inf)
+        missing = ~np.isfinite(scores)
+        indices[missing] = -1
+        scores = sign * scores.astype(np.float32)
+        scores[missing] = np.nan
+        return indices, scores
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(self._score(self.centroids, vectors), axis=1)
+
+    def _format_results(
+        self, indices: np.ndarray, scores: np.ndarray, include_fields: bool
+    ) -> List[Dict]:
+        results = []
+        for index, score in zip(indices, scores):
+            if index < 0:
+                break
+            result = {"_id": self.ids[index], "_search_score": float(score)}
+            if include_fields:
+                for field, values in self.fields.items():
+                    if values[index] is not None:
+                        result[field] = values[index]
+            results.append(result)
+        return results
+
+    def _get_field_array(self, field: str) -> np.ndarray:
+        if field not in self._field_arrays:
+            if field not in self.fields:
+                raise ValueError(
+                    f"{field} is not stored in the index, "
+                    "add it to `fields` to filter on it."
+                )
+            values = np.empty(self._size, dtype=object)
+            values[:] = self.fields[field]
+            self._field_arrays[field] = values
+        return self._field_arrays[field]
+
+    def _get_filter_mask(self, filters: list) -> np.ndarray:
+        """A boolean mask of the vectors matching every filter"""
+        mask = np.ones(self._size, dtype=bool)
+        for f in filters:
+            values = self._get_field_array(f["field"])
+            filter_type = f.get("filter_type", "exact_match")
+            condition = f.get("condition", "==")
+            condition_value = f.get("condition_value")
+            exists = np.array([v is not None for v in values], dtype=bool)
+
+            if filter_type == "exists":
+                matches = exists if condition == "==" else ~exists
+            elif filter_type in ["exact_match", "category", "categories", "text"]:
+                targets = (
+                    set(condition_value)
+                    if isinstance(condition_value, list)
+                    else {condition_value}
+                )
+                matches = np.array(
+                    [v in targets if e else False for v, e in zip(values, exists)],
+                    dtype=bool,
+                )
+                if condition == "!=":
+                    matches = ~matches
+            elif filter_type == "contains":
+                matches = np.array(
+                    [
+                        str(condition_value) in str(v) if e else False
+                        for v, e in zip(values, exists)
+                    ],
+                    dtype=bool,
+                )
+                if condition == "!=":
+                    matches = ~matches
+            elif filter_type in ["numeric", "date"]:
+                numbers = np.full(self._size, np.nan)
+                numbers[exists] = values[exists].astype(float)
+                with np.errstate(invalid="ignore"):
+                    matches = NUMERIC_CONDITIONS[condition](
+                        numbers, float(condition_value)
+                    )
+            else:
+                raise ValueError(f"Unsupported filter_type {filter_type}")
+            mask &= matches
+        return mask
+
+    @staticmethod
+    def _import_faiss():
+        try:
+            import faiss
+        except ModuleNotFoundError as e:
+            raise ModuleNotFoundError(
+                f"{e}\nInstall faiss\n pip install -U relevanceai[faiss]"
+            )
+        return faiss
+
+    def _faiss_search(
+        self,
+        queries: np.ndarray,
+        k: int,
+        number_of_probes: Optional[int],
+        exact: bool,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        faiss = self._import_faiss()
+        faiss_metric = (
+            faiss.METRIC_L2 if self.metric == "l2" else faiss.METRIC_INNER_PRODUCT
+        )
+        centroids = self.centroids
+        index = self._faiss_index
+        if index is None:
+            if centroids is not None:
+                # Reuse the k-means centroids as the coarse quantizer
+                quantizer = faiss.IndexFlat(self.dimension, faiss_metric)
+                quantizer.add(np.ascontiguousarray(centroids))
+                index = faiss.IndexIVFFlat(
+                    quantizer, self.dimension, len(centroids), faiss_metric
+                )
+                index.is_trained = True
+                self._faiss_quantizer = quantizer
+            else:
+                index = faiss.IndexFlat(self.dimension, faiss_metric)
+            for start in range(0, self._size, self.block_size):
+                end = min(start + self.block_size, self._size)
+                index.add(np.ascontiguousarray(self._vectors[start:end]))
+            self._faiss_index = index
+        if centroids is not None:
+            if exact:
+                number_of_probes = len(centroids)
+            elif number_of_probes is None:
+                number_of_probes = max(1, len(centroids) // 10)
+            index.nprobe = number_of_probes
+        scores, indices = index.search(np.ascontiguousarray(queries), k)
+        scores = scores.astype(np.float32)
+        if self.metric == "l2":
+            # faiss returns squared distances, make higher nearer
+            scores = -scores
+        scores[indices < 0] = -np.inf
+        return self._sort_results(indices.astype(np.int64), scores, 1.0, k)
+
+
+NUMERIC_CONDITIONS = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
@@ -2,8 +2,9 @@
 """
 import numpy as np
 import itertools
-from typing import List, Callable
+from typing import Dict, List, Callable, Optional
 from doc_utils import DocUtils
+from relevanceai.utils.cache import LRUCache
 
 
 class BaseExplainer(DocUtils):
@@ -13,6 +14,11 @@ class BaseExplainer(DocUtils):
 
     __name__ = ""
 
+    # Word combinations are encoded in batches of this size and the vectors
+    # of the most recently used texts are kept for each encoder
+    encode_batch_size: int = 256
+    encode_cache_size: int = 10000
+
     @classmethod
     def chunk(self, lst: List, chunksize: int):
         """
@@ -197,6 +203,54 @@ class BaseExplainer(DocUtils):
 
         return 1 - spatial.distance.cosine(vector_1, vector_2)
 
+    def get_cosine_similarities(self, vectors, query_vector) -> np.ndarray:
+        """Cosine similarity of every row of vectors to the query vector"""
+        vectors = np.asarray(vectors, dtype=float)
+        query_vector = np.asarray(query_vector, dtype=float)
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return vectors @ query_vector / norms
+
+    def _get_encode_cache(self, encode_fn: Callable) -> LRUCache:
+        if not hasattr(self, "_encode_caches"):
+            self._encode_caches: Dict[Callable, LRUCache] = {}
+        if encode_fn not in self._encode_caches:
+            self._encode_caches[encode_fn] = LRUCache(maxsize=self.encode_cache_size)
+        return self._encode_caches[encode_fn]
+
+    def encode_texts(
+        self,
+        encode_fn: Optional[Callable],
+        texts: List[str],
+        bulk_encode_fn: Optional[Callable] = None,
+    ) -> np.ndarray:
+        """
+        Encode texts and return a matrix with a row for each text. Each unique
+        text that is not in the cache is encoded once, in batches of
+        `encode_batch_size` if `bulk_encode_fn` is given.
+
+        Parameters:
+            encode_fn:
+                Encodes a single text
+            texts:
+                The texts to encode
+            bulk_encode_fn:
+                Encodes a list of texts. Used instead of encode_fn if given.
+        """
+        cache_fn = encode_fn if bulk_encode_fn is None else bulk_encode_fn
+        if cache_fn is None:
+            raise ValueError("Either encode_fn or bulk_encode_fn must be given")
+        cache = self._get_encode_cache(cache_fn)
+        vectors, missing = cache.get_many(texts)
+        for batch in self.chunk(missing, self.encode_batch_size):
+            if bulk_encode_fn is None:
+                batch_vectors = [cache_fn(text) for text in batch]
+            else:
+                batch_vectors = bulk_encode_fn(batch)
+            cache.set_many(zip(batch, batch_vectors))
+            vectors.update(zip(batch, batch_vectors))
+        return np.array([vectors[text] for text in texts], dtype=float)
+
     def get_word_combinations(self, sentence, maximum_span=5):
         for x in list(self.get_combinations(sentence.split(), maximum_span)):
             yield " ".join(x)
@@ -210,44 +264,78 @@ class BaseExplainer(DocUtils):
             "text": result_text,
         }
 
+    def _explain_texts(
+        self,
+        encode_fn: Optional[Callable],
+        query_vector,
+        result_texts: List[str],
+        maximum_span: int = 5,
+        bulk_encode_fn: Optional[Callable] = None,
+    ) -> List[dict]:
+        """Score every text and its word combinations against the query
+        vector, encoding all of them together"""
+        combinations = [
+            list(self.get_word_combinations(text, maximum_span=maximum_span))
+            for text in result_texts
+        ]
+        all_texts = list(result_texts) + [t for texts in combinations for t in texts]
+        vectors = self.encode_texts(encode_fn, all_texts, bulk_encode_fn)
+        scores = self.get_cosine_similarities(vectors, query_vector).tolist()
+
+        vector_field = self.get_default_vector_field_name("text")
+        results = []
+        offset = len(result_texts)
+        for i, (result_text, texts) in enumerate(zip(result_texts, combinations)):
+            explain_chunk = [
+                {
+                    "text": text,
+                    vector_field: vectors[offset + j].tolist(),
+                    "_search_score": scores[offset + j],
+                }
+                for j, text in enumerate(texts)
+            ]
+            offset += len(texts)
+            results.append(
+                {
+                    "_search_score": scores[i],
+                    "text": result_text,
+                    "explain_chunk": sorted(
+                        explain_chunk, key=lambda x: x["_search_score"], reverse=True
+                    ),
+                }
+            )
+        return results
+
     def explain_chunk(
         self,
         encode_fn: Callable,
         query_text,
         result_texts,
         maximum_span: int = 5,
+        bulk_encode_fn: Optional[Callable] = None,
     ):
-        query_vector = encode_fn(query_text)
-        cos_similarity = list()
-        for result_text in result_texts:
-            doc = self.get_result(encode_fn, result_text, query_vector)
-            doc["explain_chunk"] = [
-                {"text": t}
-                for t in self.get_word_combinations(
-                    result_text, maximum_span=maximum_span
-                )
-            ]
-            self.encode_documents(encode_fn, ["text"], doc["explain_chunk"])
-            for d in doc["explain_chunk"]:
-                d["_search_score"] = self.get_cosine_similarity(
-                    d[f"text_{self.__name__}_vector_"], query_vector
-                )
-            doc["explain_chunk"] = sorted(
-                doc["explain_chunk"], key=lambda x: x["_search_score"], reverse=True
-            )
-            cos_similarity.append(doc.copy())
-        return cos_similarity
+        query_vector = self.encode_texts(encode_fn, [query_text], bulk_encode_fn)[0]
+        return self._explain_texts(
+            encode_fn,
+            query_vector,
+            result_texts,
+            maximum_span=maximum_span,
+            bulk_encode_fn=bulk_encode_fn,
+        )
 
     def explain(
         self,
         encode_fn: Callable,
         query_text,
         answer_text,
+        bulk_encode_fn: Optional[Callable] = None,
     ):
-
-        query_vector = encode_fn(query_text)
+        query_vector = self.encode_texts(encode_fn, [query_text], bulk_encode_fn)[0]
         return self.explain_from_vector(
-            encode_fn=encode_fn, query_vector=query_vector, answer_text=answer_text
+            encode_fn=encode_fn,
+            query_vector=query_vector,
+            answer_text=answer_text,
+            bulk_encode_fn=bulk_encode_fn,
         )
 
     def explain_from_vector(
@@ -255,17 +343,25 @@ class BaseExplainer(DocUtils):
         encode_fn: Callable,
         query_vector,
         answer_text,
+        bulk_encode_fn: Optional[Callable] = None,
     ):
-        doc = self.get_result(encode_fn, answer_text, query_vector)
-        doc["explain_chunk"] = [
-            {"text": t} for t in self.get_word_combinations(answer_text)
-        ]
-        self.encode_documents(encode_fn, ["text"], doc["explain_chunk"])
-        for d in doc["explain_chunk"]:
-            d["_search_score"] = self.get_cosine_similarity(
-                d[f"text_{self.__name__}_vector_"], query_vector
-            )
-        doc["explain_chunk"] = sorted(
-            doc["explain_chunk"], key=lambda x: x["_search_score"], reverse=True
+        return self.explain_many_from_vector(
+            encode_fn=encode_fn,
+            query_vector=query_vector,
+            answer_texts=[answer_text],
+            bulk_encode_fn=bulk_encode_fn,
+        )[0]
+
+    def explain_many_from_vector(
+        self,
+        encode_fn: Callable,
+        query_vector,
+        answer_texts: List[str],
+        bulk_encode_fn: Optional[Callable] = None,
+    ) -> List[str]:
+        """Returns the word combination of each answer text that is most
+        similar to the query vector"""
+        results = self._explain_texts(
+            encode_fn, query_vector, answer_texts, bulk_encode_fn=bulk_encode_fn
         )
-        return doc["explain_chunk"][0]["text"]
+        return [r["explain_chunk"][0]["text"] for r in results]
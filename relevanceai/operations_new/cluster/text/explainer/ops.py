@@ -24,6 +24,7 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
         encode_fn,
         n_closest: int = 5,
         highlight_output_field="_explain_",
+        bulk_encode_fn=None,
     ):
 
         """
@@ -41,6 +42,9 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
             The number of closest documents to the centroid to explain
         highlight_output_field, optional
             The field that will be added to the document with the highlighted text.
+        bulk_encode_fn, optional
+            A function that encodes a list of texts. If given, the word combinations
+            of each cluster are encoded in a few batched calls instead of one at a time.
 
         .. code-block::
 
@@ -85,11 +89,14 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
             result_texts = self.get_field_across_documents(
                 text_field, results["results"]
             )
-            # Explain the first one
-            for i, r in enumerate(result_texts):
-                explained_answer = self.explain_from_vector(
-                    encode_fn, query_vector=query_vector, answer_text=r
-                )
+            # Explain all of them together
+            explained_answers = self.explain_many_from_vector(
+                encode_fn,
+                query_vector=query_vector,
+                answer_texts=result_texts,
+                bulk_encode_fn=bulk_encode_fn,
+            )
+            for i, explained_answer in enumerate(explained_answers):
                 results["results"][i][highlight_output_field] = {
                     text_field: explained_answer
                 }
@@ -123,6 +130,7 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
         encode_fn,
         n_closest: int = 5,
         highlight_output_field="_explain_",
+        bulk_encode_fn=None,
     ):
 
         """
@@ -142,6 +150,9 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
             The number of closest documents to the centroid to explain
         highlight_output_field, optional
             The field that will be added to the document with the highlighted text.
+        bulk_encode_fn, optional
+            A function that encodes a list of texts. If given, the word combinations
+            of each cluster are encoded in a few batched calls instead of one at a time.
         .. code-block::
             from relevanceai import Client
             client = Client()
@@ -182,7 +193,10 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
             )
             # Explain the first one
             explained_answer = self.explain(
-                encode_fn, query_text=result_texts[0], answer_text=query_text
+                encode_fn,
+                query_text=result_texts[0],
+                answer_text=query_text,
+                bulk_encode_fn=bulk_encode_fn,
             )
 
             # results["results"][0][highlight_output_field] = {
@@ -193,10 +207,14 @@ class TextClusterExplainerOps(BaseExplainer, OperationAPIBase):  # type: ignore
                 results["results"][0],
                 explained_answer,
             )
-            for i, r in enumerate(result_texts):
-                explained_answer = self.explain(
-                    encode_fn, query_text=query_text, answer_text=r
-                )
+            query_vector = self.encode_texts(encode_fn, [query_text], bulk_encode_fn)[0]
+            explained_answers = self.explain_many_from_vector(
+                encode_fn,
+                query_vector=query_vector,
+                answer_texts=result_texts,
+                bulk_encode_fn=bulk_encode_fn,
+            )
+            for i, explained_answer in enumerate(explained_answers):
                 split_text_fields = text_field.split(".")
                 # Here we want to store nested fields
                 # For example "value.check": "this is answer"
@@ -1,10 +1,14 @@
 """
 Build a co-occurrence network based on the documents in your dataset
 """
-import sys
-
 from collections import defaultdict
 import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import (
+    breadth_first_order,
+    connected_components,
+    minimum_spanning_tree,
+)
 from sklearn.cluster import AgglomerativeClustering
 from relevanceai.operations_new.transform_base import TransformBase
 from relevanceai.operations_new.processing.text.clean.transform import CleanTextTransform
@@ -93,116 +97,103 @@ class CoOccurNetTransform(TransformBase):
         for k, v in kwargs.items():
             setattr(self, k, v)
 
-    def find_max_vertex(self, visited, weights):
-        # Stores the index of max-weight vertex
-        # from set of unvisited vertices
-        index = -1
-
-        # Stores the maximum weight from
-        # the set of unvisited vertices
-        max_weight = -sys.maxsize
-
-        # Iterate over all possible
-        # Nodes of a graph
-        for i in range(self.number_of_concepts):
-            # If the current Node is unvisited
-            # and weight of current vertex is
-            # greater than max_weight
-            if visited[i] is False and weights[i] > max_weight:
-                # Update max_weight
-                max_weight = weights[i]
-                # Update index
-                index = i
-        return index
-
-    # Function to find the maximum spanning tree
     def maximum_spanning_tree(self, graph):
-        # visited[i]:Check if vertex i
-        # is visited or not
-        visited = [True] * self.number_of_concepts
-
-        # weights[i]: Stores maximum weight of
-        # graph to connect an edge with i
-        weights = [0] * self.number_of_concepts
-
-        # parent[i]: Stores the parent Node
-        # of vertex i
-        parent = [0] * self.number_of_concepts
-
-        # Initialize weights as -INFINITE,
-        # and visited of a Node as False
-        for i in range(self.number_of_concepts):
-            visited[i] = False
-            weights[i] = -sys.maxsize
-
-        # Include 1st vertex in
-        # maximum spanning tree
-        weights[0] = sys.maxsize
+        """
+        Returns the parent of every vertex in the maximum spanning tree of the
+        co-occurrence graph, with -1 for vertex 0. Vertices that are not
+        connected to vertex 0 hang off it directly.
+        """
+        graph = csr_matrix(graph, dtype=np.float64, copy=True)
+        graph.setdiag(0)
+        graph.eliminate_zeros()
+        number_of_vertices = graph.shape[0]
+
+        # Turn the largest co-occurrences into the smallest positive weights
+        # so that a minimum spanning tree keeps the strongest links
+        if graph.nnz > 0:
+            graph.data = graph.data.max() + 1 - graph.data
+        tree = minimum_spanning_tree(graph)
+
+        parent = np.zeros(number_of_vertices, dtype=int)
+        _, labels = connected_components(tree, directed=False)
+        for component in np.unique(labels):
+            root = int(np.flatnonzero(labels == component)[0])
+            order, predecessors = breadth_first_order(
+                tree, root, directed=False, return_predecessors=True
+            )
+            parent[order[1:]] = predecessors[order[1:]]
         parent[0] = -1
-
-        # Search for other (V-1) vertices
-        # and build a tree
-        for i in range(self.number_of_concepts - 1):
-
-            # Stores index of max-weight vertex
-            # from a set of unvisited vertex
-            max_vertex_index = self.find_max_vertex(visited, weights)
-
-            # Mark that vertex as visited
-            visited[max_vertex_index] = True
-
-            # Update adjacent vertices of
-            # the current visited vertex
-            for j in range(self.number_of_concepts):
-
-                # If there is an edge between j
-                # and current visited vertex and
-                # also j is unvisited vertex
-                if graph[j][max_vertex_index] != 0 and visited[j] == False:
-
-                    # If graph[v][x] is
-                    # greater than weight[v]
-                    if graph[j][max_vertex_index] > weights[j]:
-                        # Update weights[j]
-                        weights[j] = graph[j][max_vertex_index]
-
-                        # Update parent[j]
-                        parent[j] = max_vertex_index
-        return parent
+        return parent.tolist()
 
     def concurrence_matrix(self, top_ids, texts, word_dict):
-        word_count_mat = []
+        """Sparse matrix of how many texts each pair of top words appear in together"""
+        top_index = {id: i for i, id in enumerate(top_ids)}
+        rows = []
+        cols = []
         for i, text in enumerate(texts):
-            row = [0] * self.number_of_concepts
-            for word in text:
-                id = word_dict.word2id[word]
-                if id in top_ids:
-                    row[top_ids.index(id)] = 1
-            word_count_mat.append(row)
-        word_count_mat = np.array(word_count_mat)
-
-        return np.dot(word_count_mat.transpose(), word_count_mat)
-
-    def get_clusters_labels(self, mat):
-        labels = np.zeros((self.number_of_concepts, self.number_of_concepts), dtype=int)
-
-        for i in range(self.number_of_concepts):
-            labels[i, 0] = i
-        for i, merged in enumerate(
-                AgglomerativeClustering(affinity='precomputed', n_clusters=i, linkage='complete').fit(mat).children_):
-            new_id = i + self.number_of_concepts
-            for j in range(self.number_of_concepts):
-                if labels[j, i] in merged:
-                    labels[j, i + 1] = new_id
-                else:
-                    labels[j, i + 1] = labels[j, i]
-
-        for i in range(self.number_of_concepts):
-            unique_values = np.unique(labels[:, i])
-            label2label = dict(zip(unique_values, range(len(unique_values))))
-            for j, v in enumerate(labels[:, i]):
-                labels[j, i] = label2label[v]
-
+            positions = {
+                top_index[word_dict.word2id[word]]
+                for word in text
+                if word_dict.word2id[word] in top_index
+            }
+            rows.extend([i] * len(positions))
+            cols.extend(positions)
+        word_count_mat = coo_matrix(
+            (np.ones(len(rows), dtype=np.int64), (rows, cols)),
+            shape=(len(texts), len(top_ids)),
+        ).tocsr()
+
+        return (word_count_mat.T @ word_count_mat).tocsr()
+
+    def get_clusters_labels(self, co_occur_mat, cluster_numbers):
+        """
+        Cluster the words with complete linkage on how rarely they co-occur
+        and return the labels for each requested number of clusters.
+        """
+        number_of_vertices = co_occur_mat.shape[0]
+        # The top words almost all co-occur, so restricting the merges to a
+        # connectivity graph does not save memory and makes sklearn fall back
+        # to a much slower structured linkage
+        distances = co_occur_mat.diagonal().max() - co_occur_mat.toarray()
+
+        clustering_params = dict(linkage="complete", compute_full_tree=True)
+        # affinity was renamed to metric in scikit-learn 1.2
+        if "metric" in AgglomerativeClustering().get_params():
+            clustering_params["metric"] = "precomputed"
+        else:
+            clustering_params["affinity"] = "precomputed"
+        children = AgglomerativeClustering(**clustering_params).fit(distances).children_
+
+        # Replay the merges with a union-find, keeping only the labels that
+        # were asked for instead of a label column for every merge
+        union_parent = np.arange(number_of_vertices)
+
+        def find(i):
+            root = i
+            while union_parent[root] != root:
+                root = union_parent[root]
+            while union_parent[i] != root:
+                union_parent[i], i = root, union_parent[i]
+            return root
+
+        # Clusters are numbered in the order they were formed
+        cluster_id = np.arange(number_of_vertices)
+
+        def current_labels():
+            ids = cluster_id[[find(i) for i in range(number_of_vertices)]]
+            return np.unique(ids, return_inverse=True)[1]
+
+        representative = list(range(number_of_vertices))
+        labels = {}
+        for i, (left, right) in enumerate(children):
+            if number_of_vertices - i in cluster_numbers:
+                labels[number_of_vertices - i] = current_labels()
+            root = find(representative[left])
+            union_parent[find(representative[right])] = root
+            cluster_id[root] = number_of_vertices + i
+            representative.append(root)
+        if number_of_vertices - len(children) in cluster_numbers:
+            labels[number_of_vertices - len(children)] = current_labels()
         return labels
 
     def transform(self, documents, text_field='content', stopwords_list=[], center_word=None):
@@ -231,10 +222,14 @@ class CoOccurNetTransform(TransformBase):
             v = {'word': word_dict.id2word[id], 'rank': i, 'count': df_table.get(id)}
             vertexes.append(v)
 
-        labels = self.get_clusters_labels(co_occur_mat[0][0] - co_occur_mat)
-        for i in range(self.min_number_of_clusters, self.max_number_of_clusters + 1):
-            for j in range(self.number_of_concepts):
-                vertexes[j]['label_{}'.format(i)] = labels[j, self.number_of_concepts - i]
+        cluster_numbers = range(
+            self.min_number_of_clusters,
+            min(self.max_number_of_clusters, len(top_ids)) + 1,
+        )
+        labels = self.get_clusters_labels(co_occur_mat, cluster_numbers)
+        for i in cluster_numbers:
+            for j in range(len(top_ids)):
+                vertexes[j]["label_{}".format(i)] = int(labels[i][j])
 
         edges = []
         for sour, dest in enumerate(mst[1:]):
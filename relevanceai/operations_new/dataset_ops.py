@@ -37,10 +37,18 @@ class Operations(Write):
         filters: Optional[list] = None,
         chunksize: Optional[int] = 100,
         output_field: str = None,
+        sample_size: int = 10000,
+        model_path: Optional[str] = None,
+        refit: bool = False,
     ):
         """It takes a list of fields, a list of models, a list of filters, and a chunksize, and then runs
         the DimReductionOps class on the documents in the dataset
 
+        With batched=True the model is fitted once and then applied chunk by chunk so that
+        every document is reduced into the same space. Use model="ipca" to fit incrementally
+        over the whole dataset, other models are fitted on a random sample of sample_size documents.
+        The fitted model is saved locally and reused by later runs until refit=True.
+
         Parameters
         ----------
         fields : List[str]
@@ -51,6 +59,12 @@ class Operations(Write):
             A list of dictionaries, each dictionary containing a filter.
         chunksize : int, optional
             The number of documents to process at a time.
+        sample_size : int
+            The number of documents to fit non-incremental models on when batched
+        model_path : Optional[str]
+            Where to save the fitted model. Defaults to the relevanceai cache directory
+        refit : bool
+            If True, ignore any previously saved model and fit again
 
         Returns
         -------
@@ -69,6 +83,9 @@ class Operations(Write):
             model_kwargs=model_kwargs,
             alias=alias,
             output_field=output_field,
+            sample_size=sample_size,
+            model_path=model_path,
+            refit=refit,
         )
 
         res = ops.run(
@@ -655,11 +672,42 @@ class Operations(Write):
         filters: Optional[list] = None,
         batched: Optional[bool] = None,
         chunksize: Optional[int] = None,
+        sample_size: int = 10000,
+        refit: bool = False,
     ):
+        """Scale vector fields with statistics fitted over the whole dataset.
+
+        The statistics are computed in one streaming pass (running mean/variance and
+        min/max for scalers with partial_fit, a random sample of sample_size vectors for
+        quantile based scalers such as robust) and stored in the dataset metadata.
+        Every chunk is then scaled with the same frozen statistics. Later calls reuse the
+        stored statistics and only scale documents that have not been scaled yet,
+        unless refit=True.
+
+        Parameters
+        ----------
+        vector_fields : List[str]
+            The vector fields to scale
+        model : Optional[str]
+            The sklearn scaler to use, e.g. standard, minmax, maxabs or robust
+        alias : Optional[str]
+            The alias of the scaled vector fields
+        filters : Optional[list]
+            Filters for which documents to scale
+        batched : Optional[bool]
+            Whether to scale the documents chunk by chunk
+        chunksize : Optional[int]
+            The number of documents to process at a time
+        sample_size : int
+            The number of vectors quantile based scalers are fitted on
+        refit : bool
+            If True, recompute the statistics and rescale every document
+
+        """
 
         from relevanceai.operations_new.scaling.ops import ScaleOps
 
-        chunksize = chunksize if batched is None else batched
+        chunksize = 100 if chunksize is None else chunksize
         filters = [] if filters is None else filters
         batched = False if batched is None else batched
 
@@ -668,14 +716,22 @@ class Operations(Write):
             model=model,
             alias=alias,
             model_kwargs=model_kwargs,
+            sample_size=sample_size,
+            credentials=self.credentials,
         )
 
+        if refit or not ops.load_stats(self):
+            refit = True
+            ops.fit_dataset(self, filters=filters, chunksize=chunksize)
+
         ops.run(
             dataset=self,
             batched=batched,
             chunksize=chunksize,
             filters=filters,
             select_fields=vector_fields,
+            output_fields=ops.output_fields,
+            refresh=refit,
         )
         return ops
 
@@ -914,26 +970,77 @@ class Operations(Write):
         count: bool = True,
         verbose: bool = False,
         filters: list = None,
+        fused: bool = True,
+        chunksize: int = 20,
     ):
+        """
+        Vectorize, extract sentiment and count the text fields, then cluster and
+        subcluster the vectors.
+
+        With fused=True the per document steps (vectorizing, sentiment and counting)
+        share a single scan of the dataset. Each chunk goes through all of them and
+        one upsert per chunk sends the fields they changed. Clustering needs every
+        vector to fit on, so it runs afterwards.
+        """
         # is it worth separating
         # analyze text and analyze text vectors?
         if verbose:
             print("⚛️ Why can't you trust atoms?")
             print("Because they make up everything!")
 
-        if vectorize:
-            if vector_fields is None:
-                vector_fields = [text_field + "_vector_" for text_field in fields]
-                print(f"Outputting to: {vector_fields}")
-            self.vectorize_text(
+        if vectorize and vector_fields is None:
+            vector_fields = [text_field + "_vector_" for text_field in fields]
+            print(f"Outputting to: {vector_fields}")
+
+        if fused:
+            self._analyze_text_fused(
                 fields=fields,
-                models=vectorize_models,
+                vector_fields=vector_fields,
+                vectorize=vectorize,
+                vectorize_models=vectorize_models,
+                extract_sentiment=extract_sentiment,
+                count=count,
                 filters=filters,
-                output_fields=vector_fields,
+                chunksize=chunksize,
             )
+        else:
+            if vectorize:
+                self.vectorize_text(
+                    fields=fields,
+                    models=vectorize_models,
+                    filters=filters,
+                    output_fields=vector_fields,
+                )
+
+            if extract_sentiment:
+                print("Extracting sentiment...")
+                try:
+                    self.extract_sentiment(text_fields=fields, filters=filters)
+                except:
+                    pass
+
+            if count:
+                try:
+                    print("Extracting count...")
+                    self.count_text(
+                        text_fields=fields,
+                        count_words=True,
+                        count_characters=True,
+                        count_sentences=True,
+                        filters=filters,
+                    )
+                except:
+                    pass
+
+        if extract_emotion:
+            try:
+                print("Extracting emotion...")
+                raise NotImplementedError("Have not implemented emotion yet")
+            except:
+                pass
 
         try:
-            # Runs clustering and subclustering first
+            # Runs clustering and subclustering
             self.analyze_vectors(
                 vector_fields=vector_fields,
                 cluster=cluster,
@@ -948,35 +1055,75 @@ class Operations(Write):
         except:
             pass
 
-        if extract_emotion:
-            try:
-                print("Extracting emotion...")
-                raise NotImplementedError("Have not implemented emotion yet")
-            except:
-                pass
+        # TODO:
+        # Launch an explorer app with the right settings
+        return
+
+    def _analyze_text_fused(
+        self,
+        fields: list,
+        vector_fields: Optional[list],
+        vectorize: bool,
+        vectorize_models: Optional[list],
+        extract_sentiment: bool,
+        count: bool,
+        filters: Optional[list],
+        chunksize: int,
+    ):
+        """Runs the per document steps of analyze_text in one scan"""
+        from relevanceai.operations_new.fused import FusedOperation, FusedStage
+
+        stages = []
+        if vectorize:
+            from relevanceai.operations_new.vectorize.text.ops import VectorizeTextOps
+
+            vectorize_ops = VectorizeTextOps(
+                credentials=self.credentials,
+                fields=fields,
+                models=["all-mpnet-base-v2"]
+                if vectorize_models is None
+                else vectorize_models,
+                output_fields=vector_fields,
+            )
+            stages.append(
+                FusedStage(
+                    vectorize_ops,
+                    input_fields=fields,
+                    output_fields=vector_fields,
+                    # as vectorize_text, only vectorize what is missing
+                    skip_existing_outputs=True,
+                )
+            )
 
         if extract_sentiment:
-            print("Extracting sentiment...")
             try:
-                self.extract_sentiment(text_fields=fields, filters=filters)
-            except:
-                pass
+                from relevanceai.operations_new.sentiment.ops import SentimentOps
 
-        if count:
-            try:
-                print("Extracting count...")
-                self.count_text(
-                    text_fields=fields,
-                    count_words=True,
-                    count_characters=True,
-                    count_sentences=True,
-                    filters=filters,
+                sentiment_ops = SentimentOps(
+                    credentials=self.credentials, text_fields=fields
                 )
+                stages.append(FusedStage(sentiment_ops, input_fields=fields))
             except:
                 pass
-        # TODO:
-        # Launch an explorer app with the right settings
-        return
+
+        if count:
+            from relevanceai.operations_new.processing.text.count.ops import (
+                CountTextOps,
+            )
+
+            count_ops = CountTextOps(
+                credentials=self.credentials,
+                text_fields=fields,
+                include_char_count=True,
+                include_word_count=True,
+                include_sentence_count=True,
+            )
+            stages.append(FusedStage(count_ops, input_fields=fields))
+
+        if len(stages) == 0:
+            return
+        print(f"Running {', '.join(stage.name for stage in stages)} in one scan...")
+        return FusedOperation(stages).run(self, filters=filters, chunksize=chunksize)
 
     def analyze_vectors(
         self,
@@ -9,6 +9,11 @@ class DimReductionModelBase(ABC, DocUtils):
     model_name: str
     alias: Union[str, None]
 
+    # Models that can be fitted chunk by chunk with partial_fit
+    is_incremental: bool = False
+    # Models that can project vectors they were not fitted on
+    supports_transform: bool = False
+
     def vector_name(self, fields: List[str], output_field: str = None) -> str:
         if output_field is not None:
             return output_field
@@ -26,6 +31,16 @@ class DimReductionModelBase(ABC, DocUtils):
     def fit(self, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    def partial_fit(self, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Finish fitting after the last partial_fit"""
+        pass
+
+    def transform(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
     @abstractmethod
     def fit_transform(self, *args, **kwargs) -> Any:
         raise NotImplementedError
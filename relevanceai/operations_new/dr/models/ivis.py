@@ -15,6 +15,8 @@ except ModuleNotFoundError as e:
 
 
 class IvisModel(DimReductionModelBase):
+    supports_transform = True
+
     def __init__(
         self,
         n_components: int,
@@ -67,3 +69,23 @@ class IvisModel(DimReductionModelBase):
         self.model.fit(vectors)
         reduce_vectors = self.model.transform(vectors)
         return reduce_vectors.tolist()
+
+    def transform(
+        self,
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """It takes a list of vectors and projects them with the already fitted model
+
+        Parameters
+        ----------
+        vectors : List[List[float]]
+            List[List[float]]
+
+        Returns
+        -------
+            A list of lists of floats.
+
+        """
+
+        reduced_vectors = self.model.transform(np.array(vectors))
+        return reduced_vectors.tolist()
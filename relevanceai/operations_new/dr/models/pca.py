@@ -4,10 +4,12 @@ import numpy as np
 
 from relevanceai.operations_new.dr.models.base import DimReductionModelBase
 
-from sklearn.decomposition import PCA
+from sklearn.decomposition import PCA, IncrementalPCA
 
 
 class PCAModel(DimReductionModelBase):
+    supports_transform = True
+
     def __init__(
         self,
         n_components: int,
@@ -56,3 +58,69 @@ class PCAModel(DimReductionModelBase):
         vectors = np.array(vectors)
         reduced_vectors = self.model.fit_transform(vectors)
         return reduced_vectors.tolist()
+
+    def transform(
+        self,
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """It takes a list of vectors and projects them with the already fitted model
+
+        Parameters
+        ----------
+        vectors : List[List[float]]
+            List[List[float]]
+
+        Returns
+        -------
+            A list of lists of floats.
+
+        """
+
+        reduced_vectors = self.model.transform(np.array(vectors))
+        return reduced_vectors.tolist()
+
+
+class IncrementalPCAModel(PCAModel):
+    """PCA that is fitted chunk by chunk so the whole dataset never has to be
+    held in memory. Rows are buffered until there are at least `n_components`
+    of them, as IncrementalPCA requires for every partial_fit."""
+
+    is_incremental = True
+
+    def __init__(
+        self,
+        n_components: int,
+        alias: Union[str, None],
+        **kwargs,
+    ):
+        self.model = IncrementalPCA(n_components=n_components, **kwargs)
+        self.model_name = "ipca"
+        self.alias = alias
+        self._buffer: List[List[float]] = []
+
+    def partial_fit(
+        self,
+        vectors: Union[List[List[float]], np.ndarray],
+    ) -> None:
+        """It updates the model with another chunk of vectors.
+
+        Parameters
+        ----------
+        vectors : Union[List[List[float]], np.ndarray]
+            Union[List[List[float]], np.ndarray]
+
+        """
+        self._buffer.extend(np.asarray(vectors).tolist())
+        if len(self._buffer) >= self.model.n_components:
+            self.model.partial_fit(np.array(self._buffer))
+            self._buffer = []
+
+    def flush(self) -> None:
+        """Finish fitting. Fewer than `n_components` rows left over from the
+        last partial_fit cannot be fitted on their own, so they only count if
+        nothing else has been fitted yet."""
+        if not hasattr(self.model, "components_"):
+            if len(self._buffer) == 0:
+                raise ValueError("No vectors were provided to fit on.")
+            self.model.fit(np.array(self._buffer))
+        self._buffer = []
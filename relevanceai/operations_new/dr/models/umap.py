@@ -11,6 +11,8 @@ except ModuleNotFoundError as e:
 
 
 class UMAPModel(DimReductionModelBase):
+    supports_transform = True
+
     def __init__(
         self,
         n_components: int,
@@ -59,3 +61,23 @@ class UMAPModel(DimReductionModelBase):
         vectors = np.array(vectors)
         reduced_vectors = self.model.fit_transform(vectors)
         return reduced_vectors.tolist()
+
+    def transform(
+        self,
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """It takes a list of vectors and projects them with the already fitted model
+
+        Parameters
+        ----------
+        vectors : List[List[float]]
+            List[List[float]]
+
+        Returns
+        -------
+            A list of lists of floats.
+
+        """
+
+        reduced_vectors = self.model.transform(np.array(vectors))
+        return reduced_vectors.tolist()
@@ -1,7 +1,13 @@
-from typing import Optional
+import os
+import json
+import hashlib
 
+from typing import Any, Dict, Optional
+
+from relevanceai.dataset import Dataset
 from relevanceai.operations_new.ops_base import OperationAPIBase
 from relevanceai.operations_new.dr.transform import DimReductionTransform
+from relevanceai.utils.sampling import ReservoirSampler
 
 
 class DimReductionOps(DimReductionTransform, OperationAPIBase):
@@ -16,7 +22,10 @@ class DimReductionOps(DimReductionTransform, OperationAPIBase):
         n_components: int,
         model_kwargs: Optional[dict] = None,
         output_field: str = None,
-        **kwargs
+        sample_size: int = 10000,
+        model_path: Optional[str] = None,
+        refit: bool = False,
+        **kwargs,
     ):
         if model_kwargs is None:
             model_kwargs = {}
@@ -35,3 +44,136 @@ class DimReductionOps(DimReductionTransform, OperationAPIBase):
             alias=alias,
             **model_kwargs,
         )
+        self.n_components = n_components
+        self.model_kwargs = model_kwargs
+        self.sample_size = sample_size
+        self.model_path = model_path
+        self.refit = refit
+
+    def _get_model_config(self) -> Dict[str, Any]:
+        """Everything that changes the fitted model, a saved model is only
+        reused when this matches"""
+        config = {
+            "model": self.model.model_name,
+            "n_components": self.n_components,
+            "model_kwargs": self.model_kwargs,
+            "vector_fields": self.vector_fields,
+        }
+        return json.loads(json.dumps(config, sort_keys=True, default=str))
+
+    def _get_model_path(self) -> str:
+        """Where the fitted model for this dataset, output field and model
+        config is kept"""
+        if self.model_path is not None:
+            return self.model_path
+
+        from appdirs import user_cache_dir
+
+        reduced_vector_name = self.model.vector_name(
+            self.vector_fields, self.output_field
+        )
+        config_hash = hashlib.md5(
+            json.dumps(self._get_model_config(), sort_keys=True).encode()
+        ).hexdigest()[:10]
+        return os.path.join(
+            user_cache_dir("relevanceai"),
+            "dr",
+            getattr(self, "dataset_id", "default"),
+            f"{reduced_vector_name}-{self.model.model_name}-{config_hash}.joblib",
+        )
+
+    def save_model(self):
+        import joblib
+
+        path = self._get_model_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        joblib.dump({"config": self._get_model_config(), "model": self.model}, path)
+        print(f"Saved fitted model to {path}")
+
+    def load_model(self) -> bool:
+        """Load a previously fitted model. Returns False if there is none or
+        if it was fitted with a different model config."""
+        import joblib
+
+        path = self._get_model_path()
+        if not os.path.exists(path):
+            return False
+        saved = joblib.load(path)
+        if (
+            not isinstance(saved, dict)
+            or saved.get("config") != self._get_model_config()
+        ):
+            print(f"Model saved at {path} has a different config, refitting...")
+            return False
+        self.model = saved["model"]
+        self.is_fitted = True
+        print(f"Loaded fitted model from {path}")
+        return True
+
+    def fit_dataset(
+        self,
+        dataset: Dataset,
+        select_fields: list = None,
+        filters: list = None,
+        chunksize: int = None,
+    ):
+        """Fit the model once over the dataset without loading it all into
+        memory. Incremental models are fitted chunk by chunk, anything else
+        is fitted on a uniform sample of `sample_size` documents.
+        """
+        if not self.model.supports_transform:
+            raise ValueError(
+                f"{self.model.model_name} cannot project vectors it was not fitted on, run with batched=False instead."
+            )
+
+        select_fields = self.vector_fields if select_fields is None else select_fields
+        sampler = ReservoirSampler(self.sample_size)
+
+        print("Fitting...")
+        for chunk in dataset.chunk_dataset(
+            select_fields=select_fields,
+            filters=filters,
+            chunksize=chunksize,
+        ):
+            if self.model.is_incremental:
+                self.partial_fit(chunk)
+            else:
+                sampler.extend(self._get_concat_vectors(chunk))
+
+        if self.model.is_incremental:
+            self.model.flush()
+        else:
+            self.model.fit(sampler.sample)
+        self.is_fitted = True
+        self.save_model()
+
+    def batch_transform_upsert(
+        self,
+        dataset: Dataset,
+        select_fields: list = None,
+        filters: list = None,
+        chunksize: int = None,
+        *args,
+        **kwargs,
+    ):
+        """Fits the model once (or reuses the one saved by a previous run)
+        and then transforms the dataset chunk by chunk, so every chunk is
+        projected into the same space.
+        """
+        if not self.is_fitted and (self.refit or not self.load_model()):
+            self.fit_dataset(
+                dataset,
+                select_fields=select_fields,
+                filters=filters,
+                chunksize=chunksize,
+            )
+
+        print("Predicting...")
+        return super().batch_transform_upsert(
+            dataset,
+            select_fields,
+            filters,
+            chunksize,
+            *args,
+            **kwargs,
+        )
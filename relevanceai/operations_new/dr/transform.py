@@ -35,6 +35,7 @@ class DimReductionTransform(TransformBase):
             **model_kwargs,
         )
         self.output_field = output_field
+        self.is_fitted = False
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -85,6 +86,15 @@ class DimReductionTransform(TransformBase):
                 **kwargs,
             )
 
+        elif model in ["ipca", "incremental_pca"]:
+            from relevanceai.operations_new.dr.models.pca import IncrementalPCAModel
+
+            mapped_model = IncrementalPCAModel(
+                n_components=n_components,
+                alias=alias,
+                **kwargs,
+            )
+
         elif model == "ivis":
             from relevanceai.operations_new.dr.models.ivis import IvisModel
 
@@ -114,15 +124,16 @@ class DimReductionTransform(TransformBase):
 
         else:
             raise ValueError(
-                "relevanceai currently does not support this model as a string. the current supported models are [pca, tsne, umap, ivis]"
+                "relevanceai currently does not support this model as a string. the current supported models are [pca, ipca, tsne, umap, ivis]"
             )
         return mapped_model
 
-    def transform(
+    def _get_concat_vectors(
         self,
         documents: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
-
+    ) -> List[List[float]]:
+        """Concatenates the vector fields of each document, filling in
+        missing vectors with zeros"""
         concat_vectors: List[List[float]] = [[] for _ in range(len(documents))]
 
         for vector_field in self.vector_fields:
@@ -144,7 +155,26 @@ class DimReductionTransform(TransformBase):
                     vector = [0] * vector_length
                 concat_vector.extend(vector)
 
-        reduced_vectors = self.model.fit_transform(concat_vectors)
+        return concat_vectors
+
+    def partial_fit(
+        self,
+        documents: List[Dict[str, Any]],
+    ):
+        """Update an incremental model with another chunk of documents"""
+        self.model.partial_fit(self._get_concat_vectors(documents))
+
+    def transform(
+        self,
+        documents: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+
+        concat_vectors = self._get_concat_vectors(documents)
+
+        if self.is_fitted:
+            reduced_vectors = self.model.transform(concat_vectors)
+        else:
+            reduced_vectors = self.model.fit_transform(concat_vectors)
         reduced_vector_name = self.model.vector_name(
             self.vector_fields, self.output_field
         )
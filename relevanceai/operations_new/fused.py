@@ -0,0 +1,199 @@
+"""
+Run several transforms over a dataset in a single scan.
+
+Instead of every operation fetching the whole dataset and upserting its own
+results, the fields that all of the operations read are fetched once, each
+chunk is passed through every transform in dependency order and only the
+fields they changed are upserted, once per chunk.
+
+.. code-block::
+
+    from relevanceai.operations_new.fused import FusedOperation, FusedStage
+
+    fused = FusedOperation(
+        [
+            FusedStage(sentiment_ops, input_fields=["text"]),
+            FusedStage(count_ops, input_fields=["text"]),
+        ]
+    )
+    timings = fused.run(ds)
+
+"""
+import time
+import traceback
+
+from typing import Any, Dict, List, Optional
+
+from relevanceai.dataset import Dataset
+from relevanceai.utils import DocUtils
+
+
+class FusedStage:
+    """
+    A transform and the fields it reads and writes.
+
+    Parameters
+    ----------
+    operation: Any
+        Anything with a `transform(documents)` method, e.g. an Ops class
+    input_fields: List[str]
+        The fields the transform reads
+    output_fields: Optional[List[str]]
+        The fields the transform writes. Stages that read them run after this one.
+    skip_existing_outputs: bool
+        If True, documents that already have every output field are not
+        passed to this stage
+    """
+
+    def __init__(
+        self,
+        operation: Any,
+        input_fields: List[str],
+        output_fields: Optional[List[str]] = None,
+        skip_existing_outputs: bool = False,
+    ):
+        self.operation = operation
+        self.input_fields = input_fields
+        self.output_fields = [] if output_fields is None else output_fields
+        self.skip_existing_outputs = skip_existing_outputs
+
+    @property
+    def name(self) -> str:
+        return getattr(self.operation, "name", type(self.operation).__name__)
+
+
+class FusedOperation(DocUtils):
+    def __init__(self, stages: List[FusedStage]):
+        self.stages = self._order_stages(stages)
+
+    @staticmethod
+    def _order_stages(stages: List[FusedStage]) -> List[FusedStage]:
+        """Order the stages so that each one runs after the stages that write
+        the fields it reads, keeping the given order otherwise"""
+        remaining = list(stages)
+        ordered: List[FusedStage] = []
+        while remaining:
+            for stage in remaining:
+                depends_on_remaining = any(
+                    set(stage.input_fields) & set(other.output_fields)
+                    for other in remaining
+                    if other is not stage
+                )
+                if not depends_on_remaining:
+                    ordered.append(stage)
+                    remaining.remove(stage)
+                    break
+            else:
+                raise ValueError(
+                    "The stages read each other's outputs so they cannot be ordered."
+                )
+        return ordered
+
+    @property
+    def select_fields(self) -> List[str]:
+        """The union of the fields that the stages need to read"""
+        fields: List[str] = []
+        for stage in self.stages:
+            fields += stage.input_fields
+            if stage.skip_existing_outputs:
+                fields += stage.output_fields
+        return list(dict.fromkeys(fields))
+
+    @classmethod
+    def _merge(cls, document: Dict, update: Dict):
+        for key, value in update.items():
+            if isinstance(value, dict) and isinstance(document.get(key), dict):
+                cls._merge(document[key], value)
+            else:
+                document[key] = value
+
+    def transform(
+        self,
+        documents: List[Dict[str, Any]],
+        timings: Optional[Dict[str, float]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Pass documents through every stage and return the _id and the
+        fields that changed for each document that changed"""
+        timings = {} if timings is None else timings
+        snapshots = self.snapshot_documents(documents)
+        documents_by_id = {d["_id"]: d for d in documents}
+
+        for stage in list(self.stages):
+            stage_documents = documents
+            if stage.skip_existing_outputs:
+                stage_documents = [
+                    d
+                    for d in documents
+                    if not all(self.is_field(f, d) for f in stage.output_fields)
+                ]
+            if len(stage_documents) == 0:
+                continue
+
+            start = time.perf_counter()
+            try:
+                results = stage.operation.transform(stage_documents)
+            except Exception:
+                # Keep the other stages going, as when run one at a time
+                traceback.print_exc()
+                print(f"❗ {stage.name} failed and will be skipped.")
+                self.stages.remove(stage)
+                continue
+            timings[stage.name] = (
+                timings.get(stage.name, 0.0) + time.perf_counter() - start
+            )
+
+            for result in results:
+                if result.get("_id") in documents_by_id:
+                    self._merge(documents_by_id[result["_id"]], result)
+
+        return self.diff_documents(snapshots, documents)
+
+    def run(
+        self,
+        dataset: Dataset,
+        filters: Optional[list] = None,
+        chunksize: int = 100,
+    ) -> Dict[str, float]:
+        """Scan the dataset once and run every stage on each chunk.
+        Returns the seconds spent in each stage."""
+        filters = [] if filters is None else filters
+        filters = filters + [
+            {
+                "filter_type": "or",
+                "condition_value": [
+                    {
+                        "field": field,
+                        "filter_type": "exists",
+                        "condition": "==",
+                        "condition_value": " ",
+                    }
+                    for stage in self.stages
+                    for field in stage.input_fields
+                ],
+            }
+        ]
+
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+        for chunk in dataset.chunk_dataset(
+            select_fields=self.select_fields,
+            filters=filters,
+            chunksize=chunksize,
+        ):
+            updates = self.transform(chunk, timings=timings)
+            if len(updates) > 0:
+                upsert_start = time.perf_counter()
+                dataset.upsert_documents(updates)
+                timings["upsert"] = (
+                    timings.get("upsert", 0.0) + time.perf_counter() - upsert_start
+                )
+        timings["total"] = time.perf_counter() - start
+
+        for stage in self.stages:
+            if hasattr(stage.operation, "store_operation_metadata"):
+                stage.operation.store_operation_metadata(dataset)
+
+        print("Time taken per stage:")
+        for name, seconds in timings.items():
+            print(f"  {name}: {seconds:.1f}s")
+        return timings
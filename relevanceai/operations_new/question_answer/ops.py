@@ -0,0 +1,34 @@
+from typing import List, Optional, Union
+
+from relevanceai.operations_new.question_answer.transform import (
+    QuestionAnswerTransform,
+)
+from relevanceai.operations_new.ops_base import OperationAPIBase
+
+
+class QuestionAnswerOps(OperationAPIBase, QuestionAnswerTransform):
+    """
+    Answer questions about a text field
+    """
+
+    def __init__(
+        self,
+        text_field: str,
+        questions: Union[List[str], str],
+        output_fields: Optional[List[str]] = None,
+        model_name: str = "mrm8488/deberta-v3-base-finetuned-squadv2",
+        batch_size: int = 32,
+        **kwargs,
+    ):
+        if isinstance(questions, str):
+            questions = [questions]
+        self.text_field = text_field
+        self.questions = questions
+        self.output_fields = output_fields
+        self.model_name = model_name
+        self.batch_size = batch_size
+        super().__init__(**kwargs)
+
+    @property
+    def name(self):
+        return "question_answer"
@@ -0,0 +1,81 @@
+"""
+    Answer questions about a text field.
+
+"""
+from typing import List, Optional, Union
+
+from relevanceai.operations_new.transform_base import TransformBase
+
+
+class QuestionAnswerTransform(TransformBase):
+    def __init__(
+        self,
+        text_field: str,
+        questions: Union[List[str], str],
+        output_fields: Optional[List[str]] = None,
+        model_name: str = "mrm8488/deberta-v3-base-finetuned-squadv2",
+        batch_size: int = 32,
+        **kwargs,
+    ):
+        """
+        Question Answer Ops.
+
+        Parameters
+        -------------
+
+        text_field: str
+            The field to find answers in
+        questions: list
+            The questions to ask of every document
+        output_fields: list
+            Where to store the answer to each question. Defaults to
+            _question_.{question}
+        model_name: str
+            The name of an extractive question answering model
+        batch_size: int
+            Number of context windows to run through the model at a time
+
+        """
+        if isinstance(questions, str):
+            questions = [questions]
+        self.text_field = text_field
+        self.questions = questions
+        self.output_fields = output_fields
+        self.model_name = model_name
+        self.batch_size = batch_size
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+
+    @property
+    def model(self):
+        if not hasattr(self, "_model"):
+            from relevanceai.operations.text.qa.qa import QAOps
+
+            self._model = QAOps(model_name=self.model_name, batch_size=self.batch_size)
+        return self._model
+
+    @property
+    def name(self):
+        return "question_answer"
+
+    def _get_output_field(self, question: str):
+        return "_question_." + "-".join(question.lower().strip().split())
+
+    def _get_output_fields(self) -> List[str]:
+        if self.output_fields is not None:
+            return self.output_fields
+        return [self._get_output_field(q) for q in self.questions]
+
+    def transform(self, documents):
+        contexts = self.get_field_across_documents(
+            self.text_field, documents, missing_treatment="return_none"
+        )
+        answer_docs = [{"_id": d["_id"]} for d in documents]
+        for question, output_field in zip(self.questions, self._get_output_fields()):
+            answers = self.model.bulk_question_answer(question, contexts)
+            self.set_field_across_documents(
+                output_field,
+                [{"answer": a["answer"], "score": a["score"]} for a in answers],
+                answer_docs,
+            )
+        return answer_docs
@@ -1,10 +1,11 @@
+from copy import deepcopy
 from typing import List, Dict, Any, Optional, Union
 
-from relevanceai.operations_new.run import OperationRun
+from relevanceai.operations_new.transform_base import TransformBase
 from relevanceai.operations_new.scaling.models.base import ScalerModelBase
 
 
-class ScalerBase(OperationRun):
+class ScalerBase(TransformBase):
 
     model: ScalerModelBase
     fields: List[str]
@@ -31,6 +32,8 @@ class ScalerBase(OperationRun):
             alias=alias,
             model_kwargs=model_kwargs,
         )
+        # one frozen copy of the model per vector field once statistics are fitted
+        self.fitted_models: Dict[str, ScalerModelBase] = {}
         for k, v in kwargs.items():
             setattr(self, k, v)
 
@@ -55,6 +58,21 @@ class ScalerBase(OperationRun):
 
         return mapped_model
 
+    def partial_fit(
+        self,
+        documents: List[Dict[str, Any]],
+    ):
+        """Update the statistics of each vector field with another chunk of documents"""
+        for vector_field in self.vector_fields:
+            vectors = self.get_field_across_documents(
+                field=vector_field, docs=documents, missing_treatment="skip"
+            )
+            if len(vectors) == 0:
+                continue
+            if vector_field not in self.fitted_models:
+                self.fitted_models[vector_field] = deepcopy(self.model)
+            self.fitted_models[vector_field].partial_fit(vectors)
+
     def transform(
         self,
         documents: List[Dict[str, Any]],
@@ -67,7 +85,10 @@ class ScalerBase(OperationRun):
                 field=vector_field, docs=documents
             )
 
-            reduced_vectors = self.model.fit_transform(vectors)
+            if vector_field in self.fitted_models:
+                reduced_vectors = self.fitted_models[vector_field].transform(vectors)
+            else:
+                reduced_vectors = self.model.fit_transform(vectors)
             scaled_vector_name = self.model.vector_name(vector_field)
 
             if scaled_vector_name in self.vector_fields:
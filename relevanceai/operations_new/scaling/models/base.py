@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from typing import Any, List, Union
+from typing import Any, Dict, List, Union
 
 from relevanceai.utils import DocUtils
 
@@ -61,6 +61,22 @@ class ScalerModelBase(ABC, DocUtils):
     def fit(self, *args, **kwargs) -> None:
         raise NotImplementedError
 
+    @property
+    def is_incremental(self) -> bool:
+        return False
+
+    def partial_fit(self, *args, **kwargs) -> None:
+        raise NotImplementedError
+
+    def transform(self, *args, **kwargs) -> Any:
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def set_stats(self, stats: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def fit_transform(self, *args, **kwargs) -> Any:
         raise NotImplementedError
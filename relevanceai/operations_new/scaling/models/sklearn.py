@@ -1,4 +1,4 @@
-from typing import List, Union, Optional
+from typing import Any, Dict, List, Union, Optional
 
 import numpy as np
 
@@ -71,3 +71,63 @@ class SKLearnScaler(ScalerModelBase):
         vectors = np.array(vectors)
         reduced_vectors = self.model.fit_transform(vectors)
         return reduced_vectors.tolist()
+
+    @property
+    def is_incremental(self) -> bool:
+        return hasattr(self.model, "partial_fit")
+
+    def partial_fit(
+        self,
+        vectors: Union[List[List[float]], np.ndarray],
+    ) -> None:
+        """It updates the running statistics of the model with another chunk of vectors.
+
+        Parameters
+        ----------
+        vectors : Union[List[List[float]], np.ndarray]
+            Union[List[List[float]], np.ndarray]
+
+        """
+
+        if isinstance(vectors, list):
+            vectors = np.array(vectors)
+
+        self.model.partial_fit(vectors)
+
+    def transform(
+        self,
+        vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """It scales the vectors with the statistics the model has already been fitted on
+
+        Parameters
+        ----------
+        vectors : List[List[float]]
+            List[List[float]]
+
+        Returns
+        -------
+            A list of lists of floats.
+
+        """
+
+        scaled_vectors = self.model.transform(np.array(vectors))
+        return scaled_vectors.tolist()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the fitted attributes of the model in a JSON friendly form"""
+        stats = {}
+        for key, value in vars(self.model).items():
+            if not key.endswith("_") or key.startswith("_"):
+                continue
+            if isinstance(value, (np.ndarray, np.generic)):
+                value = value.tolist()
+            stats[key] = value
+        return stats
+
+    def set_stats(self, stats: Dict[str, Any]) -> None:
+        """Restores fitted attributes returned by `get_stats`"""
+        for key, value in stats.items():
+            if isinstance(value, list):
+                value = np.array(value)
+            setattr(self.model, key, value)
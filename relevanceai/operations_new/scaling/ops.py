@@ -1,7 +1,12 @@
-from typing import Optional
+from copy import deepcopy
+from typing import Dict, Optional
 
-from relevanceai.operations_new.apibase import OperationAPIBase
+from relevanceai.dataset import Dataset
+from relevanceai.operations_new.ops_base import OperationAPIBase
 from relevanceai.operations_new.scaling.base import ScalerBase
+from relevanceai.utils.sampling import ReservoirSampler
+
+SCALER_METADATA_FIELD = "_scaler_"
 
 
 class ScaleOps(ScalerBase, OperationAPIBase):
@@ -9,7 +14,14 @@ class ScaleOps(ScalerBase, OperationAPIBase):
     API related Functionality for Operation
     """
 
-    def __init__(self, alias, model, model_kwargs: Optional[dict] = None, **kwargs):
+    def __init__(
+        self,
+        alias,
+        model,
+        model_kwargs: Optional[dict] = None,
+        sample_size: int = 10000,
+        **kwargs
+    ):
         if model_kwargs is None:
             model_kwargs = {}
 
@@ -24,3 +36,114 @@ class ScaleOps(ScalerBase, OperationAPIBase):
             alias=alias,
             model_kwargs=model_kwargs,
         )
+        self.sample_size = sample_size
+
+    @property
+    def output_fields(self):
+        return [
+            self.model.vector_name(vector_field) for vector_field in self.vector_fields
+        ]
+
+    def fit_dataset(
+        self,
+        dataset: Dataset,
+        filters: Optional[list] = None,
+        chunksize: Optional[int] = None,
+    ):
+        """Fit the scaling statistics of every vector field in one streaming pass
+        over the dataset and store them in the dataset metadata.
+
+        Scalers with `partial_fit` (standard, minmax, maxabs) keep running
+        statistics. Scalers that need quantiles (robust, quantiletransformer)
+        are fitted on a uniform sample of `sample_size` vectors per field.
+        """
+        filters = [] if filters is None else filters
+        filters = filters + [
+            {
+                "filter_type": "or",
+                "condition_value": [
+                    {
+                        "field": field,
+                        "filter_type": "exists",
+                        "condition": "==",
+                        "condition_value": " ",
+                    }
+                    for field in self.vector_fields
+                ],
+            }
+        ]
+
+        self.fitted_models = {}
+        samplers: Dict[str, ReservoirSampler] = {
+            vector_field: ReservoirSampler(self.sample_size)
+            for vector_field in self.vector_fields
+        }
+
+        for chunk in dataset.chunk_dataset(
+            select_fields=self.vector_fields,
+            filters=filters,
+            chunksize=chunksize,
+        ):
+            if self.model.is_incremental:
+                self.partial_fit(chunk)
+            else:
+                for vector_field, sampler in samplers.items():
+                    sampler.extend(
+                        self.get_field_across_documents(
+                            field=vector_field, docs=chunk, missing_treatment="skip"
+                        )
+                    )
+
+        if not self.model.is_incremental:
+            for vector_field, sampler in samplers.items():
+                if len(sampler) == 0:
+                    continue
+                model = deepcopy(self.model)
+                model.fit(sampler.sample)
+                self.fitted_models[vector_field] = model
+
+        self.store_stats(dataset)
+
+    def store_stats(self, dataset: Dataset):
+        """Store the fitted statistics under `_scaler_` in the dataset metadata
+        so that documents inserted later can be scaled identically.
+
+        .. code-block::
+
+            {
+                "_scaler_": {
+                    "sample_1_vector_standardscaler_vector_": {
+                        "vector_field": "sample_1_vector_",
+                        "model": "standardscaler",
+                        "stats": {"mean_": [...], "scale_": [...], ...}
+                    }
+                }
+            }
+
+        """
+        metadata = dataset.metadata.to_dict()
+        if SCALER_METADATA_FIELD not in metadata:
+            metadata[SCALER_METADATA_FIELD] = {}
+        for vector_field, model in self.fitted_models.items():
+            metadata[SCALER_METADATA_FIELD][model.vector_name(vector_field)] = {
+                "vector_field": vector_field,
+                "model": model.model_name,
+                "stats": model.get_stats(),
+            }
+        return dataset.upsert_metadata(metadata)
+
+    def load_stats(self, dataset: Dataset) -> bool:
+        """Restore statistics stored by a previous run. Returns False unless
+        every vector field has stored statistics for this scaler."""
+        stored = dataset.metadata.to_dict().get(SCALER_METADATA_FIELD, {})
+        fitted_models = {}
+        for vector_field in self.vector_fields:
+            entry = stored.get(self.model.vector_name(vector_field))
+            if entry is None or entry.get("model") != self.model.model_name:
+                return False
+            model = deepcopy(self.model)
+            model.set_stats(entry["stats"])
+            fitted_models[vector_field] = model
+
+        self.fitted_models = fitted_models
+        return True
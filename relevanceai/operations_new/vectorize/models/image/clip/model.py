@@ -1,9 +1,16 @@
+import heapq
+import functools
+import warnings
 import requests
 
-from typing import List
-from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from collections import deque
+from typing import Any, Callable, Iterator, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from relevanceai.operations_new.vectorize.models.base import VectorizeModelBase
+from relevanceai.utils.concurrency import is_picklable
 from relevanceai.utils.decorators.vectors import catch_errors
 
 try:
@@ -24,14 +31,203 @@ except:
     traceback.print_exc()
 
 
+DECODE_POOLS = ["process", "thread"]
+VIDEO_SAMPLING = ["uniform", "keyframe"]
+VIDEO_POOLING = ["mean", "max"]
+
+# The preprocessing transforms of a decode process. They are sent once when
+# the process starts rather than with every image.
+_preprocess: Optional[Callable] = None
+
+
+def _init_decode_process(preprocess: Callable):
+    global _preprocess
+    _preprocess = preprocess
+    # Every process would otherwise use all the cores for its transforms
+    torch.set_num_threads(1)
+
+
+def _get_preprocess(preprocess: Optional[Callable]) -> Callable:
+    """The given transforms, or those of the decode process"""
+    preprocess = _preprocess if preprocess is None else preprocess
+    if preprocess is None:
+        raise ValueError("No preprocessing transforms were given.")
+    return preprocess
+
+
+def read_image(image_url: str):
+    try:
+        return Image.open(requests.get(image_url, stream=True).raw)
+    except MissingSchema:
+        return Image.open(image_url)
+
+
+def decode_image(
+    image_url: str, preprocess: Optional[Callable] = None
+) -> Optional[np.ndarray]:
+    """Reads and preprocesses an image into a (channels, height, width)
+    array, or None if it cannot be read. Greyscale images are converted to
+    RGB so that every array can be stacked with the others."""
+    preprocess = _get_preprocess(preprocess)
+    try:
+        with read_image(image_url) as image:
+            return preprocess(image.convert("RGB")).numpy()
+    except Exception:
+        traceback.print_exc()
+        return None
+
+
+def decode_frame(frame: np.ndarray, preprocess: Optional[Callable] = None):
+    """Preprocesses an RGB video frame into a (channels, height, width) array"""
+    preprocess = _get_preprocess(preprocess)
+    return preprocess(Image.fromarray(frame)).numpy()
+
+
+def uniform_frame_indices(
+    number_of_frames_in_video: int, number_of_frames: int
+) -> List[int]:
+    """Evenly spaced frame indices, including the first and last frame"""
+    if number_of_frames_in_video <= number_of_frames:
+        return list(range(number_of_frames_in_video))
+    return (
+        np.linspace(0, number_of_frames_in_video - 1, number_of_frames)
+        .round()
+        .astype(int)
+        .tolist()
+    )
+
+
+def _read_uniform_frames(video_url: str, number_of_frames: int) -> List:
+    cap = cv2.VideoCapture(video_url)
+    try:
+        number_of_frames_in_video = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        if number_of_frames_in_video <= 0:
+            # Some containers do not record how many frames they have
+            number_of_frames_in_video = 0
+            while cap.grab():
+                number_of_frames_in_video += 1
+            cap.release()
+            cap = cv2.VideoCapture(video_url)
+
+        indices = set(
+            uniform_frame_indices(number_of_frames_in_video, number_of_frames)
+        )
+        frames = []
+        index = 0
+        # grab() skips the colour conversion and copy of unsampled frames
+        while indices and index <= max(indices) and cap.grab():
+            if index in indices:
+                ret, frame = cap.retrieve()
+                if ret:
+                    frames.append(frame)
+            index += 1
+        return frames
+    finally:
+        cap.release()
+
+
+def _read_keyframes(video_url: str, number_of_frames: int) -> List:
+    """
+    OpenCV does not expose the codec's keyframes, so these are the frames
+    that differ most from the frame before them, i.e. the scene cuts. The
+    first frame is always included and frames are returned in order.
+    """
+    cap = cv2.VideoCapture(video_url)
+    try:
+        heap: list = []
+        previous = None
+        index = 0
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            thumbnail = cv2.resize(
+                cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY),
+                (64, 64),
+                interpolation=cv2.INTER_AREA,
+            ).astype(np.float32)
+            if previous is None:
+                change = np.inf
+            else:
+                change = float(np.abs(thumbnail - previous).mean())
+            previous = thumbnail
+            # Only the frames with the biggest changes so far are kept
+            if len(heap) < number_of_frames:
+                heapq.heappush(heap, (change, index, frame))
+            else:
+                heapq.heappushpop(heap, (change, index, frame))
+            index += 1
+        return [frame for _, _, frame in sorted(heap, key=lambda item: item[1])]
+    finally:
+        cap.release()
+
+
+def sample_frames(
+    video_url: str, number_of_frames: int = 8, sampling: str = "uniform"
+) -> List[np.ndarray]:
+    """
+    Reads `number_of_frames` RGB frames of a video.
+
+    Parameters
+    ----------
+    video_url: str
+        The path or URL of the video
+    number_of_frames: int
+        The number of frames to sample
+    sampling: str
+        "uniform" for evenly spaced frames, "keyframe" for the frames where
+        the scene changes most
+    """
+    if sampling == "uniform":
+        frames = _read_uniform_frames(video_url, number_of_frames)
+    elif sampling == "keyframe":
+        frames = _read_keyframes(video_url, number_of_frames)
+    else:
+        raise ValueError(f"sampling must be one of {VIDEO_SAMPLING}")
+    return [cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) for frame in frames]
+
+
 class ClipImage2Vec(VectorizeModelBase):
-    def __init__(self, url, vector_length, context_length=77):
+    """
+    Images are decoded in a pool of workers that is shut down by close(),
+    when the model is used as a context manager or when it is deleted.
+
+    Parameters
+    ----------
+    batch_size: int
+        The number of images encoded in one forward pass
+    decode_pool: str
+        "process" to read and preprocess images in a process pool, or
+        "thread" to use a thread pool
+    decode_workers: Optional[int]
+        The number of decode workers. Defaults to the number of CPUs
+    prefetch: int
+        The number of batches decoded ahead of the batch being encoded
+    """
+
+    def __init__(
+        self,
+        url,
+        vector_length,
+        context_length=77,
+        batch_size: int = 32,
+        decode_pool: str = "process",
+        decode_workers: Optional[int] = None,
+        prefetch: int = 2,
+    ):
+        if decode_pool not in DECODE_POOLS:
+            raise ValueError(f"decode_pool must be one of {DECODE_POOLS}")
 
         self.context_length = context_length
-        self.device = "cuda" if torch.cuda.is_available else "cpu"
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.model, self.preprocess = clip.load(url, device=self.device)
         self.vector_length = vector_length
         self.url = url
+        self.batch_size = batch_size
+        self.decode_pool = decode_pool
+        self.decode_workers = decode_workers
+        self.prefetch = prefetch
+        self._decode_executor: Any = None
 
     @property
     def model_name(self):
@@ -50,10 +246,76 @@ class ClipImage2Vec(VectorizeModelBase):
             The image is being returned.
 
         """
-        try:
-            return Image.open(requests.get(image_url, stream=True).raw)
-        except MissingSchema:
-            return Image.open(image_url)
+        return read_image(image_url)
+
+    def _get_decode_executor(self):
+        if self._decode_executor is None:
+            if self.decode_pool == "process" and is_picklable(self.preprocess):
+                self._decode_executor = ProcessPoolExecutor(
+                    max_workers=self.decode_workers,
+                    initializer=_init_decode_process,
+                    initargs=(self.preprocess,),
+                )
+            else:
+                if self.decode_pool == "process":
+                    warnings.warn(
+                        "The preprocessing transforms cannot be pickled. "
+                        "Decoding images in threads instead."
+                    )
+                self._decode_executor = ThreadPoolExecutor(
+                    max_workers=self.decode_workers
+                )
+        return self._decode_executor
+
+    def _decode_function(self, func: Callable) -> Callable:
+        # Decode processes already hold the transforms, threads are given them
+        if isinstance(self._get_decode_executor(), ProcessPoolExecutor):
+            return func
+        return functools.partial(func, preprocess=self.preprocess)
+
+    def close(self, wait: bool = True):
+        """Shuts down the decode workers. They are started again if more
+        images are encoded."""
+        executor = getattr(self, "_decode_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=wait)
+            self._decode_executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        self.close(wait=False)
+
+    def _stack(self, arrays: List[Optional[np.ndarray]]) -> "torch.Tensor":
+        resolution = self.model.visual.input_resolution
+        # Images that cannot be read are encoded as blank images
+        blank = np.zeros((3, resolution, resolution), dtype=np.float32)
+        stacked = np.stack([blank if array is None else array for array in arrays])
+        return torch.from_numpy(stacked).to(self.device)
+
+    def _iterate_preprocessed_batches(
+        self, images: List[str]
+    ) -> Iterator["torch.Tensor"]:
+        """Yields stacked batches of preprocessed images. The decode pool
+        works on up to `prefetch` batches while the model encodes one."""
+        executor = self._get_decode_executor()
+        decode = self._decode_function(decode_image)
+        pending: deque = deque()
+        for i in range(0, len(images), self.batch_size):
+            batch = images[i : i + self.batch_size]
+            pending.append([executor.submit(decode, image) for image in batch])
+            if len(pending) > self.prefetch:
+                yield self._stack([f.result() for f in pending.popleft()])
+        while pending:
+            yield self._stack([f.result() for f in pending.popleft()])
+
+    def _encode_image_batch(self, images: "torch.Tensor") -> "torch.Tensor":
+        with torch.no_grad():
+            return self.model.encode_image(images).float().cpu()
 
     def preprocess_black_and_white_image(self, x):
         """It takes a black and white image, converts it to a tensor, adds two more channels to it, and
@@ -102,28 +364,52 @@ class ClipImage2Vec(VectorizeModelBase):
             )
             return self.model.encode_text(text).detach().numpy().tolist()[0]
 
-    def encode_video(self, video_url: str):
-        """It takes a video file, reads it frame by frame, converts each frame to a PIL image, preprocesses
-        it, converts it to a tensor, and then encodes it using the model
+    def encode_video(
+        self,
+        video_url: str,
+        number_of_frames: int = 8,
+        sampling: str = "uniform",
+        pooling: str = "mean",
+    ):
+        """It samples frames from a video, encodes them in batches and pools
+        the frame vectors into one vector
 
         Parameters
         ----------
         video_url : str
             the path to the video file
+        number_of_frames : int
+            the number of frames to encode
+        sampling : str
+            "uniform" for evenly spaced frames or "keyframe" for the frames
+            where the scene changes most
+        pooling : str
+            "mean" or "max" of the frame vectors
 
         Returns
         -------
             A list of floats
 
         """
-        cap = cv2.VideoCapture(video_url)
-        while True:
-            ret, frame = cap.read()
-            if not ret:
-                break
-            pil_img = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
-        image = self.preprocess(pil_img).unsqueeze(0).to(self.device)
-        return self.model.encode_image(image).cpu().detach().numpy().tolist()[0]
+        if pooling not in VIDEO_POOLING:
+            raise ValueError(f"pooling must be one of {VIDEO_POOLING}")
+        frames = sample_frames(
+            video_url, number_of_frames=number_of_frames, sampling=sampling
+        )
+        if not frames:
+            raise ValueError(f"No frames could be read from {video_url}")
+
+        executor = self._get_decode_executor()
+        arrays = list(executor.map(self._decode_function(decode_frame), frames))
+        vectors = torch.cat(
+            [
+                self._encode_image_batch(self._stack(arrays[i : i + self.batch_size]))
+                for i in range(0, len(arrays), self.batch_size)
+            ]
+        )
+        if pooling == "mean":
+            return vectors.mean(dim=0).tolist()
+        return vectors.max(dim=0).values.tolist()
 
     def bulk_encode_text(self, texts: List[str]):
         """If the device is cuda, then tokenize the text, send it to the device, encode it, and return the
@@ -172,30 +458,16 @@ class ClipImage2Vec(VectorizeModelBase):
             return self.model.encode_text(tokenized_text).detach().numpy().tolist()
 
     def preprocess_image(self, img: str):
-        try:
-            if self.is_greyscale(img):
-                return (
-                    self.preprocess_black_and_white_image(self.read(img))
-                    .unsqueeze(0)
-                    .to(self.device)
-                )
-            return self.preprocess(self.read(img)).unsqueeze(0).to(self.device)
-        except:
-            traceback.print_exc()
-            return torch.empty((1, 3, 224, 224), dtype=torch.int32, device=self.device)
+        return self._stack([decode_image(img, preprocess=self.preprocess)])
 
     def parallel_preprocess_image(self, images: List[str]):
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            future = executor.map(self.preprocess_image, images)
-        return list(future)
+        executor = self._get_decode_executor()
+        decode = self._decode_function(decode_image)
+        return [self._stack([array]) for array in executor.map(decode, images)]
 
     @catch_errors
     def encode_image(self, image_url: str):
-        """If the device is cpu, then preprocess the image, add a dimension to the image, and then return
-        the encoded image.
-
-        If the device is cuda, then preprocess the image, add a dimension to the image if it's 3D, and
-        then return the encoded image
+        """It preprocesses the image and returns the encoded image
 
         Parameters
         ----------
@@ -207,25 +479,19 @@ class ClipImage2Vec(VectorizeModelBase):
             A list of floats
 
         """
-        if self.device == "cpu":
-            image = self.preprocess_image(image_url)
-            if image.dim() == 3:
-                image = image.unsqueeze(0).to(self.device)
-            return self.model.encode_image(image).detach().numpy().tolist()[0]
-        elif self.device == "cuda":
-            image = self.preprocess_image(image_url)
-            if image.ndim == 3:
-                image = image.unsqueeze(0).to(self.device)
-            elif image.ndim == 4:
-                image = image.to(self.device)
-            return self.model.encode_image(image).cpu().detach().numpy().tolist()[0]
+        return self._encode_image_batch(self.preprocess_image(image_url)).tolist()[0]
 
     def bulk_encode_image(self, images: List[str]):
-        """Batch Processing for CLIP image encoding"""
-        # Parallel process the encoding
-        future = self.parallel_preprocess_image(images)
-        results = self.model.encode_image(torch.cat(list(future))).tolist()
-        return results
+        """Batch Processing for CLIP image encoding. Images are decoded in
+        the decode pool while the previous batch is encoded."""
+        if not images:
+            return []
+        return torch.cat(
+            [
+                self._encode_image_batch(batch)
+                for batch in self._iterate_preprocessed_batches(images)
+            ]
+        ).tolist()
 
     def encode(self, data: str, data_type="image"):
         if data_type == "image":
@@ -7,13 +7,17 @@ Key purposes of this new caching:
 - Built-in support for hashing dictionaries
 """
 
+import time
+
 from threading import RLock
+from typing import Optional
 from functools import update_wrapper
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from urllib.parse import MAX_CACHE_SIZE
 from relevanceai.constants.constants import MAX_CACHESIZE
 
 _CacheInfo = namedtuple("_CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+_EXPIRED = object()
 
 
 def string_hash(obj):
@@ -229,3 +233,100 @@ def lru_cache(maxsize=MAX_CACHE_SIZE, typed=False):
         return update_wrapper(wrapper, user_function)
 
     return decorating_function
+
+
+class LRUCache:
+    """A thread-safe least-recently-used mapping for values that are computed
+    in bulk, where the lru_cache decorator would compute them one at a time.
+
+    .. code-block::
+
+        cache = LRUCache(maxsize=10000)
+        vectors, missing = cache.get_many(texts)
+        cache.set_many(zip(missing, bulk_encode(missing)))
+
+    """
+
+    def __init__(self, maxsize: Optional[int] = 10000):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = RLock()
+
+    def get_many(self, keys):
+        """Returns the cached values of keys and the unique keys that are not cached"""
+        found = {}
+        missing = []
+        seen = set()
+        with self._lock:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                value = _EXPIRED
+                if key in self._data:
+                    value = self._unexpired(self._data[key])
+                    if value is _EXPIRED:
+                        del self._data[key]
+                if value is not _EXPIRED:
+                    self._data.move_to_end(key)
+                    found[key] = value
+                    self.hits += 1
+                else:
+                    missing.append(key)
+                    self.misses += 1
+        return found, missing
+
+    def _unexpired(self, item):
+        """The value of a cached item, or _EXPIRED if it should be dropped"""
+        return item
+
+    def set_many(self, items):
+        with self._lock:
+            for key, value in items:
+                self._data[key] = value
+                self._data.move_to_end(key)
+            while self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def cache_info(self):
+        return _CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TTLCache(LRUCache):
+    """An LRUCache whose values expire `ttl` seconds after they were set.
+
+    .. code-block::
+
+        cache = TTLCache(maxsize=10000, ttl=300)
+        results, missing = cache.get_many(query_hashes)
+
+    """
+
+    def __init__(self, maxsize: Optional[int] = 10000, ttl: float = 300, timer=None):
+        super().__init__(maxsize=maxsize)
+        self.ttl = ttl
+        self.timer = time.monotonic if timer is None else timer
+
+    def _unexpired(self, item):
+        expires, value = item
+        return value if expires > self.timer() else _EXPIRED
+
+    def set_many(self, items):
+        expires = self.timer() + self.ttl
+        super().set_many((key, (expires, value)) for key, value in items)
+
+    def __contains__(self, key):
+        item = self._data.get(key)
+        return item is not None and item[0] > self.timer()
@@ -1,13 +1,19 @@
 """Multithreading Module
 """
 import math
+import pickle
+import queue
+import threading
+import time
+import warnings
 from concurrent.futures import (
     as_completed,
     wait,
+    FIRST_COMPLETED,
     ProcessPoolExecutor,
     ThreadPoolExecutor,
 )
-from typing import Callable
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from relevanceai.utils.progress_bar import NullProgressBar, progress_bar
 
@@ -111,3 +117,198 @@ def multiprocess_list(
             if show_progress_bar is True:
                 progress_tracker.update(1)
         return results
+
+
+_DONE = object()
+
+
+def is_picklable(obj) -> bool:
+    """Whether an object can be sent to another process"""
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
+
+
+def prefetch(iterable: Iterable, size: int = 2) -> Iterator:
+    """
+    Iterates over `iterable` in a background thread, keeping up to `size`
+    items ready so that producing the next item overlaps with consuming the
+    current one. Errors are raised in the consuming thread.
+    """
+    items: queue.Queue = queue.Queue(maxsize=max(size, 1))
+    stop = threading.Event()
+
+    def put_until_stopped(item):
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fill():
+        try:
+            for item in iterable:
+                if stop.is_set():
+                    return
+                put_until_stopped((item, None))
+        except BaseException as e:
+            put_until_stopped((_DONE, e))
+        else:
+            put_until_stopped((_DONE, None))
+
+    threading.Thread(target=fill, daemon=True).start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _timed_call(func, documents, *args):
+    # Runs inside the worker so the time excludes queueing and transfer
+    start = time.perf_counter()
+    result = func(documents, *args)
+    return result, time.perf_counter() - start
+
+
+def pipeline_chunks(
+    func: Callable,
+    chunks: Iterable[list],
+    push_fn: Callable[[list], Any],
+    func_args: tuple = (),
+    max_workers: Optional[int] = None,
+    prefetch: int = 2,
+    max_pending_pushes: int = 2,
+    show_progress_bar: bool = False,
+) -> Tuple[List[Any], Dict[str, float]]:
+    """
+    Runs `func` over chunks of documents in a process pool while the next
+    chunks are fetched and finished chunks are pushed in background threads.
+
+    Fetching is bounded by `prefetch` chunks, processing by twice the number
+    of workers and pushing by `max_pending_pushes` chunks, so memory stays
+    flat however large the dataset is. If `func` or `func_args` cannot be
+    pickled, a thread pool is used instead with a warning.
+
+    Parameters
+    ----------
+    func: Callable
+        Called as func(chunk, *func_args) and returns the chunk to push
+    chunks: Iterable[list]
+        The chunks to process, e.g. from Dataset.chunk_dataset
+    push_fn: Callable
+        Called with each processed chunk, e.g. to upsert it
+    max_workers: Optional[int]
+        Number of processes. Defaults to the number of CPUs
+
+    Returns
+    -------
+    The results of `push_fn` and the seconds spent in each stage.
+    """
+    if is_picklable(func) and is_picklable(func_args):
+        executor_class: Any = ProcessPoolExecutor
+    else:
+        warnings.warn(
+            "The function or its arguments cannot be pickled so it cannot be "
+            "sent to other processes. Falling back to threads. Define the "
+            "function at module level to use processes."
+        )
+        executor_class = ThreadPoolExecutor
+
+    timings = {"fetch": 0.0, "compute": 0.0, "push": 0.0, "total": 0.0}
+    counts = {"chunks": 0, "documents": 0}
+    fetched: queue.Queue = queue.Queue(maxsize=max(prefetch, 1))
+    processed: queue.Queue = queue.Queue(maxsize=max(max_pending_pushes, 1))
+    push_results: List[Any] = []
+    errors: List[BaseException] = []
+    stop = threading.Event()
+    start = time.perf_counter()
+
+    def put_until_stopped(item):
+        while not stop.is_set():
+            try:
+                fetched.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def fetch():
+        iterator = iter(chunks)
+        try:
+            while not stop.is_set():
+                fetch_start = time.perf_counter()
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    break
+                timings["fetch"] += time.perf_counter() - fetch_start
+                put_until_stopped(chunk)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            put_until_stopped(_DONE)
+
+    def push():
+        while True:
+            chunk = processed.get()
+            if chunk is _DONE:
+                break
+            push_start = time.perf_counter()
+            try:
+                push_results.append(push_fn(chunk))
+            except BaseException as e:
+                errors.append(e)
+            timings["push"] += time.perf_counter() - push_start
+
+    fetcher = threading.Thread(target=fetch, daemon=True)
+    pusher = threading.Thread(target=push, daemon=True)
+    fetcher.start()
+    pusher.start()
+
+    tracker = progress_bar(iter([]), show_progress_bar=show_progress_bar)
+
+    def collect(futures):
+        for future in futures:
+            result, seconds = future.result()
+            timings["compute"] += seconds
+            counts["documents"] += len(result) if result is not None else 0
+            if result:
+                processed.put(result)
+            if hasattr(tracker, "update"):
+                tracker.update(1)
+
+    try:
+        with executor_class(max_workers=max_workers) as executor:
+            max_in_flight = 2 * getattr(executor, "_max_workers", 1)
+            pending: set = set()
+            while not errors:
+                chunk = fetched.get()
+                if chunk is _DONE:
+                    break
+                counts["chunks"] += 1
+                pending.add(executor.submit(_timed_call, func, chunk, *func_args))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+            collect(as_completed(pending))
+    finally:
+        stop.set()
+        processed.put(_DONE)
+        pusher.join()
+        if hasattr(tracker, "close"):
+            tracker.close()
+
+    if errors:
+        raise errors[0]
+
+    timings["total"] = time.perf_counter() - start
+    timings.update(counts)
+    return push_results, timings
@@ -1,33 +1,168 @@
 import analytics
-import asyncio
-import json
+import atexit
 import os
-import copy
+import queue
+import threading
+import time
 
-from typing import Callable
+from typing import Any, Callable, Dict, List, Optional
 from base64 import b64decode as decode
 from functools import wraps
 
-from relevanceai.constants import CONFIG
+from relevanceai.constants import CONFIG, Config
 from relevanceai.constants import TRANSIT_ENV_VAR
 
-from relevanceai.utils.json_encoder import json_encoder
-from relevanceai.utils.decorators.thread import fire_and_forget
 
+def _parse_tracking_enabled(value: Any) -> bool:
+    return str(value).lower() in ("true", "1", "yes")
 
-def is_tracking_enabled():
-    if CONFIG.is_field("mixpanel.is_tracking_enabled", CONFIG.config):
-        return CONFIG.get_field("mixpanel.is_tracking_enabled", CONFIG.config)
 
+# Cached so that tracked methods do not read the config on every call. It is
+# updated whenever mixpanel.is_tracking_enabled is set on any config.
+_tracking_enabled = CONFIG.is_field(
+    "mixpanel.is_tracking_enabled", CONFIG.config
+) and _parse_tracking_enabled(CONFIG.get_option("mixpanel.is_tracking_enabled"))
 
-def get_json_size(json_obj):
-    # Returns it in bytes
-    return len(json.dumps(json_obj).encode("utf-8")) / 1024
+
+def _update_tracking_enabled(value: Any):
+    global _tracking_enabled
+    _tracking_enabled = _parse_tracking_enabled(value)
+
+
+Config.add_option_listener("mixpanel.is_tracking_enabled", _update_tracking_enabled)
+
+
+def is_tracking_enabled() -> bool:
+    return _tracking_enabled
+
+
+def set_tracking_enabled(enabled: bool):
+    """Turn analytics tracking on or off for every tracked method"""
+    CONFIG.set_option("mixpanel.is_tracking_enabled", bool(enabled))
+
+
+def describe_value(value: Any) -> Dict[str, Any]:
+    """The type and size of an argument, which is all that is sent about it"""
+    description: Dict[str, Any] = {"type": type(value).__name__}
+    if isinstance(value, (str, bytes, list, tuple, dict, set)):
+        description["size"] = len(value)
+    elif isinstance(value, (bool, int, float)) or value is None:
+        description["value"] = value
+    return description
+
+
+class EventQueue:
+    """
+    Sends analytics events from a background thread in batches, so that
+    tracked methods only have to put an event on a queue.
+
+    Events are sent when `batch_size` of them are waiting, every
+    `flush_interval` seconds and when the interpreter exits. If the queue is
+    full, new events are dropped rather than blocking the caller.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        flush_interval: float = 5.0,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def put(self, event: Callable[[], Optional[Dict]]) -> bool:
+        """Queue a function that builds the event. Returns False if it was dropped."""
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _get_batch(self, timeout: Optional[float]) -> List[Callable]:
+        batch: List[Callable] = []
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            try:
+                if deadline is None:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            self.send(self._get_batch(self.flush_interval))
+
+    def send(self, batch: List[Callable]):
+        # Tracking may have been turned off since the events were queued
+        if not is_tracking_enabled():
+            return
+        for build_event in batch:
+            try:
+                event = build_event()
+                if event is not None:
+                    analytics.track(**event)
+            except Exception:
+                pass
+
+    def flush(self):
+        """Send every queued event now"""
+        batch = self._get_batch(None)
+        while batch:
+            self.send(batch)
+            batch = self._get_batch(None)
+        try:
+            analytics.flush()
+        except Exception:
+            pass
+
+
+EVENT_QUEUE = EventQueue()
+
+
+def _get_user_id(args, kwargs) -> str:
+    if "firebase_uid" in kwargs:
+        return kwargs["firebase_uid"]
+    elif len(args) > 0 and hasattr(args[0], "firebase_uid"):
+        return args[0].firebase_uid
+    return "firebase_uid_not_detected"
+
+
+def _get_dataset_id(args, kwargs, named_args) -> Optional[str]:
+    if "dataset_id" in kwargs:
+        return kwargs["dataset_id"]
+    elif "dataset_id" in named_args:
+        return named_args["dataset_id"]
+    elif len(args) > 0 and hasattr(args[0], "dataset_id"):
+        return args[0].dataset_id
+    return None
 
 
 def track(func: Callable):
     @wraps(func)
     def wrapper(*args, **kwargs):
+        if not _tracking_enabled:
+            return func(*args, **kwargs)
+
         if os.getenv(TRANSIT_ENV_VAR) == "TRUE":
             # This env variable is used to track whether to send to MixPanel or not. If True, it does not and immediately
             # goes to function. Otherwise, it logs to MixPanel.
@@ -36,82 +171,28 @@ def track(func: Callable):
         os.environ[TRANSIT_ENV_VAR] = "TRUE"
 
         try:
-            if is_tracking_enabled():
-
-                @fire_and_forget
-                def send_analytics():
-                    properties = {}
-                    if "firebase_uid" in kwargs:
-                        user_id = kwargs["firebase_uid"]
-                    elif hasattr(args[0], "firebase_uid"):
-                        user_id = args[0].firebase_uid
-                    else:
-                        user_id = "firebase_uid_not_detected"
-
-                    event_name = f"pysdk-{func.__name__}"
-
-                    # kwargs.update(dict(zip(func.__code__.co_varnames, args)))
-                    # all_kwargs = copy.deepcopy(kwargs)
-                    # all_kwargs = all_kwargs.update(
-                    #     dict(zip(func.__code__.co_varnames, args))
-                    # )
-
-                    # if hasattr(func, "__code__"):
-                    additional_args = dict(zip(func.__code__.co_varnames, args))
-
-                    if "dataset_id" in kwargs:
-                        properties["dataset_id"] = kwargs["dataset_id"]
-
-                    elif "dataset_id" in additional_args:
-                        properties["dataset_id"] = additional_args["dataset_id"]
-
-                    elif hasattr(args[0], "dataset_id"):
-                        properties["dataset_id"] = args[0].dataset_id
-
-                    elif "self" in additional_args:
-                        if hasattr(additional_args["self"], "dataset_id"):
-                            properties["dataset_id"] = additional_args[
-                                "self"
-                            ].dataset_id
-
-                    full_properties = copy.deepcopy(properties)
-                    full_properties.update(
-                        {
-                            "additional_args": additional_args,
-                            "args": args,
-                            "kwargs": kwargs,
-                        }
-                    )
-                    if user_id is not None:
-                        # TODO: Loop through the properties and remove anything
-                        # greater than 5kb
-                        if (
-                            "insert" in event_name
-                            or "upsert" in event_name
-                            or "update" in event_name
-                            or "fit" in event_name
-                            or "predict" in event_name
-                            or get_json_size(
-                                json_encoder(full_properties, force_string=True)
-                            )
-                            > 30
-                        ):
-                            response = analytics.track(
-                                user_id=user_id,
-                                event=event_name,
-                                properties=json_encoder(properties, force_string=True),
-                            )
-                        else:
-                            response = analytics.track(
-                                user_id=user_id,
-                                event=event_name,
-                                properties=json_encoder(
-                                    full_properties, force_string=True
-                                ),
-                            )
-
-                send_analytics()
-                # asyncio.ensure_future(send_analytics())
+            # Only the names, types and sizes of the arguments are kept,
+            # so nothing is copied or serialized here
+            named_args = dict(zip(func.__code__.co_varnames, args))
+            user_id = _get_user_id(args, kwargs)
+            dataset_id = _get_dataset_id(args, kwargs, named_args)
+            arg_descriptions = {
+                name: describe_value(value)
+                for name, value in list(named_args.items()) + list(kwargs.items())
+                if name != "self"
+            }
+
+            def build_event():
+                properties: Dict[str, Any] = {"args": arg_descriptions}
+                if dataset_id is not None:
+                    properties["dataset_id"] = str(dataset_id)
+                return dict(
+                    user_id=user_id,
+                    event=f"pysdk-{func.__name__}",
+                    properties=properties,
+                )
+
+            EVENT_QUEUE.put(build_event)
         except Exception as e:
             pass
         try:
@@ -130,27 +211,20 @@ def track_event_usage(event_name: str):
     def track(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if not is_tracking_enabled():
+                return func(*args, **kwargs)
+
             if os.getenv(TRANSIT_ENV_VAR) == "TRUE":
                 return func(*args, **kwargs)
 
             os.environ[TRANSIT_ENV_VAR] = "TRUE"
 
             try:
-                if is_tracking_enabled():
-
-                    async def send_analytics():
-                        user_id = "OPEN_SOURCE_USER"
-                        event_name = f"pysdk-{EVENT_NAME}"
-
-                        if user_id is not None:
-                            # TODO: Loop through the properties and remove anything
-                            # greater than 5kb
-                            response = analytics.track(
-                                user_id=user_id,
-                                event=event_name,
-                            )
-
-                    asyncio.ensure_future(send_analytics())
+                EVENT_QUEUE.put(
+                    lambda: dict(
+                        user_id="OPEN_SOURCE_USER", event=f"pysdk-{EVENT_NAME}"
+                    )
+                )
             except Exception as e:
                 pass
             try:
@@ -1,19 +1,20 @@
 """Utilities for Chunk Documents
 """
 import itertools
-from typing import Callable
+from typing import Any, Callable, Dict, List, Optional
 from .write_utils import DocWriteUtils
+from .field_path import get_field_path
 
 
 class ChunkDocUtils(DocWriteUtils):
     @classmethod
     def get_chunk(cls, chunk_field, doc):
-        return cls.access_document_field(chunk_field, doc)
+        return cls.get_field(chunk_field, doc)
 
     @classmethod
     def get_field_across_chunks(cls, chunk_field, field, doc):
         chunk = cls.get_chunk(chunk_field, doc)
-        return [cls.get_field(field, d) for d in chunk]
+        return get_field_path(field).get_many(chunk)
 
     def run_function_across_chunks(
         self,
@@ -56,3 +57,66 @@ class ChunkDocUtils(DocWriteUtils):
             )
 
         return map(map_run_function_across_chunks, docs)
+
+    def run_function_across_chunks_batched(
+        self,
+        function: Callable[[List[Any]], List[Any]],
+        chunk_field: str,
+        field: Optional[str] = None,
+        output_field: Optional[str] = None,
+        docs: List[Dict] = [],
+        batch_size: Optional[int] = 1000,
+    ):
+        """Run a batch function across the chunks of many documents at once.
+        The chunk values of every document are flattened into one list and
+        passed to `function` in sub-batches of at most `batch_size` (or all at
+        once if it is None), so models are called with many values instead of
+        one. The results are then put back where each value came from.
+        Params:
+        function:
+            Takes a list of values and returns a list of results of the same length
+        field:
+            The field is AFTER the Chunk Field. Chunks without it are skipped.
+        output_field:
+            The field AFTER the Chunk Field to store results in. If None, the
+            results are returned as a list per document instead.
+        """
+        chunk_path = get_field_path(chunk_field)
+        field_path = None if field is None else get_field_path(field)
+        chunks: Dict[int, List] = {}
+        offsets = []
+        values = []
+        for i, doc in enumerate(docs):
+            chunk = chunk_path.get(doc, missing_treatment="return_none")
+            if not chunk:
+                continue
+            chunks[i] = chunk
+            for j, chunk_doc in enumerate(chunk):
+                if field_path is None:
+                    values.append(chunk_doc)
+                elif field_path.exists(chunk_doc):
+                    values.append(field_path.get(chunk_doc))
+                else:
+                    continue
+                offsets.append((i, j))
+
+        if batch_size is None or batch_size <= 0:
+            batch_size = max(len(values), 1)
+        results: List[Any] = []
+        for start in range(0, len(values), batch_size):
+            batch_results = list(function(values[start : start + batch_size]))
+            if len(batch_results) != len(values[start : start + batch_size]):
+                raise ValueError(
+                    "The function must return one result for every value it is given."
+                )
+            results.extend(batch_results)
+
+        if output_field is None:
+            doc_results: List[List[Any]] = [[] for _ in docs]
+            for (i, _), result in zip(offsets, results):
+                doc_results[i].append(result)
+            return doc_results
+        output_path = get_field_path(output_field)
+        for (i, j), result in zip(offsets, results):
+            output_path.set(chunks[i][j], result)
+        return docs
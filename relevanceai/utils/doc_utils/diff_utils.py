@@ -0,0 +1,87 @@
+"""Utilities for tracking which fields of documents have changed
+"""
+import hashlib
+import json
+
+from typing import Any, Dict, List
+
+_SCALARS = (str, int, float, bool, type(None))
+
+
+class DocDiffUtils:
+    """This is created as a Mixin so that only changed fields have to be
+    sent back when documents are updated.
+
+    Example
+    ---------
+
+    .. code-block::
+
+        snapshots = self.snapshot_documents(documents)
+        documents = func(documents)
+        updates = self.diff_documents(snapshots, documents)
+        # updates only has the _id and the fields func changed or added
+    """
+
+    @staticmethod
+    def _fingerprint(value: Any):
+        # Immutable scalars are cheaper to keep than to hash. The type is kept
+        # so that e.g. 1 -> True still counts as a change.
+        if isinstance(value, _SCALARS):
+            return (type(value), value)
+        dumped = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(dumped, digest_size=16).digest()
+
+    @classmethod
+    def _flatten_fields(cls, doc: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Maps the path of each leaf field, e.g. "value.nested", to its value"""
+        fields = {}
+        for key, value in doc.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, dict) and len(value) > 0:
+                fields.update(cls._flatten_fields(value, prefix=f"{path}."))
+            else:
+                fields[path] = value
+        return fields
+
+    def snapshot_document(self, doc: Dict) -> Dict[str, Any]:
+        """Fingerprint every field of a document before it is modified"""
+        return {
+            path: self._fingerprint(value)
+            for path, value in self._flatten_fields(doc).items()
+        }
+
+    def snapshot_documents(self, docs: List[Dict]) -> Dict[str, Dict[str, Any]]:
+        """Fingerprint every field of each document, keyed by _id"""
+        return {str(doc["_id"]): self.snapshot_document(doc) for doc in docs}
+
+    def diff_document(self, snapshot: Dict[str, Any], doc: Dict) -> Dict[str, Any]:
+        """Returns the fields of doc that are new or changed since the snapshot,
+        keyed by their full path"""
+        return {
+            path: value
+            for path, value in self._flatten_fields(doc).items()
+            if path != "_id"
+            and (path not in snapshot or snapshot[path] != self._fingerprint(value))
+        }
+
+    def diff_documents(
+        self, snapshots: Dict[str, Dict[str, Any]], docs: List[Dict]
+    ) -> List[Dict]:
+        """Returns the _id and the new or changed fields of every document that
+        has changed since `snapshot_documents`. Unchanged documents are left
+        out and documents without a snapshot are returned whole. Fields are
+        keyed by their full path (e.g. {"_id": "1", "value.nested": 3}) which
+        bulk_update applies without overwriting the rest of the document.
+        Removed fields are not tracked.
+        """
+        updates = []
+        for doc in docs:
+            snapshot = snapshots.get(str(doc.get("_id")))
+            if snapshot is None:
+                updates.append(doc)
+                continue
+            changes = self.diff_document(snapshot, doc)
+            if changes:
+                updates.append({"_id": doc["_id"], **changes})
+        return updates
@@ -5,6 +5,7 @@ from typing import Dict, List, Any
 from pandas import isna
 
 from .chunk_doc_utils import ChunkDocUtils
+from .diff_utils import DocDiffUtils
 
 try:
     from IPython.display import display
@@ -12,7 +13,7 @@ except ModuleNotFoundError:
     pass
 
 
-class DocUtils(ChunkDocUtils):
+class DocUtils(ChunkDocUtils, DocDiffUtils):
     """Class for all document utilities.
     Primarily should be used as a mixin for future functions
     but can be a standalone.
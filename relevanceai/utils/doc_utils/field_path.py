@@ -0,0 +1,225 @@
+"""Compiled accessors for dotted field paths such as "value.nested.field"
+"""
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+from .errors import MissingFieldError
+
+
+def _is_string_integer(x) -> bool:
+    """Test if a string is numeric"""
+    try:
+        int(x)
+        return True
+    except:
+        return False
+
+
+def _compile_getter(parts: List[str]) -> Callable[[Dict], Any]:
+    """A getter that only indexes dicts by key. It raises if anything is
+    missing, which FieldPath then handles like get_field always has."""
+    if len(parts) == 1:
+        (p0,) = parts
+        return lambda doc: doc[p0]
+    if len(parts) == 2:
+        p0, p1 = parts
+        return lambda doc: doc[p0][p1]
+    if len(parts) == 3:
+        p0, p1, p2 = parts
+        return lambda doc: doc[p0][p1][p2]
+
+    def getter(doc):
+        for part in parts:
+            doc = doc[part]
+        return doc
+
+    return getter
+
+
+def _compile_setter(parts: List[str]) -> Callable[[Dict, Any], None]:
+    """A setter that creates any missing parent dicts"""
+    last = parts[-1]
+    if len(parts) == 1:
+
+        def setter(doc, value):
+            doc[last] = value
+
+    elif len(parts) == 2:
+        p0 = parts[0]
+
+        def setter(doc, value):
+            doc.setdefault(p0, {})[last] = value
+
+    else:
+        parents = parts[:-1]
+
+        def setter(doc, value):
+            for part in parents:
+                doc = doc.setdefault(part, {})
+            doc[last] = value
+
+    return setter
+
+
+class FieldPath:
+    """
+    A field path such as "kfc.item" that is split once and compiled into a
+    getter and setter, so that reading or writing the same field across many
+    documents does not parse the path for every document.
+
+    Reads fall back to the behaviour of `get_field` (flat keys containing
+    dots, list indices such as "chunk.0.text" and missing treatments) only
+    when the compiled getter cannot find the field.
+
+    Example
+    ---------
+
+    .. code-block::
+
+        from relevanceai.utils.doc_utils.field_path import get_field_path
+
+        path = get_field_path("kfc.item")
+        items = path.get_many(documents, missing_treatment="return_none")
+        path.set_many(documents, [item.upper() for item in items])
+
+    """
+
+    __slots__ = ("field", "parts", "_getter", "_setter")
+
+    def __init__(self, field: str):
+        self.field = field
+        self.parts = field.split(".")
+        self._getter = _compile_getter(self.parts)
+        self._setter = _compile_setter(self.parts)
+
+    def __repr__(self):
+        return f"FieldPath({self.field!r})"
+
+    def get(self, doc: Dict, missing_treatment: Any = "raise_error") -> Any:
+        """Get the field from a document, like get_field"""
+        try:
+            return self._getter(doc)
+        except (KeyError, TypeError, IndexError):
+            return self._get_slow(doc, missing_treatment)
+
+    def exists(self, doc: Dict) -> bool:
+        """Whether the document has the field, like is_field"""
+        try:
+            self._getter(doc)
+            return True
+        except (KeyError, TypeError, IndexError):
+            return self._exists_slow(doc)
+
+    def set(self, doc: Dict, value: Any):
+        """Set the field in a document, creating parent dicts if needed"""
+        self._setter(doc, value)
+
+    def get_many(
+        self, docs: List[Dict], missing_treatment: Any = "raise_error"
+    ) -> List[Any]:
+        """
+        Get the field from every document.
+
+        Parameters
+        ----------
+        docs: List[Dict]
+            The documents
+        missing_treatment: Any
+            "skip" leaves out documents without the field. Otherwise, one of
+            return_empty_string/return_none/raise_error or a value to return.
+        """
+        getter = self._getter
+        try:
+            return [getter(doc) for doc in docs]
+        except (KeyError, TypeError, IndexError):
+            pass
+
+        values: List[Any] = []
+        append = values.append
+        for doc in docs:
+            try:
+                append(getter(doc))
+            except (KeyError, TypeError, IndexError):
+                if missing_treatment == "skip":
+                    if self._exists_slow(doc):
+                        append(self._get_slow(doc, "raise_error"))
+                else:
+                    append(self._get_slow(doc, missing_treatment))
+        return values
+
+    def set_many(self, docs: List[Dict], values: List[Any]):
+        """Set the field of each document to the value at the same position"""
+        assert len(values) == len(docs), (
+            "Assert that the number of values " + "equates to the number of documents"
+        )
+        setter = self._setter
+        for doc, value in zip(docs, values):
+            setter(doc, value)
+
+    def _get_slow(self, doc: Dict, missing_treatment: Any):
+        field = self.field
+        d = doc
+        for f in self.parts:
+            try:
+                d = d[f]
+            except KeyError:
+                try:
+                    return doc[field]
+                except KeyError:
+                    if missing_treatment == "return_none":
+                        return None
+                    elif missing_treatment == "return_empty_string":
+                        return ""
+                    elif missing_treatment == "raise_error":
+                        raise MissingFieldError(
+                            "Document is missing " + f + " of " + field
+                        )
+                    else:
+                        return missing_treatment
+            except TypeError:
+                if _is_string_integer(f):
+                    # Get the Get the chunk document out.
+                    try:
+                        d = d[int(f)]
+                    except IndexError:
+                        pass
+                else:
+                    if missing_treatment == "return_none":
+                        return None
+                    elif missing_treatment == "return_empty_string":
+                        return ""
+                    raise MissingFieldError("Document is missing " + f + " of " + field)
+        return d
+
+    def _exists_slow(self, doc: Dict) -> bool:
+        field = self.field
+        d = doc
+        for f in self.parts:
+            try:
+                d = d[f]
+            except KeyError:
+                try:
+                    doc[field]
+                    return True
+                except KeyError:
+                    try:
+                        d[field]
+                    except KeyError:
+                        return False
+            except TypeError:
+                # To Support integers
+                if _is_string_integer(f):
+                    # Get the Get the chunk document out.
+                    try:
+                        d = d[int(f)]
+                    except IndexError:
+                        pass
+                else:
+                    return False
+        return True
+
+
+@lru_cache(maxsize=4096)
+def get_field_path(field: str) -> FieldPath:
+    """The compiled FieldPath for a field, cached per path string"""
+    return FieldPath(field)
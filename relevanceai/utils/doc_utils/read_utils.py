@@ -1,6 +1,7 @@
 import pandas as pd
 from typing import Dict, List, Any
 from .errors import MissingFieldError
+from .field_path import get_field_path
 
 
 class DocReadUtils:
@@ -31,38 +32,7 @@ class DocReadUtils:
             >>> sample_document = {'kfc': {'item': 'chicken'}}
             >>> vi_client.get_field('kfc.item', sample_document) == 'chickens'
         """
-        d = doc
-        for f in field.split("."):
-            try:
-                d = d[f]
-            except KeyError:
-                try:
-                    return doc[field]
-                except KeyError:
-                    if missing_treatment == "return_none":
-                        return None
-                    elif missing_treatment == "return_empty_string":
-                        return ""
-                    elif missing_treatment == "raise_error":
-                        raise MissingFieldError(
-                            "Document is missing " + f + " of " + field
-                        )
-                    else:
-                        return missing_treatment
-            except TypeError:
-                if self._is_string_integer(f):
-                    # Get the Get the chunk document out.
-                    try:
-                        d = d[int(f)]
-                    except IndexError:
-                        pass
-                else:
-                    if missing_treatment == "return_none":
-                        return None
-                    elif missing_treatment == "return_empty_string":
-                        return ""
-                    raise MissingFieldError("Document is missing " + f + " of " + field)
-        return d
+        return get_field_path(field).get(doc, missing_treatment)
 
     @classmethod
     def _is_string_integer(cls, x):
@@ -131,15 +101,8 @@ class DocReadUtils:
             >>> vi_client.get_field_across_documents('size.cm', documents)
             # returns 10 values in the nested dictionary
         """
-        if missing_treatment == "skip":
-            # Returns only the relevant documents
-            def check_field_in_doc(doc):
-                return self.is_field(field, doc)
-
-            return [
-                self.get_field(field, doc) for doc in filter(check_field_in_doc, docs)
-            ]
-        return [self.get_field(field, doc, missing_treatment) for doc in docs]
+        # "skip" returns only the relevant documents
+        return get_field_path(field).get_many(docs, missing_treatment)
 
     def get_fields_across_document(
         self, fields: List[str], doc: Dict, missing_treatment="return_empty_string"
@@ -148,7 +111,8 @@ class DocReadUtils:
         Get numerous fields across a document.
         """
         return [
-            self.get_field(f, doc, missing_treatment=missing_treatment) for f in fields
+            get_field_path(f).get(doc, missing_treatment=missing_treatment)
+            for f in fields
         ]
 
     def get_fields_across_documents(
@@ -231,30 +195,7 @@ class DocReadUtils:
             >>> sample_document = {'kfc': {'item': 'chicken'}}
             >>> vi_client.is_field('kfc.item', sample_document) == True
         """
-        d = doc
-        for f in field.split("."):
-            try:
-                d = d[f]
-            except KeyError:
-                try:
-                    doc[field]
-                    return True
-                except KeyError:
-                    try:
-                        d[field]
-                    except KeyError:
-                        return False
-            except TypeError:
-                # To Support integers
-                if self._is_string_integer(f):
-                    # Get the Get the chunk document out.
-                    try:
-                        d = d[int(f)]
-                    except IndexError:
-                        pass
-                else:
-                    return False
-        return True
+        return get_field_path(field).exists(doc)
 
     def is_field_across_documents(self, field, documents):
         return all([self.is_field(field, doc)] for doc in documents)
@@ -308,10 +249,11 @@ class DocReadUtils:
             ...     }
             ... ]
         """
+        field_paths = [get_field_path(field) for field in fields]
         return [
             {
-                field: self.get_field(field, doc, missing_treatment=missing_treatment)
-                for field in fields
+                field_path.field: field_path.get(doc, missing_treatment)
+                for field_path in field_paths
             }
             for doc in docs
         ]
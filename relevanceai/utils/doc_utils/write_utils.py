@@ -1,6 +1,7 @@
 from copy import deepcopy
 from typing import List, Dict, Any
 from .read_utils import DocReadUtils
+from .field_path import get_field_path
 
 
 class DocWriteUtils(DocReadUtils):
@@ -24,7 +25,8 @@ class DocWriteUtils(DocReadUtils):
             return False
 
     def set_fields_across_document(self, fields: List[str], doc: Dict, values: List):
-        [self.set_field(f, doc, values[i]) for i, f in enumerate(fields)]
+        for i, f in enumerate(fields):
+            get_field_path(f).set(doc, values[i])
 
     @staticmethod
     def set_field(
@@ -59,19 +61,7 @@ class DocWriteUtils(DocReadUtils):
         if not inplace:
             doc = deepcopy(doc)
 
-        fields = field.split(".")
-        # Assign a pointer.
-        d = doc
-        for i, f in enumerate(fields):
-            # Assign the value if this is the last entry e.g. stores.fastfood.kfc.item will be item
-            if i == len(fields) - 1:
-                d[f] = value
-            else:
-                if f in d.keys():
-                    d = d[f]
-                else:
-                    d.update({f: {}})
-                    d = d[f]
+        get_field_path(field).set(doc, value)
 
         if not inplace:
             return doc
@@ -103,8 +93,4 @@ class DocWriteUtils(DocReadUtils):
             >>> sample_document = {'kfc': {'item': ''}}
             >>> vi_client.set_fields('kfc.item', sample_document, 'chickens')
         """
-        assert len(values) == len(docs), (
-            "Assert that the number of values " + "equates to the number of documents"
-        )
-        for i, value in enumerate(values):
-            self.set_field(field, docs[i], value)
+        get_field_path(field).set_many(docs, values)
@@ -1,7 +1,8 @@
 import os
 import sys
+import threading
 
-from typing import Callable
+from typing import Callable, Optional, Tuple
 from loguru import logger as loguru_logger
 from abc import abstractmethod
 
@@ -33,6 +34,37 @@ class AbstractLogger:
     #     raise NotImplementedError
 
 
+# The settings the loguru handlers were last added with. Loguru's logger is
+# shared by the whole process, so its handlers are only replaced when these
+# settings change rather than every time a logger is used.
+_LOGGER_SETTINGS: Optional[Tuple] = None
+_LOGGER_LOCK = threading.Lock()
+
+
+def configure_logger(
+    enable_logging: bool,
+    logging_level: str,
+    log_to_file: bool,
+    log_file_name: str,
+):
+    """Replace the loguru handlers if the settings have changed"""
+    global _LOGGER_SETTINGS
+    settings = (enable_logging, logging_level, log_to_file, log_file_name)
+    if settings == _LOGGER_SETTINGS:
+        return loguru_logger
+    with _LOGGER_LOCK:
+        if settings != _LOGGER_SETTINGS:
+            loguru_logger.remove()
+            if enable_logging:
+                loguru_logger.add(sys.stdout, level=logging_level, format="{message}")
+                if log_to_file:
+                    loguru_logger.add(
+                        log_file_name, level=logging_level, rotation="100 MB"
+                    )
+            _LOGGER_SETTINGS = settings
+    return loguru_logger
+
+
 class LoguruLogger(AbstractLogger, ConfigMixin):
     """Using verbose loguru as base logger for now"""
 
@@ -52,13 +84,12 @@ class LoguruLogger(AbstractLogger, ConfigMixin):
         log_file_name = self.config.get_option("logging.log_file_name") + ".log"
         enable_logging = str2bool(self.config.get_option("logging.enable_logging"))
 
-        logger = loguru_logger
-        logger.remove()
-        if enable_logging:
-            logger.add(sys.stdout, level=logging_level, format="{message}")
-            if log_to_file:
-                logger.add(log_file_name, level=logging_level, rotation="100 MB")
-        self._logger = logger
+        # Only touch the handlers when this object's settings have changed,
+        # so objects with different configs do not keep replacing them
+        settings = (enable_logging, logging_level, log_to_file, log_file_name)
+        if getattr(self, "_logger_settings", None) != settings:
+            self._logger = configure_logger(*settings)
+            self._logger_settings = settings
 
 
 class FileLogger:
@@ -30,23 +30,33 @@ Migrate from mongo database to Relevance Ai:
         dataset_id, document_count, chunk_size=chunk_size,
         start_idx=start_idx)
 
+    # Record the last imported _id so that an interrupted import resumes
+    mongo_importer.migrate(dataset_id, checkpoint_path="import.checkpoint")
+
 """
 
+import base64
 import copy
+import datetime
 import json
 import math
+import os
 import numpy as np
 import pandas as pd
 import warnings
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tqdm.auto import tqdm
-from typing import List
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
+from relevanceai import Client
 from relevanceai.utils import make_id
+from relevanceai.utils.concurrency import prefetch
+from relevanceai.constants.constants import MB_TO_BYTE
 from relevanceai.constants.warning import Warning
 
 try:
-    from relevanceai import Client
     from pymongo import MongoClient
 
     PYMONGO_AVAILABLE = True
@@ -55,13 +65,76 @@ except (ImportError, ModuleNotFoundError):
     warnings.warn(Warning.MISSING_PACKAGE)
 
 try:
-    from bson import json_util
+    from bson import json_util, Binary, Code, Decimal128, ObjectId, Regex, Timestamp
 
     BSON_AVAILABLE = True
 except (ImportError, ModuleNotFoundError):
     BSON_AVAILABLE = False
     warnings.warn(Warning.MISSING_PACKAGE)
 
+BSON_ENCODERS_BY_TYPE: Dict[type, Callable[[Any], Any]] = {
+    bytes: lambda o: base64.b64encode(o).decode(),
+    datetime.datetime: lambda o: o.isoformat(),
+    datetime.date: lambda o: o.isoformat(),
+}
+if BSON_AVAILABLE:
+    BSON_ENCODERS_BY_TYPE.update(
+        {
+            ObjectId: str,
+            Decimal128: lambda o: float(o.to_decimal()),
+            Binary: lambda o: base64.b64encode(o).decode(),
+            Timestamp: lambda o: o.as_datetime().isoformat(),
+            Regex: lambda o: o.pattern,
+            Code: str,
+        }
+    )
+
+
+def _encode_bson_value(value: Any, replace_nan: Any):
+    if isinstance(value, str) or isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, float):
+        return replace_nan if math.isnan(value) else value
+    if isinstance(value, int):
+        return value
+    if isinstance(value, dict):
+        return {k: _encode_bson_value(v, replace_nan) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_bson_value(v, replace_nan) for v in value]
+    encoder = BSON_ENCODERS_BY_TYPE.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+    if BSON_AVAILABLE:
+        return json.loads(json_util.dumps(value))
+    return str(value)
+
+
+def encode_bson_documents(documents: List[dict], replace_nan: Any = "") -> List[dict]:
+    """
+    Converts a batch of MongoDB documents to JSON compatible documents in one
+    pass, without a round trip through a JSON string. ObjectIds become
+    strings, dates ISO strings and NaNs `replace_nan`. Dictionaries at the
+    top level are flattened, so {f1: {f2: v}} becomes {"f1-f2": v}.
+    Documents without an `_id` are given one from their content.
+    """
+    encoded = []
+    for document in documents:
+        encoded_document = {}
+        for field, value in document.items():
+            if isinstance(value, dict):
+                for key, inner_value in value.items():
+                    encoded_document[field + "-" + key] = _encode_bson_value(
+                        inner_value, replace_nan
+                    )
+            else:
+                encoded_document[field] = _encode_bson_value(value, replace_nan)
+        if "_id" in encoded_document:
+            encoded_document["_id"] = str(encoded_document["_id"])
+        else:
+            encoded_document["_id"] = make_id(encoded_document)
+        encoded.append(encoded_document)
+    return encoded
+
 
 class MongoImporter(Client):
     def __init__(self, connection_string: str):
@@ -154,48 +227,230 @@ class MongoImporter(Client):
             return list(self.mongo_collection.find()[start_idx:end_idx])
         return list(self.mongo_collection.find())
 
+    def iterate_mongo_collection(
+        self,
+        chunk_size: int = 2000,
+        last_id: Any = None,
+        document_count: Optional[int] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Yields the collection in `_id` order, `chunk_size` documents at a
+        time. Each query starts after the last `_id` of the chunk before,
+        so it is served from the `_id` index instead of skipping over every
+        earlier document. All `_id`s should be of the same BSON type.
+
+        Parameters
+        ------------
+        chunk_size: int
+            The number of documents to fetch at a time
+        last_id: Any
+            Only documents with an `_id` after this are fetched
+        document_count: Optional[int]
+            The maximum number of documents to fetch
+        """
+        number_of_documents = 0
+        while document_count is None or number_of_documents < document_count:
+            if document_count is not None:
+                chunk_size = min(chunk_size, document_count - number_of_documents)
+            query = {} if last_id is None else {"_id": {"$gt": last_id}}
+            documents = list(
+                self.mongo_collection.find(query).sort("_id", 1).limit(chunk_size)
+            )
+            if not documents:
+                return
+            yield documents
+            number_of_documents += len(documents)
+            last_id = documents[-1]["_id"]
+
+    def _get_mongo_id_before(self, idx: int):
+        # One index scan to turn a start index into an _id to resume after
+        documents = list(
+            self.mongo_collection.find({}, {"_id": 1})
+            .sort("_id", 1)
+            .skip(idx - 1)
+            .limit(1)
+        )
+        return documents[0]["_id"] if documents else None
+
+    @staticmethod
+    def read_checkpoint(
+        checkpoint_path: Optional[str], dataset_id: str
+    ) -> Optional[dict]:
+        """The last `_id` and number of documents imported into the dataset"""
+        if checkpoint_path is None or not os.path.exists(checkpoint_path):
+            return None
+        with open(checkpoint_path) as f:
+            checkpoint = json_util.loads(f.read())
+        if checkpoint.get("dataset_id") != dataset_id:
+            return None
+        return checkpoint
+
+    @staticmethod
+    def write_checkpoint(
+        checkpoint_path: str, dataset_id: str, last_id: Any, number_of_documents: int
+    ):
+        # Written to a temporary file first so an interruption cannot corrupt it
+        checkpoint = {
+            "dataset_id": dataset_id,
+            "last_id": last_id,
+            "number_of_documents": number_of_documents,
+        }
+        with open(checkpoint_path + ".tmp", "w") as f:
+            f.write(json_util.dumps(checkpoint))
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+    def _split_by_payload_size(self, documents: List[dict]) -> Iterator[List[dict]]:
+        """Splits documents into requests of at most upload.target_chunk_mb
+        and upload.max_chunk_size documents"""
+        target_bytes = (
+            float(self.config.get_option("upload.target_chunk_mb")) * MB_TO_BYTE
+        )
+        max_chunk_size = int(self.config.get_option("upload.max_chunk_size"))
+        batch: List[dict] = []
+        batch_bytes = 0
+        for document in documents:
+            document_bytes = len(json.dumps(document))
+            if batch and (
+                batch_bytes + document_bytes > target_bytes
+                or len(batch) >= max_chunk_size
+            ):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(document)
+            batch_bytes += document_bytes
+        if batch:
+            yield batch
+
+    def _insert_mongo_documents(self, dataset_id: str, documents: List[dict]):
+        """Inserts documents in requests split by payload size, retrying the
+        ones that fail. Returns the ids of documents that could not be
+        inserted."""
+        number_of_retries = int(self.config.get_option("retries.number_of_retries"))
+        failed: List = []
+        for batch in self._split_by_payload_size(documents):
+            for _ in range(max(number_of_retries, 1)):
+                response = self.datasets.bulk_insert(dataset_id, batch)
+                failed_ids = {
+                    d["_id"] if isinstance(d, dict) else d
+                    for d in response.get("failed_documents", [])
+                }
+                batch = [d for d in batch if d["_id"] in failed_ids]
+                if not batch:
+                    break
+            failed += [d["_id"] for d in batch]
+        return failed
+
     def migrate(
         self,
         dataset_id: str,
-        document_count: int,
+        document_count: Optional[int] = None,
         chunk_size: int = 2000,
         start_idx: int = 0,
         overwite: bool = False,
+        max_workers: int = 4,
+        prefetch_chunks: int = 2,
+        checkpoint_path: Optional[str] = None,
     ):
         """
         Migrate your MongoDB dataset ID.
 
+        Chunks are fetched in `_id` order in the background while the chunk
+        before is converted to JSON, and up to `max_workers` chunks are
+        inserted at a time.
+
         Parameters
         ------------
         dataset_id: str
             Name of your dataset
-        document_count: int
-            The number of documents in your collection
+        document_count: Optional[int]
+            The number of documents to migrate. Defaults to all of them
         chunk_size: int
-            The number of chunks
+            The number of documents fetched and inserted at a time
         start_idx: int
             The start index in case it breaks
         overwrite: bool
             If True, then the dataset ID in Relevance AI will be overwritten
+        max_workers: int
+            The number of chunks inserted at a time
+        prefetch_chunks: int
+            The number of chunks fetched ahead of the one being converted
+        checkpoint_path: Optional[str]
+            A file recording the last `_id` inserted. If it exists for this
+            dataset, the migration resumes after that `_id`. It does not move
+            past a chunk with documents that could not be inserted, so they
+            are inserted again when the migration resumes
 
         """
+        checkpoint = MongoImporter.read_checkpoint(checkpoint_path, dataset_id)
         response = self.create_relevance_ai_dataset(dataset_id)
-        if "already exists" in response["message"] and not overwite:
+        if (
+            "already exists" in response["message"]
+            and not overwite
+            and checkpoint is None
+        ):
             self.logger.error(response["message"])
             return response["message"]
 
         total_ingest_cnt = 0
-        for s_idx, e_idx in tqdm(
-            MongoImporter.build_range(document_count, chunk_size, start_idx)
-        ):
-            df = pd.DataFrame(self.fetch_mongo_collection_data(s_idx, e_idx))
-            documents = self.update_id(MongoImporter.parse_json(df.to_dict("records")))
-            documents = MongoImporter.remove_nan(
-                MongoImporter.flatten_inner_indxs(documents)
-            )
-            self.insert_documents(dataset_id, documents)
-            total_ingest_cnt += len(documents)
-
+        last_id = None
+        if checkpoint is not None:
+            last_id = checkpoint["last_id"]
+            total_ingest_cnt = checkpoint["number_of_documents"]
+            self.logger.info(f"Resuming after {total_ingest_cnt} documents.")
+            if document_count is not None:
+                document_count = max(document_count - total_ingest_cnt, 0)
+        elif start_idx > 0:
+            last_id = self._get_mongo_id_before(start_idx)
+            if last_id is None:
+                document_count = 0
+
+        failed_ids: List = []
+        # Uploads in the order their chunks were fetched, so the checkpoint
+        # only moves past chunks whose earlier chunks are inserted as well
+        pending: deque = deque()
+
+        def finish_oldest_upload():
+            nonlocal total_ingest_cnt
+            future, chunk_last_id, number_of_documents = pending.popleft()
+            chunk_failed_ids = future.result()
+            if checkpoint_path is not None and not failed_ids:
+                if chunk_failed_ids:
+                    self.logger.warning(
+                        f"Failed to insert {len(chunk_failed_ids)} documents, "
+                        "the checkpoint will not move past them."
+                    )
+                else:
+                    MongoImporter.write_checkpoint(
+                        checkpoint_path,
+                        dataset_id,
+                        chunk_last_id,
+                        total_ingest_cnt + number_of_documents,
+                    )
+            failed_ids.extend(chunk_failed_ids)
+            total_ingest_cnt += number_of_documents
+            progress.update(number_of_documents)
+
+        with tqdm(total=document_count) as progress, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            for documents in prefetch(
+                self.iterate_mongo_collection(chunk_size, last_id, document_count),
+                prefetch_chunks,
+            ):
+                chunk_last_id = documents[-1]["_id"]
+                encoded = encode_bson_documents(documents)
+                future = executor.submit(
+                    self._insert_mongo_documents, dataset_id, encoded
+                )
+                pending.append((future, chunk_last_id, len(encoded)))
+                while pending and (len(pending) > max_workers or pending[0][0].done()):
+                    finish_oldest_upload()
+            while pending:
+                finish_oldest_upload()
+
+        if failed_ids:
+            self.logger.error(f"Failed to insert {len(failed_ids)} documents.")
+            total_ingest_cnt -= len(failed_ids)
         self.logger.info(
             f"Successfully ingested {total_ingest_cnt} entities to {dataset_id}."
         )
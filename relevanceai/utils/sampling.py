@@ -0,0 +1,54 @@
+"""Sampling helpers for data that is streamed in chunks"""
+import random
+
+from typing import Any, Iterable, List, Optional
+
+
+class ReservoirSampler:
+    """
+    Keeps a uniform random sample of at most `size` items from a stream of
+    unknown length (Algorithm R).
+
+    Example
+    ---------
+
+    .. code-block::
+
+        from relevanceai.utils.sampling import ReservoirSampler
+
+        sampler = ReservoirSampler(size=1000)
+        for chunk in ds.chunk_dataset(select_fields=["text"]):
+            sampler.extend(chunk)
+        documents = sampler.sample
+
+    Parameters
+    ----------
+    size: int
+        The maximum number of items to keep
+    random_state: Optional[int]
+        Seed for reproducible samples
+    """
+
+    def __init__(self, size: int, random_state: Optional[int] = None):
+        if size <= 0:
+            raise ValueError("size must be a positive integer")
+        self.size = size
+        self.sample: List[Any] = []
+        self.count = 0
+        self._random = random.Random(random_state)
+
+    def add(self, item: Any):
+        self.count += 1
+        if len(self.sample) < self.size:
+            self.sample.append(item)
+        else:
+            index = self._random.randrange(self.count)
+            if index < self.size:
+                self.sample[index] = item
+
+    def extend(self, items: Iterable[Any]):
+        for item in items:
+            self.add(item)
+
+    def __len__(self):
+        return len(self.sample)
@@ -5,11 +5,12 @@ import asyncio
 import codecs
 import time
 import json
+import threading
 import traceback
 
 from pprint import pprint
 from json.decoder import JSONDecodeError
-from typing import Optional
+from typing import Dict, Optional
 
 from urllib.parse import urlparse
 
@@ -17,6 +18,7 @@ import aiohttp
 import requests
 
 from requests import Request
+from requests.adapters import HTTPAdapter
 
 from relevanceai.constants.config import Config
 from relevanceai.utils.logger import AbstractLogger, FileLogger
@@ -27,6 +29,46 @@ from relevanceai.utils.config_mixin import ConfigMixin
 DO_NOT_REPEAT_STATUS_CODES = {400, 401, 413, 404, 422}
 _HAS_PRINTED = False
 
+# Keep-alive connections shared by every request made from the SDK
+POOL_MAXSIZE = 32
+_SESSION_LOCK = threading.Lock()
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Returns a process-wide requests session so that connections are pooled
+    across requests (and threads) instead of opening a new one every call.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_MAXSIZE, pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+
+
+def get_host_semaphore(url: str, limit: int) -> threading.BoundedSemaphore:
+    """Returns a semaphore shared by every request to the host of url, so that
+    concurrent requests from different pools can be capped per host. The limit
+    of a host is fixed by the first call for it.
+    """
+    host = urlparse(url).netloc
+    if host not in _HOST_SEMAPHORES:
+        with _SESSION_LOCK:
+            if host not in _HOST_SEMAPHORES:
+                _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(limit)
+    return _HOST_SEMAPHORES[host]
+
+
 DASHBOARD_MAPPINGS = {
     "multivector_search": "/sdk/search",
     "cluster_centroids_closest": "/sdk/cluster/centroids/closest",
@@ -259,7 +301,7 @@ class Transport(JSONEncoderUtils, ConfigMixin):
         request_url = base_url + endpoint
         for _ in range(retries):
 
-            self.logger.info("URL you are trying to access:" + request_url)
+            self.logger.info("URL you are trying to access:{}", request_url)
             try:
                 # if Transport._is_search_in_path(request_url):
                 #     self._log_to_dashboard(
@@ -292,8 +334,7 @@ class Transport(JSONEncoderUtils, ConfigMixin):
                 #         print("HEADERS: ", req.headers)
                 #         print("BODY: ", req.body)
 
-                with requests.Session() as s:
-                    response = s.send(req)
+                response = get_session().send(req)
                 if hasattr(self, "request_logger"):
                     self.log_response_to_file(response)
                 # Successful response
@@ -388,7 +429,7 @@ class Transport(JSONEncoderUtils, ConfigMixin):
         request_url = base_url + endpoint
 
         for _ in range(retries):
-            self.logger.info(f"URL you are trying to access: {request_url}")
+            self.logger.info("URL you are trying to access: {}", request_url)
             try:
                 # if Transport._is_search_in_path(request_url):
                 #     self._log_to_dashboard(
@@ -450,20 +491,28 @@ class Transport(JSONEncoderUtils, ConfigMixin):
         return response
 
     def _log_response_success(self, base_url, endpoint):
-        self.logger.success(f"Response success! ({base_url + endpoint})")
+        self.logger.success("Response success! ({}{})", base_url, endpoint)
 
     def _log_response_time(self, base_url, endpoint, time):
-        self.logger.debug(f"Request ran in {time} seconds ({base_url + endpoint})")
+        self.logger.debug("Request ran in {} seconds ({}{})", time, base_url, endpoint)
 
     def _log_response_fail(self, base_url, endpoint, status_code, content):
         self.logger.error(
-            f"Response failed ({base_url + endpoint}) (Status: {status_code} Response: {content})"
+            "Response failed ({}{}) (Status: {} Response: {})",
+            base_url,
+            endpoint,
+            status_code,
+            content,
         )
 
     def _log_connection_error(self, base_url, endpoint):
-        self.logger.error(f"Connection error but re-trying. ({base_url + endpoint})")
+        self.logger.error("Connection error but re-trying. ({}{})", base_url, endpoint)
 
     def _log_no_json(self, base_url, endpoint, status_code, content):
         self.logger.error(
-            f"No JSON Available ({base_url + endpoint}) (Status: {status_code} Response: {content})"
+            "No JSON Available ({}{}) (Status: {} Response: {})",
+            base_url,
+            endpoint,
+            status_code,
+            content,
         )
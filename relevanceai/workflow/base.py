@@ -9,19 +9,48 @@ from relevanceai.utils import DocUtils
 from relevanceai.dataset import Dataset
 
 
+def _strip_prefix(field: str, prefix: str) -> str:
+    return field[len(prefix) :] if field.startswith(prefix) else field
+
+
 class Workflow(DocUtils):
     """
     Base Workflow. A workflow is useful for measuring what you did with a dataset.
     By adding an alias, you allow it to continue running even when it errors.
     """
 
+    bulk_func: Optional[Callable] = None
+    batch_size: int = 1000
+
     def __init__(
-        self, func: Callable, workflow_alias: str, notes: Optional[str] = None
+        self,
+        func: Callable,
+        workflow_alias: str,
+        notes: Optional[str] = None,
+        bulk_func: Optional[Callable] = None,
+        batch_size: int = 1000,
     ):
-        """ """
+        """
+        Parameters
+        ------------
+        func: Callable
+            Run on the input field of each document
+        bulk_func: Callable
+            Run on a list of values from chunk fields at a time. Defaults to
+            running func on each value.
+        batch_size: int
+            The most chunk values to pass to bulk_func at a time
+        """
         self.func = func
         self.workflow_alias = workflow_alias
         self.notes = notes
+        self.bulk_func = bulk_func
+        self.batch_size = batch_size
+
+    def _bulk_func(self, values: list) -> list:
+        if self.bulk_func is not None:
+            return self.bulk_func(values)
+        return [self.func(v) for v in values]
 
     def fit_dataset(
         self,
@@ -65,24 +94,40 @@ class Workflow(DocUtils):
             if chunk_field not in input_field:
                 input_field = chunk_field + "." + input_field
 
-        def update_func(doc):
-            if chunk_field:
+            # Values of every chunk in a batch of documents go to the
+            # function together
+            def update_chunks(docs):
                 try:
-                    self.run_function_across_chunks(
-                        function=self.func,
+                    self.run_function_across_chunks_batched(
+                        function=self._bulk_func,
                         chunk_field=chunk_field,
-                        field=input_field,
-                        output_field=output_field,
-                        doc=doc,
+                        field=_strip_prefix(input_field, chunk_field + "."),
+                        output_field=_strip_prefix(output_field, chunk_field + "."),
+                        docs=docs,
+                        batch_size=self.batch_size,
                     )
                 except Exception as e:
                     traceback.print_exc()
-            else:
-                try:
-                    value = self.get_field(input_field, doc)
-                    self.set_field(output_field, doc, self.func(value))
-                except Exception as e:
-                    traceback.print_exc()
+                return docs
+
+            results = self.dataset.pull_update_push_async(
+                self.dataset.dataset_id,
+                update_chunks,
+                select_fields=[input_field],
+                filters=filters,
+                retrieve_chunk_size=chunksize,
+                log_to_file=log_to_file,
+                log_file=log_file,
+            )
+            self._store_workflow_to_metadata(input_field, output_field)
+            return results
+
+        def update_func(doc):
+            try:
+                value = self.get_field(input_field, doc)
+                self.set_field(output_field, doc, self.func(value))
+            except Exception as e:
+                traceback.print_exc()
             return doc
 
         # Store this workflow inside the dataset's metadata
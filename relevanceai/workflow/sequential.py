@@ -65,14 +65,18 @@ class Input(Ops):
 
 
 class Output(Ops):
-    """Update documents"""
+    """Update documents. With track_changes, only the _id and the fields that
+    changed are sent back and unchanged documents are skipped."""
 
     _update_: bool = True
 
-    def __init__(self, output_field: Union[str, list]):
+    def __init__(self, output_field: Union[str, list], track_changes: bool = False):
         self.output_field = output_field
+        self.track_changes = track_changes
 
     def __call__(self, values, documents, dataset: Dataset):
+        if self.track_changes:
+            snapshots = self.snapshot_documents(documents)
         if isinstance(self.output_field, str):
             self.set_field_across_documents(self.output_field, values, documents)
         elif isinstance(self.output_field, list):
@@ -80,6 +84,11 @@ class Output(Ops):
                 self.set_field_across_documents(f, values, documents)
         else:
             raise ValueError("Incorrect number of fields.")
+        if self.track_changes:
+            updates = self.diff_documents(snapshots, documents)
+            if len(updates) == 0:
+                return None, documents
+            return dataset.upsert_documents(updates), documents
         upsert_results = dataset.upsert_documents(documents)
         return upsert_results, documents
 
@@ -135,9 +144,21 @@ class SequentialWorkflow(DocUtils):
             "Data type not supported. Please ensure it is a list of dicts of a Dataset object."
         )
 
-    def run(self, dataset: Dataset, verbose: bool = False, log_to_file: bool = False):
+    def run(
+        self,
+        dataset: Dataset,
+        verbose: bool = False,
+        log_to_file: bool = False,
+        track_changes: bool = False,
+    ):
         """
         Run the sequential workflow
+
+        Parameters
+        ----------
+        track_changes: bool
+            If True, only the _id and the fields that changed are upserted and
+            documents that did not change are skipped
         """
         if len(self.list_of_operations) == 0:
             return
@@ -152,6 +173,8 @@ class SequentialWorkflow(DocUtils):
             for i, documents in enumerate(input_operator(dataset)):
                 if documents is None:
                     return
+                if track_changes:
+                    snapshots = self.snapshot_documents(documents)
                 if len(input_operator.input_fields) == 1:
                     values = self.get_field_across_documents(
                         input_operator.input_fields[0], documents
@@ -179,7 +202,15 @@ class SequentialWorkflow(DocUtils):
                         )
                         if verbose:
                             print(documents)
-                        upsert_results = dataset.upsert_documents(documents)
+                        if track_changes:
+                            updates = self.diff_documents(snapshots, documents)
+                            # later outputs only send what changed after this one
+                            snapshots = self.snapshot_documents(documents)
+                            if len(updates) == 0:
+                                continue
+                            upsert_results = dataset.upsert_documents(updates)
+                        else:
+                            upsert_results = dataset.upsert_documents(documents)
                         if verbose:
                             print(upsert_results)
                     else:
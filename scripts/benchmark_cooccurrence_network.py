@@ -0,0 +1,171 @@
+"""
+Compare the memory and wall time of the sparse co-occurrence network against
+the previous dense implementation on synthetic Zipf-distributed texts.
+
+    python scripts/benchmark_cooccurrence_network.py --concepts 5000
+    python scripts/benchmark_cooccurrence_network.py --concepts 50000 --texts 50000
+
+The dense implementation stores a documents x concepts count matrix and runs
+Prim's algorithm in pure Python, so it is skipped (with an estimate) when it
+would need more than --max-dense-gb of memory or --max-dense-ops iterations.
+Complete linkage clustering needs a dense concepts x concepts distance matrix
+in both implementations and is skipped on the same memory budget.
+"""
+import argparse
+import sys
+import time
+import tracemalloc
+
+from typing import Callable, List
+
+import numpy as np
+from sklearn.cluster import AgglomerativeClustering
+
+from relevanceai.operations_new.cooccurrence_network.transform import (
+    CoOccurNetTransform,
+    WordDictionary,
+)
+
+
+def dense_concurrence_matrix(top_ids, texts, word_dict):
+    word_count_mat = []
+    for text in texts:
+        row = [0] * len(top_ids)
+        for word in text:
+            id = word_dict.word2id[word]
+            if id in top_ids:
+                row[top_ids.index(id)] = 1
+        word_count_mat.append(row)
+    word_count_mat = np.array(word_count_mat)
+    return np.dot(word_count_mat.transpose(), word_count_mat)
+
+
+def dense_maximum_spanning_tree(graph):
+    number_of_vertices = len(graph)
+    visited = [False] * number_of_vertices
+    weights = [-sys.maxsize] * number_of_vertices
+    parent = [0] * number_of_vertices
+    weights[0] = sys.maxsize
+    parent[0] = -1
+    for _ in range(number_of_vertices - 1):
+        index, max_weight = -1, -sys.maxsize
+        for i in range(number_of_vertices):
+            if not visited[i] and weights[i] > max_weight:
+                index, max_weight = i, weights[i]
+        visited[index] = True
+        for j in range(number_of_vertices):
+            if graph[j][index] != 0 and not visited[j] and graph[j][index] > weights[j]:
+                weights[j] = graph[j][index]
+                parent[j] = index
+    return parent
+
+
+def dense_clusters_labels(mat):
+    number_of_vertices = len(mat)
+    labels = np.zeros((number_of_vertices, number_of_vertices), dtype=int)
+    labels[:, 0] = np.arange(number_of_vertices)
+    params = dict(linkage="complete")
+    if "metric" in AgglomerativeClustering().get_params():
+        params["metric"] = "precomputed"
+    else:
+        params["affinity"] = "precomputed"
+    children = AgglomerativeClustering(**params).fit(mat).children_
+    for i, merged in enumerate(children):
+        for j in range(number_of_vertices):
+            if labels[j, i] in merged:
+                labels[j, i + 1] = i + number_of_vertices
+            else:
+                labels[j, i + 1] = labels[j, i]
+    return labels
+
+
+def make_texts(
+    number_of_texts: int, vocabulary_size: int, words_per_text: int, seed: int = 0
+) -> List[List[str]]:
+    rng = np.random.default_rng(seed)
+    ranks = np.minimum(
+        rng.zipf(1.1, size=(number_of_texts, words_per_text)), vocabulary_size
+    )
+    return [[f"w{rank}" for rank in row] for row in ranks]
+
+
+def measure(name: str, func: Callable, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {name:<28} {seconds:>10.2f}s {peak / 1e6:>12.1f}MB")
+    return result
+
+
+def skip(name: str, reason: str):
+    print(f"  {name:<28} {'skipped':>11} {'':>13} ({reason})")
+
+
+def benchmark(number_of_concepts: int, args):
+    texts = make_texts(args.texts, number_of_concepts * 4, args.words_per_text)
+    word_dict = WordDictionary(texts)
+    df_table = word_dict.get_df_table()
+    top_ids = sorted(df_table, key=df_table.get, reverse=True)[:number_of_concepts]
+    V = len(top_ids)
+    print(f"\n{V} concepts, {len(texts)} texts")
+    print(f"  {'step':<28} {'wall time':>11} {'peak memory':>13}")
+
+    transform = CoOccurNetTransform(number_of_concepts=number_of_concepts)
+    sparse = measure(
+        "sparse co-occurrence", transform.concurrence_matrix, top_ids, texts, word_dict
+    )
+    measure("sparse spanning tree", transform.maximum_spanning_tree, sparse)
+
+    # sklearn keeps a few copies of the concepts x concepts distance matrix
+    dense_gb = V * V * 8 / 1e9
+    if 3 * dense_gb <= args.max_dense_gb:
+        measure(
+            "sparse clustering",
+            transform.get_clusters_labels,
+            sparse,
+            range(
+                transform.min_number_of_clusters, transform.max_number_of_clusters + 1
+            ),
+        )
+    else:
+        skip("sparse clustering", f"dense distances need ~{3 * dense_gb:.0f}GB")
+
+    count_matrix_gb = len(texts) * V * 8 / 1e9
+    if count_matrix_gb + dense_gb > args.max_dense_gb:
+        skip("dense co-occurrence", f"needs ~{count_matrix_gb + dense_gb:.1f}GB")
+        return
+    if len(texts) * args.words_per_text * V > args.max_dense_ops:
+        skip("dense co-occurrence", "top_ids.index is O(V) per word")
+        return
+    dense = measure(
+        "dense co-occurrence", dense_concurrence_matrix, top_ids, texts, word_dict
+    )
+
+    if V * V > args.max_dense_ops:
+        skip("dense spanning tree", f"~{V * V:.1e} Python iterations")
+    else:
+        measure("dense spanning tree", dense_maximum_spanning_tree, dense.tolist())
+
+    if V * V > args.max_dense_ops:
+        skip("dense clustering", f"~{V * V:.1e} Python iterations")
+    else:
+        measure("dense clustering", dense_clusters_labels, dense[0][0] - dense)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concepts", type=int, nargs="+", default=[5000, 50000])
+    parser.add_argument("--texts", type=int, default=5000)
+    parser.add_argument("--words-per-text", type=int, default=30)
+    parser.add_argument("--max-dense-gb", type=float, default=4.0)
+    parser.add_argument("--max-dense-ops", type=float, default=1e9)
+    args = parser.parse_args()
+    for number_of_concepts in args.concepts:
+        benchmark(number_of_concepts, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Compare the recall and latency of IVF search in LocalVectorIndex against
+exact search over the same random clustered vectors.
+
+    python scripts/benchmark_local_index.py --vectors 200000 --dimension 128
+    python scripts/benchmark_local_index.py --lists 1000 --probes 1 4 16 64
+    python scripts/benchmark_local_index.py --faiss
+
+Recall@k is the fraction of the exact top k found by the approximate search.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from relevanceai.operations.vector import LocalVectorIndex
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vectors", type=int, default=200000)
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--lists", type=int, default=None)
+    parser.add_argument("--probes", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--metric", default="cosine")
+    parser.add_argument("--faiss", action="store_true")
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(0)
+    centers = rng.normal(size=(1000, args.dimension))
+    vectors = centers[rng.randint(1000, size=args.vectors)] + 0.5 * rng.normal(
+        size=(args.vectors, args.dimension)
+    )
+    queries = centers[rng.randint(1000, size=args.queries)] + 0.5 * rng.normal(
+        size=(args.queries, args.dimension)
+    )
+
+    index = LocalVectorIndex(
+        dimension=args.dimension, metric=args.metric, use_faiss=args.faiss
+    )
+    start = time.perf_counter()
+    for i in range(0, args.vectors, 10000):
+        index.add([str(j) for j in range(i, i + 10000)], vectors[i : i + 10000])
+    print(f"added {len(index)} vectors in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    exact, _ = index.search_indices(queries, k=args.k, exact=True)
+    exact_time = time.perf_counter() - start
+    print(
+        f"exact: {1000 * exact_time / args.queries:.2f}ms per query "
+        f"({args.queries / exact_time:.0f} queries/s)"
+    )
+
+    start = time.perf_counter()
+    index.train(number_of_lists=args.lists)
+    print(f"trained {len(index.centroids)} lists in {time.perf_counter() - start:.2f}s")
+
+    for number_of_probes in args.probes:
+        start = time.perf_counter()
+        approximate, _ = index.search_indices(
+            queries, k=args.k, number_of_probes=number_of_probes
+        )
+        ivf_time = time.perf_counter() - start
+        recall = np.mean(
+            [len(set(a) & set(e)) / args.k for a, e in zip(approximate, exact)]
+        )
+        print(
+            f"ivf probes={number_of_probes}: recall@{args.k} {recall:.3f}, "
+            f"{1000 * ivf_time / args.queries:.2f}ms per query, "
+            f"{exact_time / ivf_time:.1f}x faster than exact"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare the CPU throughput of batched extractive question answering against
+calling the question-answering pipeline once per context.
+
+A tiny randomly initialised BERT model and a word-level vocabulary are saved
+to a temporary directory, so nothing is downloaded.
+
+    python scripts/benchmark_question_answer.py --contexts 1000
+    python scripts/benchmark_question_answer.py --contexts 200 --max-words 800
+
+Contexts longer than --max-length tokens are split into overlapping windows
+by both implementations.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+import torch
+
+from transformers import BertConfig, BertForQuestionAnswering, BertTokenizerFast
+
+from relevanceai.operations.text.qa.qa import QAOps
+
+SPECIAL_TOKENS = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+
+
+def build_tiny_model(directory: str, words: list):
+    vocab_file = os.path.join(directory, "vocab.txt")
+    with open(vocab_file, "w") as f:
+        f.write("\n".join(SPECIAL_TOKENS + words))
+    tokenizer = BertTokenizerFast(vocab_file=vocab_file)
+    config = BertConfig(
+        vocab_size=len(SPECIAL_TOKENS) + len(words),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        max_position_embeddings=512,
+    )
+    torch.manual_seed(0)
+    model = BertForQuestionAnswering(config)
+    model.save_pretrained(directory)
+    tokenizer.save_pretrained(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--contexts", type=int, default=1000)
+    parser.add_argument("--min-words", type=int, default=20)
+    parser.add_argument("--max-words", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--max-length", type=int, default=384)
+    parser.add_argument("--stride", type=int, default=128)
+    args = parser.parse_args()
+
+    torch.set_num_threads(max(os.cpu_count() or 1, 1))
+    random.seed(0)
+    words = [f"word{i}" for i in range(2000)]
+    contexts = [
+        " ".join(
+            random.choices(words, k=random.randint(args.min_words, args.max_words))
+        )
+        for _ in range(args.contexts)
+    ]
+    question = "which word comes first"
+
+    with tempfile.TemporaryDirectory() as directory:
+        build_tiny_model(directory, words + question.split())
+        ops = QAOps(
+            model_name=directory,
+            batch_size=args.batch_size,
+            max_length=args.max_length,
+            stride=args.stride,
+        )
+
+        start = time.perf_counter()
+        looped = [
+            ops.qa_model(
+                question=question,
+                context=context,
+                max_seq_len=args.max_length,
+                doc_stride=args.stride,
+            )
+            for context in contexts
+        ]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = ops.bulk_question_answer(question, contexts)
+        batch_time = time.perf_counter() - start
+
+    same_answers = sum(a["answer"] == b["answer"] for a, b in zip(looped, batched))
+    print(f"contexts: {len(contexts)}")
+    print(
+        f"per-context pipeline: {loop_time:.2f}s ({len(contexts) / loop_time:.1f} contexts/s)"
+    )
+    print(f"batched: {batch_time:.2f}s ({len(contexts) / batch_time:.1f} contexts/s)")
+    print(f"speedup: {loop_time / batch_time:.1f}x")
+    print(f"same answer: {same_answers / len(contexts):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,8 @@ umap = ["umap-learn>=0.5.2"]
 # ivis_gpu = ["ivis[gpu]>=2.0.6"]
 kmedoids = ["scikit-learn-extra>=0.2.0"]
 hdbscan = ["hdbscan>=0.8.27"]
+parquet = ["pyarrow>=6.0.0"]
+faiss = ["faiss-cpu>=1.7.0"]
 
 test_requirements = (
     [
@@ -125,6 +127,8 @@ setup(
         # "ivis-gpu": ivis_gpu,
         "kmedoids": kmedoids,
         "hdbscan": hdbscan,
+        "parquet": parquet,
+        "faiss": faiss,
         "models": models_requirements,
     },
     python_requires=">=3.6",
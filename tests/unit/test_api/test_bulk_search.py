@@ -0,0 +1,188 @@
+"""Testing concurrent bulk search against a local server with latency
+"""
+import importlib
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from relevanceai._api.endpoints.services.search import SearchClient
+from relevanceai.client.helpers import Credentials
+from relevanceai.utils.cache import TTLCache
+
+creds_mixin = importlib.import_module("relevanceai.utils.creds_mixin")
+
+LATENCY = 0.05
+
+
+class SearchHandler(BaseHTTPRequestHandler):
+    requests = []
+    failing_values = set()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        SearchHandler.requests.append((self.path, body))
+        time.sleep(LATENCY)
+        vector = body["multivector_query"][0]["vector"]
+        if vector[0] in SearchHandler.failing_values:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        content = json.dumps({"results": [{"_id": str(vector[0])}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SearchHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/latest"
+    monkeypatch.setattr(creds_mixin, "region_to_url", lambda region: url)
+    monkeypatch.setattr(SearchClient, "_bulk_search_cache", None)
+    SearchHandler.requests = []
+    SearchHandler.failing_values = set()
+    client = SearchClient(
+        credentials=Credentials(
+            token="project:api_key:us-east-1:firebase_uid",
+            project="project",
+            api_key="api_key",
+            region="us-east-1",
+            firebase_uid="firebase_uid",
+        )
+    )
+    client.config["retries.number_of_retries"] = 1
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def get_queries(values):
+    return [
+        {
+            "dataset_id": "sample",
+            "multivector_query": [{"vector": [v, 0.5], "fields": ["text_vector_"]}],
+        }
+        for v in values
+    ]
+
+
+def test_bulk_search_is_concurrent_and_ordered(client):
+    queries = get_queries(range(40))
+    start = time.perf_counter()
+    sequential = [client.vector(**query) for query in queries]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = client.bulk_search(queries, mode="vector", max_workers=8)
+    bulk_time = time.perf_counter() - start
+
+    assert results == sequential
+    assert [r["results"][0]["_id"] for r in results] == [str(i) for i in range(40)]
+    assert bulk_time * 3 < sequential_time
+    paths = {path for path, _ in SearchHandler.requests}
+    assert paths == {"/latest/services/search/vector"}
+
+
+def test_identical_queries_are_sent_once_and_cached(client):
+    queries = get_queries([1, 2, 1, 3, 2, 1])
+    # Key order should not matter
+    queries[2] = dict(reversed(list(queries[2].items())))
+    results, stats = client.bulk_search(queries, return_stats=True)
+
+    assert len(SearchHandler.requests) == 3
+    assert results[0] is results[2] is results[5]
+    assert stats["number_of_queries"] == 6
+    assert stats["number_of_unique_queries"] == 3
+    assert stats["number_of_requests"] == 3
+    assert stats["cache_hit_rate"] == 0
+    assert stats["latency_p50"] >= LATENCY
+    assert stats["latency_p99"] >= stats["latency_p50"]
+
+    results, stats = client.bulk_search(get_queries([3, 4]), return_stats=True)
+    assert len(SearchHandler.requests) == 4
+    assert stats["number_of_cache_hits"] == 1
+    assert stats["cache_hit_rate"] == 0.5
+
+    client.bulk_search(get_queries([3]), use_cache=False)
+    assert len(SearchHandler.requests) == 5
+
+
+def test_concurrent_requests_are_capped_per_host(client):
+    client.config["search.max_connections_per_host"] = 4
+    active = []
+    peak = []
+    lock = threading.Lock()
+    vector = client.vector
+
+    def counting_vector(**kwargs):
+        with lock:
+            active.append(1)
+            peak.append(len(active))
+        try:
+            return vector(**kwargs)
+        finally:
+            with lock:
+                active.pop()
+
+    client.vector = counting_vector
+    client.bulk_search(get_queries(range(20)), max_workers=16)
+    assert max(peak) <= 4
+
+
+def test_failed_searches_are_reported_and_not_cached(client):
+    SearchHandler.failing_values = {2}
+    results, stats = client.bulk_search(get_queries([1, 2, 3]), return_stats=True)
+
+    assert [r["results"][0]["_id"] for r in results[::2]] == ["1", "3"]
+    assert results[1].status_code == 500
+    assert stats["failed_queries"] == [1]
+
+    SearchHandler.failing_values = set()
+    results, stats = client.bulk_search(get_queries([1, 2, 3]), return_stats=True)
+    assert results[1]["results"][0]["_id"] == "2"
+    assert stats["number_of_cache_hits"] == 2
+    assert stats["failed_queries"] == []
+
+
+def test_searches_that_raise_do_not_drop_the_others(client):
+    vector = client.vector
+
+    def raising_vector(**kwargs):
+        if kwargs["multivector_query"][0]["vector"][0] == 2:
+            raise ConnectionError("Search failed")
+        return vector(**kwargs)
+
+    client.vector = raising_vector
+    results, stats = client.bulk_search(get_queries([1, 2, 3]), return_stats=True)
+    assert isinstance(results[1], ConnectionError)
+    assert stats["failed_queries"] == [1]
+    assert stats["number_of_requests"] == 3
+
+    client.vector = vector
+    results, stats = client.bulk_search(get_queries([1, 2, 3]), return_stats=True)
+    assert stats["number_of_requests"] == 1
+
+
+def test_ttl_cache_expires_values():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    cache.set_many([("a", 1), ("b", 2)])
+    assert cache.get_many(["a", "c"]) == ({"a": 1}, ["c"])
+
+    now[0] = 11
+    assert cache.get_many(["a", "b"]) == ({}, ["a", "b"])
+    cache.set_many([("a", 3), ("b", 4), ("c", 5)])
+    assert "a" not in cache
+    assert cache.get_many(["b", "c"]) == ({"b": 4, "c": 5}, [])
@@ -0,0 +1,98 @@
+"""Testing code for coalescing document lookups
+"""
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+from relevanceai._api.batch.loader import DocumentLoader
+from relevanceai._api.batch.retrieve import BatchRetrieveClient
+from relevanceai.constants import CONFIG
+
+
+class TestDocumentLoader:
+    def setup_method(self):
+        self.calls = []
+
+    def bulk_get(self, ids):
+        self.calls.append(ids)
+        return [{"_id": i, "value": int(i)} for i in ids if i != "missing"]
+
+    def slow_bulk_get(self, ids):
+        time.sleep(0.1)
+        return self.bulk_get(ids)
+
+    def test_concurrent_loads_are_coalesced(self):
+        loader = DocumentLoader(self.slow_bulk_get, max_batch_size=1000, wait_ms=200)
+        ids = [str(i % 10) for i in range(50)]
+        with ThreadPoolExecutor(max_workers=50) as executor:
+            documents = list(executor.map(loader.load, ids))
+
+        assert [d["_id"] for d in documents] == ids
+        # The first lookup is sent straight away and the others share a batch
+        assert len(self.calls) == 2
+        assert len(self.calls[0]) == 1
+        assert sorted(set(self.calls[0] + self.calls[1])) == sorted(set(ids))
+
+    def test_max_batch_size(self):
+        loader = DocumentLoader(self.bulk_get, max_batch_size=10, wait_ms=1000)
+        loader._in_flight = 1
+        futures = [loader.load_async(str(i)) for i in range(25)]
+        loader._in_flight = 0
+        loader.flush()
+        assert [f.result()["value"] for f in futures] == list(range(25))
+        assert [len(c) for c in self.calls] == [10, 10, 5]
+
+    def test_missing_document(self):
+        loader = DocumentLoader(self.bulk_get, wait_ms=1)
+        assert loader.load("missing") is None
+
+    def test_single_lookup_is_sent_immediately_with_single_fn(self):
+        single_calls = []
+
+        def get(id):
+            single_calls.append(id)
+            return {"message": f"{id} not found"}
+
+        loader = DocumentLoader(self.bulk_get, wait_ms=10000, single_fn=get)
+        start = time.perf_counter()
+        assert loader.load("missing") == {"message": "missing not found"}
+        assert time.perf_counter() - start < 5
+        assert single_calls == ["missing"]
+        assert self.calls == []
+
+
+class MockDocuments:
+    def __init__(self):
+        self.calls = []
+
+    def bulk_get(self, dataset_id, ids, include_vector=True, select_fields=None):
+        self.calls.append(ids)
+        return {
+            "documents": [{"_id": i} for i in ids if i != "missing"],
+            "count": len(ids),
+        }
+
+
+class MockDatasets:
+    def __init__(self):
+        self.documents = MockDocuments()
+
+
+def test_bulk_get_documents_keeps_the_response():
+    client = BatchRetrieveClient.__new__(BatchRetrieveClient)
+    client.config = CONFIG
+    client._datasets_client = MockDatasets()
+
+    response = client._bulk_get_documents(
+        "dataset", ["b", "a", "b", "missing"], return_response=True
+    )
+    assert response == {"documents": [{"_id": "b"}, {"_id": "a"}], "count": 3}
+
+    documents = client._bulk_get_documents(
+        "dataset", [str(i) for i in range(5)], chunksize=2
+    )
+    assert [d["_id"] for d in documents] == [str(i) for i in range(5)]
+    response = client._bulk_get_documents(
+        "dataset", [str(i) for i in range(5)], chunksize=2, return_response=True
+    )
+    assert len(response["documents"]) == 5 and response["count"] == 2
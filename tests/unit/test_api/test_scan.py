@@ -0,0 +1,159 @@
+"""Testing partitioned scans against a local server with latency
+"""
+import importlib
+import json
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from relevanceai._api.batch.retrieve import BatchRetrieveClient
+from relevanceai.client.helpers import Credentials
+
+creds_mixin = importlib.import_module("relevanceai.utils.creds_mixin")
+
+LATENCY = 0.05
+NUMBER_OF_DOCUMENTS = 2000
+# Every 100th document has no value
+DOCUMENTS = [
+    {"_id": f"{i:05d}", "value": i} if i % 100 else {"_id": f"{i:05d}"}
+    for i in range(NUMBER_OF_DOCUMENTS)
+]
+
+CONDITIONS = {
+    ">=": lambda a, b: a >= b,
+    ">": lambda a, b: a > b,
+    "<=": lambda a, b: a <= b,
+    "<": lambda a, b: a < b,
+    "==": lambda a, b: a == b,
+}
+
+
+def matches(document, f):
+    if f["filter_type"] == "exists":
+        return (f["field"] in document) == (f["condition"] == "==")
+    if f["filter_type"] == "numeric":
+        return f["field"] in document and CONDITIONS[f["condition"]](
+            document[f["field"]], f["condition_value"]
+        )
+    raise NotImplementedError(f["filter_type"])
+
+
+class GetWhereHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(LATENCY)
+        documents = [
+            d for d in DOCUMENTS if all(matches(d, f) for f in body["filters"])
+        ]
+        for sort in body["sort"]:
+            ((field, order),) = sort.items()
+            documents.sort(key=lambda d: d[field], reverse=order == "desc")
+        if body.get("after_id"):
+            documents = [d for d in documents if d["_id"] > body["after_id"][0]]
+        page = documents[: body["page_size"]]
+        response = {
+            "documents": page,
+            "count": len(documents),
+            "after_id": [page[-1]["_id"]] if page else [],
+            "cursor": None,
+        }
+        content = json.dumps(response).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def client(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GetWhereHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/latest"
+    monkeypatch.setattr(creds_mixin, "region_to_url", lambda region: url)
+    client = BatchRetrieveClient(
+        credentials=Credentials(
+            token="project:api_key:us-east-1:firebase_uid",
+            project="project",
+            api_key="api_key",
+            region="us-east-1",
+            firebase_uid="firebase_uid",
+        )
+    )
+    client.config["retries.number_of_retries"] = 1
+    yield client
+    server.shutdown()
+    server.server_close()
+
+
+def test_partitions_cover_every_document(client):
+    partitions = client._get_partition_filters("sample", "value", 4)
+    # 4 ranges of value and 1 for documents without it
+    assert len(partitions) == 5
+    assert partitions[-1] == [
+        {
+            "field": "value",
+            "filter_type": "exists",
+            "condition": "!=",
+            "condition_value": " ",
+        }
+    ]
+
+
+def test_partitioned_scan_is_faster_and_complete(client):
+    start = time.perf_counter()
+    sequential = [
+        d["_id"]
+        for chunk in client._page_documents("sample", chunksize=50)
+        for d in chunk
+    ]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    partitioned = [
+        d["_id"]
+        for chunk in client._scan_documents(
+            "sample",
+            chunksize=50,
+            partition_field="value",
+            number_of_partitions=8,
+            max_workers=8,
+        )
+        for d in chunk
+    ]
+    partitioned_time = time.perf_counter() - start
+
+    assert len(sequential) == NUMBER_OF_DOCUMENTS
+    assert sorted(partitioned) == sequential
+    assert partitioned_time * 2 < sequential_time
+
+
+def test_ordered_scan_yields_partitions_in_order(client):
+    documents = client._get_all_documents(
+        "sample",
+        chunksize=50,
+        partition_field="value",
+        number_of_partitions=4,
+        max_workers=4,
+    )
+    values = [d["value"] for d in documents if "value" in d]
+    assert values == sorted(values)
+    assert len(documents) == NUMBER_OF_DOCUMENTS
+    # Documents without the field come last
+    assert "value" not in documents[-1]
+
+
+def test_scan_errors_are_raised(client):
+    def fail(*args, **kwargs):
+        raise ValueError("Failed")
+
+    client._page_documents = fail
+    with pytest.raises(ValueError):
+        list(client._scan_documents("sample", partitions=[[], []], max_workers=2))
@@ -0,0 +1,46 @@
+"""Testing apply with executor="process" against a stub dataset
+"""
+import pytest
+
+from relevanceai.constants import CONFIG
+from relevanceai.dataset.write.write import Write
+
+
+def double_value(document):
+    document["value"] *= 2
+    return document
+
+
+class MockWrite(Write):
+    def __init__(self, documents, failed_ids=()):
+        self.dataset_id = "dataset"
+        self.config = CONFIG
+        self.documents = documents
+        self.failed_ids = failed_ids
+        self.updated = []
+
+    def chunk_dataset(self, select_fields=None, filters=None, chunksize=None):
+        for i in range(0, len(self.documents), chunksize):
+            yield [dict(d) for d in self.documents[i : i + chunksize]]
+
+    def _update_documents(self, dataset_id, documents, **kwargs):
+        self.updated.extend(documents)
+        return {
+            "failed_documents": [
+                d["_id"] for d in documents if d["_id"] in self.failed_ids
+            ]
+        }
+
+
+@pytest.mark.parametrize("failed_ids", [(), ("3",)])
+def test_apply_in_processes_returns_failures_and_timings(failed_ids):
+    dataset = MockWrite(
+        [{"_id": str(i), "value": i} for i in range(10)], failed_ids=failed_ids
+    )
+    results = dataset.apply(
+        double_value, executor="process", max_workers=2, retrieve_chunksize=3
+    )
+
+    assert results["failed_documents"] == list(failed_ids)
+    assert results["timings"]["documents"] == 10
+    assert sorted(d["value"] for d in dataset.updated) == [i * 2 for i in range(10)]
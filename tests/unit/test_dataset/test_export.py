@@ -0,0 +1,146 @@
+"""
+    Testing that exports stream documents in chunks
+"""
+import csv
+import json
+import tracemalloc
+
+import pytest
+
+from relevanceai.dataset.io.export import Export
+from relevanceai.dataset.io.export.streaming import get_export_columns
+
+SCHEMA = {
+    "_chunk_": "chunks",
+    "_chunk_.label": "text",
+    "value": "numeric",
+    "nested": "dict",
+    "nested.text": "text",
+    "nested.deeper.flag": "bool",
+    "sample_vector_": {"vector": 8},
+}
+
+
+class StreamedDataset(Export):
+    """A dataset whose documents are generated a chunk at a time"""
+
+    def __init__(self, number_of_documents: int):
+        self.number_of_documents = number_of_documents
+        self.selected_fields = None
+        self.chunk_kwargs = {}
+
+    @property
+    def schema(self):
+        return SCHEMA
+
+    def chunk_dataset(
+        self,
+        select_fields=None,
+        chunksize=100,
+        filters=None,
+        include_vector=True,
+        **kwargs,
+    ):
+        self.selected_fields = select_fields
+        self.chunk_kwargs = kwargs
+        for start in range(0, self.number_of_documents, chunksize):
+            stop = min(start + chunksize, self.number_of_documents)
+            yield [
+                {
+                    "_id": str(i),
+                    "value": i,
+                    "nested": {"text": f"text {i}", "deeper": {"flag": i % 2 == 0}},
+                    "_chunk_": [{"label": "a"}],
+                    "sample_vector_": [0.1 * i] * 8,
+                }
+                for i in range(start, stop)
+            ]
+
+
+def test_export_columns_are_stable_and_flattened():
+    assert get_export_columns(SCHEMA) == [
+        "_id",
+        "_chunk_",
+        "nested.deeper.flag",
+        "nested.text",
+        "sample_vector_",
+        "value",
+    ]
+    assert "sample_vector_" not in get_export_columns(SCHEMA, include_vector=False)
+    assert get_export_columns(SCHEMA, select_fields=["value"]) == ["_id", "value"]
+
+
+def test_to_csv_flattens_documents(tmp_path):
+    filename = str(tmp_path / "export.csv")
+    StreamedDataset(5).to_csv(filename, chunksize=2, include_vector=False)
+    with open(filename, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 5
+    assert rows[1] == {
+        "_id": "1",
+        "_chunk_": '[{"label":"a"}]',
+        "nested.deeper.flag": "False",
+        "nested.text": "text 1",
+        "value": "1",
+    }
+
+
+def test_to_csv_passes_on_get_all_documents_arguments(tmp_path):
+    dataset = StreamedDataset(5)
+    with pytest.warns(DeprecationWarning, match="show_progress_bar"):
+        dataset.to_csv(
+            str(tmp_path / "export.csv"), max_workers=2, show_progress_bar=True
+        )
+    assert dataset.chunk_kwargs == {"max_workers": 2}
+
+
+def test_to_parquet_can_be_read_back(tmp_path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        pytest.skip("pyarrow is not installed")
+    filename = str(tmp_path / "export.parquet")
+    StreamedDataset(5).to_parquet(filename, chunksize=2)
+
+    parquet_file = pq.ParquetFile(filename)
+    assert parquet_file.num_row_groups == 3
+    table = parquet_file.read()
+    assert table.column_names == get_export_columns(SCHEMA)
+    rows = table.to_pylist()
+    assert len(rows) == 5
+    assert rows[3] == {
+        "_id": "3",
+        "_chunk_": '[{"label":"a"}]',
+        "nested.deeper.flag": False,
+        "nested.text": "text 3",
+        "sample_vector_": pytest.approx([0.3] * 8),
+        "value": 3.0,
+    }
+
+
+def test_to_jsonl_keeps_nesting(tmp_path):
+    filename = str(tmp_path / "export.jsonl")
+    dataset = StreamedDataset(5)
+    dataset.to_jsonl(filename, chunksize=2)
+    with open(filename) as f:
+        documents = [json.loads(line) for line in f]
+    assert len(documents) == 5
+    assert documents[3]["nested"]["deeper"]["flag"] is False
+    # Every field is retrieved unless some are left out
+    assert dataset.selected_fields is None
+
+
+def test_export_memory_does_not_grow_with_the_dataset(tmp_path):
+    def peak_memory(number_of_documents, export):
+        dataset = StreamedDataset(number_of_documents)
+        tracemalloc.start()
+        try:
+            export(dataset, str(tmp_path / "export"), chunksize=500)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    for export in [Export.to_csv, Export.to_jsonl]:
+        small = peak_memory(5_000, export)
+        large = peak_memory(50_000, export)
+        assert large < small * 1.5
@@ -0,0 +1,189 @@
+"""Testing concurrent media uploads against a local storage server
+"""
+import os
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from relevanceai.constants import CONFIG
+from relevanceai.dataset.write.media import MediaManifest, MediaUploader
+from relevanceai.dataset.write.write import Write
+
+
+class StorageHandler(BaseHTTPRequestHandler):
+    uploads = {}
+    failures = {}
+    lock = threading.Lock()
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        with StorageHandler.lock:
+            if StorageHandler.failures.get(self.path, 0) > 0:
+                StorageHandler.failures[self.path] -= 1
+                status = 500
+            else:
+                StorageHandler.uploads.setdefault(self.path, []).append(body)
+                status = 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        content = self.path.encode() * 1000
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StorageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    StorageHandler.uploads = {}
+    StorageHandler.failures = {}
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def get_uploader(url, **kwargs):
+    requested = []
+
+    def get_upload_urls(files):
+        requested.extend(files)
+        return [
+            {"url": f"hosted/{file}", "upload_url": f"{url}/{os.path.basename(file)}"}
+            for file in files
+        ]
+
+    uploader = MediaUploader(
+        "dataset", get_upload_urls, seconds_between_retries=0, **kwargs
+    )
+    return uploader, requested
+
+
+def write_files(tmp_path, contents):
+    paths = []
+    for i, content in enumerate(contents):
+        path = tmp_path / f"{i}.jpg"
+        path.write_bytes(content)
+        paths.append(str(path))
+    return paths
+
+
+def test_identical_content_is_uploaded_once(url, tmp_path):
+    paths = write_files(tmp_path, [b"a" * 100, b"b" * 100, b"a" * 100])
+    uploader, requested = get_uploader(url, max_workers=4)
+    results = uploader.upload(paths)
+
+    assert requested == paths[:2]
+    assert results == [
+        (f"hosted/{paths[0]}", None),
+        (f"hosted/{paths[1]}", None),
+        (f"hosted/{paths[0]}", None),
+    ]
+    assert StorageHandler.uploads == {"/0.jpg": [b"a" * 100], "/1.jpg": [b"b" * 100]}
+    assert uploader.number_of_skipped_uploads == 1
+
+
+def test_manifest_skips_media_uploaded_by_earlier_runs(url, tmp_path):
+    paths = write_files(tmp_path, [b"a" * 100, b"b" * 100])
+    manifest_path = str(tmp_path / "manifest.jsonl")
+    uploader, _ = get_uploader(url, manifest_path=manifest_path)
+    uploader.upload(paths[:1])
+
+    uploader, requested = get_uploader(url, manifest_path=manifest_path)
+    results = uploader.upload(paths)
+    assert requested == paths[1:]
+    assert results[0] == (f"hosted/{paths[0]}", None)
+    assert len(StorageHandler.uploads["/0.jpg"]) == 1
+    assert len(MediaManifest(manifest_path)) == 2
+
+
+def test_failed_uploads_are_retried(url, tmp_path):
+    paths = write_files(tmp_path, [b"a" * 100, b"b" * 100])
+    StorageHandler.failures = {"/0.jpg": 2, "/1.jpg": 5}
+    uploader, _ = get_uploader(url, number_of_retries=3)
+    results = uploader.upload(paths)
+
+    assert results[0] == (f"hosted/{paths[0]}", None)
+    assert results[1][0] is None
+    assert results[1][1].response.status_code == 500
+    assert StorageHandler.uploads == {"/0.jpg": [b"a" * 100]}
+
+
+def test_media_urls_are_downloaded_and_missing_files_fail(url, tmp_path):
+    sources = [f"{url}/image.jpg", str(tmp_path / "missing.jpg")]
+    uploader, requested = get_uploader(url)
+    results = uploader.upload(sources)
+
+    assert requested == sources[:1]
+    assert results[0] == (f"hosted/{sources[0]}", None)
+    assert isinstance(results[1][1], FileNotFoundError)
+    assert list(StorageHandler.uploads.values()) == [[b"/image.jpg" * 1000]]
+
+
+class MockDatasets:
+    def __init__(self, url):
+        self.url = url
+
+    def get_file_upload_urls(self, dataset_id, files):
+        return {
+            "files": [
+                {
+                    "url": f"hosted/{os.path.basename(file)}",
+                    "upload_url": f"{self.url}/{os.path.basename(file)}",
+                }
+                for file in files
+            ]
+        }
+
+
+class MockWrite(Write):
+    def __init__(self, url):
+        self.dataset_id = "dataset"
+        self.config = CONFIG
+        self.upserted = []
+        self._datasets = MockDatasets(url)
+
+    @property
+    def datasets(self):
+        return self._datasets
+
+    def upsert_documents(self, documents, **kwargs):
+        self.upserted.append([d["media_url"] for d in documents])
+        return {
+            "inserted": len(documents),
+            "failed_documents": [],
+            "failed_documents_detailed": [],
+        }
+
+
+def test_upsert_media_upserts_each_batch(url, tmp_path):
+    paths = write_files(tmp_path, [b"a" * 100, b"b" * 100, b"a" * 100])
+    dataset = MockWrite(url)
+
+    results = dataset.upsert_media(paths, logging=False, batch_size=2)
+    assert results == {
+        "inserted": 3,
+        "failed_documents": [],
+        "failed_documents_detailed": [],
+        "failed_medias": [],
+    }
+    assert dataset.upserted == [["hosted/0.jpg", "hosted/1.jpg"], ["hosted/0.jpg"]]
+    assert sorted(StorageHandler.uploads) == ["/0.jpg", "/1.jpg"]
+
+
+def test_upsert_media_reports_failed_medias(url, tmp_path):
+    paths = write_files(tmp_path, [b"a" * 100]) + [str(tmp_path / "missing.jpg")]
+    dataset = MockWrite(url)
+
+    results = dataset.upsert_media(paths, logging=False)
+    assert results["inserted"] == 1
+    assert [d["media_file"] for d in results["failed_medias"]] == paths[1:]
@@ -0,0 +1,92 @@
+"""
+    Testing correlations and value counts against mocked aggregations
+"""
+import numpy as np
+
+from relevanceai.dataset.read.statistics import statistics
+from relevanceai.dataset.read.statistics.statistics import Statistics
+from relevanceai.dataset.series import Series
+
+CORRELATIONS = {
+    "cluster-0": [
+        {"brand": "nike", "correlation": {"price": {"rating": 0.5}}},
+        {"brand": "puma", "correlation": {"price": {"rating": -0.25}}},
+    ],
+    "cluster-1": [
+        {"brand": "adidas", "correlation": {"price": {"rating": 0.75}}},
+    ],
+}
+
+
+class MockClusterClient:
+    calls = 0
+
+    def __init__(self, credentials):
+        pass
+
+    def aggregate(self, **kwargs):
+        MockClusterClient.calls += 1
+        return {"results": CORRELATIONS}
+
+
+def test_corr_uses_aggregate_categories_and_caches(monkeypatch):
+    def no_scan(*args, **kwargs):
+        raise AssertionError("The groupby field should not be read in full")
+
+    monkeypatch.setattr(statistics, "ClusterClient", MockClusterClient)
+    monkeypatch.setattr(Series, "all", no_scan)
+    stats = Statistics.__new__(Statistics)
+    stats.credentials = None
+    stats.dataset_id = "sample"
+
+    kwargs = dict(
+        X="price",
+        Y="rating",
+        vector_field="text_vector_",
+        alias="kmeans-2",
+        groupby="brand",
+        show_plot=False,
+    )
+    dataframe = stats.corr(**kwargs)
+    assert list(dataframe.columns) == ["cluster-0", "cluster-1"]
+    assert list(dataframe.index) == ["adidas", "nike", "puma"]
+    assert dataframe.at["nike", "cluster-0"] == 0.5
+    assert dataframe.at["puma", "cluster-0"] == -0.25
+    assert np.isnan(dataframe.at["nike", "cluster-1"])
+
+    stats.corr(**kwargs)
+    assert MockClusterClient.calls == 1
+
+
+class MockDatasets:
+    def schema(self, dataset_id):
+        return {"price": "numeric"}
+
+    def aggregate(self, **kwargs):
+        return {
+            "results": [
+                {"price": 1.0, "frequency": 3},
+                {"price": 2.0, "frequency": 1},
+                {"price": 9.0, "frequency": 4},
+                {"price": 10.0, "frequency": 2},
+            ]
+        }
+
+
+class MockSeries(Series):
+    datasets = MockDatasets()
+
+    def get_number_of_documents(self, dataset_id, filters=None):
+        return 10
+
+
+def test_value_counts_bins_from_aggregate_frequencies():
+    series = MockSeries.__new__(MockSeries)
+    series.dataset_id = "sample"
+    series.field = "price"
+
+    counts = series.value_counts(bins=2, sort=True)
+    assert counts["Frequency"].tolist() == [4, 6]
+
+    normalized = series.value_counts(bins=2, sort=True, normalize=True)
+    assert np.allclose(normalized["Frequency"].tolist(), [0.4, 0.6])
@@ -15,3 +15,18 @@ def test_reduce_dimensions(test_dataset: Dataset):
 
     dr_vector_name = f"{alias}_vector_"
     assert dr_vector_name in test_dataset.schema
+
+
+def test_reduce_dimensions_batched(test_dataset: Dataset, tmp_path):
+    alias = "ipca"
+    test_dataset.reduce_dims(
+        model="ipca",
+        n_components=3,
+        vector_fields=["sample_1_vector_"],
+        alias=alias,
+        batched=True,
+        model_path=str(tmp_path / "ipca.joblib"),
+    )
+
+    assert f"{alias}_vector_" in test_dataset.schema
+    assert (tmp_path / "ipca.joblib").exists()
@@ -0,0 +1,153 @@
+"""
+Tests for the keyphrase counters and the single pass cluster_keyphrases.
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from relevanceai.operations.labels.counters import SpaceSavingCounter, tokenize
+from relevanceai.operations.labels.labels import LabelOps
+
+VOCABULARY = ["red", "blue", "green", "shirt", "dress", "shoe", "hat", "sock"]
+FIELD = "_cluster_.sample_vector_.kmeans"
+
+
+def make_documents(sizes, words_per_document=6, seed=0):
+    rng = random.Random(seed)
+    documents = []
+    for cluster, size in enumerate(sizes):
+        # every cluster favours a different part of the vocabulary
+        weights = [1 / (1 + (i - cluster) % len(VOCABULARY)) for i in range(8)]
+        for _ in range(size):
+            words = rng.choices(VOCABULARY, weights=weights, k=words_per_document)
+            documents.append(
+                {
+                    "_id": str(len(documents)),
+                    "text": " ".join(words),
+                    "_cluster_": {"sample_vector_": {"kmeans": f"cluster-{cluster}"}},
+                }
+            )
+    rng.shuffle(documents)
+    return documents
+
+
+class MockLabelOps(LabelOps):
+    """Serves documents from memory and scores words like RAKE does, relative
+    to the batch of text they were scored in"""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.dataset_id = "sample"
+        self._is_set_up = True
+        self.scans = 0
+
+    @property
+    def datasets(self):
+        return self
+
+    def _check_keyphrase_algorithm_requirements(self, algorithm):
+        pass
+
+    def _get_rake_keyphrases(self, string, **kw):
+        words = [word for text in string for word in text.split()]
+        return {word: count / len(string) for word, count in Counter(words).items()}
+
+    def chunk_dataset(self, select_fields=None, filters=None, chunksize=100):
+        self.scans += 1
+        for i in range(0, len(self.documents), chunksize):
+            yield self.documents[i : i + chunksize]
+
+    def facets(self, dataset_id, fields, page_size=20):
+        sizes = Counter(self.get_field(FIELD, d) for d in self.documents)
+        return {
+            "results": {
+                FIELD: [{FIELD: value, "frequency": n} for value, n in sizes.items()]
+            }
+        }
+
+    def _get_documents(self, dataset_id, filters, after_id, batch_size, **kw):
+        value = filters[0]["condition_value"]
+        documents = [d for d in self.documents if self.get_field(FIELD, d) == value]
+        start = 0 if after_id is None else after_id
+        return {
+            "documents": documents[start : start + batch_size],
+            "after_id": start + batch_size,
+        }
+
+
+def cluster_keyphrases(ops, **kwargs):
+    return ops.cluster_keyphrases(
+        text_fields=["text"],
+        vector_fields=["sample_vector_"],
+        cluster_alias="kmeans",
+        **kwargs,
+    )
+
+
+def test_tokenize():
+    assert tokenize("Don't stop, the 3 cats!") == ["Don't", "stop", "the", "3", "cats"]
+
+
+def test_space_saving_keeps_heavy_hitters():
+    items = ["a"] * 50 + ["b"] * 30 + [str(i) for i in range(200)] + ["c"] * 20
+    counter = SpaceSavingCounter(capacity=10)
+    counter.update(items)
+
+    true_counts = Counter(items)
+    assert len(counter) == 10
+    # anything more frequent than len(items) / capacity is kept
+    assert "a" in counter.counts
+    for item, count in counter.most_common():
+        assert count - counter.errors[item] <= true_counts[item] <= count
+
+
+def test_space_saving_updates_from_mapping():
+    counter = SpaceSavingCounter(capacity=5)
+    counter.update({"a": 2.5, "b": 1.0})
+    counter.update({"a": 1.0})
+    assert counter.most_common(1) == [("a", 3.5)]
+
+
+@pytest.mark.parametrize("batch_size", [2, 5, 100])
+def test_single_pass_matches_the_per_cluster_scans(batch_size):
+    ops = MockLabelOps(make_documents([9, 6, 4]))
+    single_pass = cluster_keyphrases(ops, most_common=3, batch_size=batch_size)
+    assert ops.scans == 1
+
+    per_cluster = cluster_keyphrases(
+        ops, most_common=3, batch_size=batch_size, single_pass=False
+    )
+    assert ops.scans == 1
+    assert single_pass == per_cluster
+    assert list(single_pass) == ["cluster-0", "cluster-1", "cluster-2"]
+
+
+def test_single_pass_keeps_the_largest_clusters():
+    ops = MockLabelOps(make_documents([3, 8, 5]))
+    results = cluster_keyphrases(ops, num_clusters=2, batch_size=4)
+    assert list(results) == ["cluster-1", "cluster-2"]
+
+
+def test_bounded_single_pass_stays_within_the_space_saving_error():
+    capacity = 3
+    ops = MockLabelOps(make_documents([12, 10, 7], words_per_document=8))
+    exact = cluster_keyphrases(ops, most_common=len(VOCABULARY), batch_size=3)
+    approximate = cluster_keyphrases(
+        ops, most_common=capacity, batch_size=3, max_phrases_per_cluster=capacity
+    )
+    assert ops.scans == 2
+
+    for cluster_value, top_phrases in approximate.items():
+        true_scores = dict(exact[cluster_value])
+        total = sum(true_scores.values())
+        assert len(top_phrases) == capacity
+        for phrase, score in top_phrases:
+            # Space-Saving only overestimates, by at most total / capacity
+            assert true_scores[phrase] <= score + 1e-9
+            assert score <= true_scores[phrase] + total / capacity + 1e-9
+        # anything scoring more than total / capacity is never evicted
+        kept = {phrase for phrase, _ in top_phrases}
+        for phrase, score in true_scores.items():
+            if score > total / capacity:
+                assert phrase in kept
@@ -0,0 +1,149 @@
+"""
+    Testing the local vector index against brute force search
+"""
+import numpy as np
+import pytest
+
+from relevanceai.operations.vector import LocalVectorIndex
+
+
+def get_vectors(number_of_vectors=2000, dimension=16, random_state=0):
+    rng = np.random.RandomState(random_state)
+    centers = rng.normal(size=(20, dimension))
+    labels = rng.randint(20, size=number_of_vectors)
+    vectors = centers[labels] + 0.3 * rng.normal(size=(number_of_vectors, dimension))
+    return vectors.astype(np.float32)
+
+
+def build_index(vectors, **kwargs):
+    index = LocalVectorIndex(dimension=vectors.shape[1], **kwargs)
+    index.add(
+        ids=[str(i) for i in range(len(vectors))],
+        vectors=vectors,
+        fields={"rank": list(range(len(vectors)))},
+    )
+    return index
+
+
+def brute_force(vectors, queries, k, metric):
+    if metric == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    if metric == "l2":
+        distances = ((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(-1)
+        return np.argsort(distances, axis=1)[:, :k]
+    return np.argsort(-(queries @ vectors.T), axis=1)[:, :k]
+
+
+@pytest.mark.parametrize("metric", ["cosine", "dot", "l2"])
+def test_exact_search_matches_brute_force(metric):
+    vectors = get_vectors()
+    queries = get_vectors(10, random_state=1)
+    index = build_index(vectors, metric=metric, block_size=300)
+    indices, scores = index.search_indices(queries, k=5)
+    assert (indices == brute_force(vectors, queries, 5, metric)).all()
+    if metric == "l2":
+        assert (np.diff(scores, axis=1) >= 0).all()
+    else:
+        assert (np.diff(scores, axis=1) <= 0).all()
+
+
+def test_search_returns_ids_fields_and_furthest():
+    vectors = get_vectors(500)
+    index = build_index(vectors, block_size=100)
+    results = index.search(vectors[42], k=3)
+    assert results[0]["_id"] == "42"
+    assert results[0]["rank"] == 42
+    assert np.isclose(results[0]["_search_score"], 1.0, atol=1e-5)
+
+    furthest = index.search(vectors[42], k=3, asc=True)
+    scores = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)) @ (
+        vectors[42] / np.linalg.norm(vectors[42])
+    )
+    assert furthest[0]["_id"] == str(np.argmin(scores))
+
+
+def test_filters_on_scalar_fields():
+    vectors = get_vectors(500)
+    index = build_index(vectors, block_size=128)
+    index.add(["new"], vectors[:1], fields={"brand": ["nike"]})
+    filters = [
+        {
+            "field": "rank",
+            "filter_type": "numeric",
+            "condition": ">=",
+            "condition_value": 100,
+        },
+        {
+            "field": "rank",
+            "filter_type": "numeric",
+            "condition": "<",
+            "condition_value": 103,
+        },
+    ]
+    results = index.search(vectors[0], k=10, filters=filters)
+    assert sorted(r["_id"] for r in results) == ["100", "101", "102"]
+
+    brand = [
+        {"field": "brand", "filter_type": "exact_match", "condition_value": "nike"}
+    ]
+    assert [r["_id"] for r in index.search(vectors[0], k=10, filters=brand)] == ["new"]
+
+    with pytest.raises(ValueError):
+        index.search(vectors[0], filters=[{"field": "colour", "filter_type": "exists"}])
+
+
+def test_ivf_recall_against_exact_search():
+    vectors = get_vectors(5000)
+    queries = get_vectors(50, random_state=1)
+    index = build_index(vectors)
+    exact, _ = index.search_indices(queries, k=10)
+    index.train(number_of_lists=50)
+    approximate, _ = index.search_indices(queries, k=10, number_of_probes=10)
+    recall = np.mean([len(set(a) & set(e)) / 10 for a, e in zip(approximate, exact)])
+    assert recall > 0.9
+
+    all_lists, _ = index.search_indices(queries, k=10, number_of_probes=50)
+    assert (all_lists == exact).all()
+
+
+def test_save_load_memmap_and_add(tmp_path):
+    vectors = get_vectors(1000)
+    index = build_index(vectors)
+    index.train(number_of_lists=10)
+    index.save(str(tmp_path))
+
+    loaded = LocalVectorIndex.load(str(tmp_path))
+    assert isinstance(loaded._vectors, np.memmap)
+    assert loaded.search(vectors[7], k=1)[0]["_id"] == "7"
+
+    new_vectors = get_vectors(10, random_state=2)
+    loaded.add([f"new-{i}" for i in range(10)], new_vectors)
+    assert len(loaded) == 1010
+    nearest = loaded.search(new_vectors[3], k=1, number_of_probes=10)
+    assert nearest[0]["_id"] == "new-3"
+    assert loaded.search(vectors[7], k=1)[0]["rank"] == 7
+
+
+class MockDataset:
+    def chunk_dataset(self, select_fields=None, filters=None, chunksize=100):
+        vectors = get_vectors(250)
+        documents = [
+            {"_id": str(i), "text_vector_": v.tolist(), "meta": {"rank": i}}
+            for i, v in enumerate(vectors)
+        ]
+        documents.append({"_id": "no-vector"})
+        for start in range(0, len(documents), chunksize):
+            yield documents[start : start + chunksize]
+
+
+def test_from_dataset():
+    index = LocalVectorIndex.from_dataset(
+        MockDataset(), vector_field="text_vector_", fields=["meta.rank"]
+    )
+    assert len(index) == 250
+    assert index.search(get_vectors(250)[5], k=1)[0] == {
+        "_id": "5",
+        "_search_score": pytest.approx(1.0, abs=1e-5),
+        "meta.rank": 5,
+    }
@@ -0,0 +1,93 @@
+"""
+    Testing batched sentiment analysis without downloading anything
+"""
+import urllib.request
+
+import numpy as np
+
+from relevanceai.operations.text.sentiment.sentiments import SentimentOps
+
+SCORES = {
+    "great": [0.05, 0.05, 0.9],
+    "fine": [0.2, 0.6, 0.2],
+    "awful": [0.8, 0.1, 0.1],
+    "good": [0.1, 0.2, 0.7],
+}
+
+
+class MockClassifier:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, batch_size=None, truncation=False):
+        self.calls.append(list(texts))
+        return [
+            [
+                {"label": f"LABEL_{i}", "score": score}
+                for i, score in enumerate(SCORES[text.split()[0]])
+            ]
+            for text in texts
+        ]
+
+
+class MockExplanation:
+    def __init__(self, text):
+        self.data = np.array(text.split())
+        self.values = np.array([[0.0, 0.0, 0.5]] + [[0.0, 0.0, 0.05]] * 2)[
+            : len(self.data)
+        ]
+
+
+class MockExplainer:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, max_evals=None, batch_size=None):
+        self.calls.append((list(texts), max_evals, batch_size))
+        return [MockExplanation(t) for t in texts]
+
+
+def get_sentiment_ops():
+    ops = SentimentOps(shap_max_evals=50, shap_batch_size=8)
+    ops._classifier = MockClassifier()
+    ops._explainer = MockExplainer()
+    return ops
+
+
+def test_analyze_sentiment_batch_classifies_in_one_call(monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("The label mapping should not be downloaded")
+
+    monkeypatch.setattr(urllib.request, "urlopen", no_network)
+    ops = get_sentiment_ops()
+    texts = ["great product", "fine", "awful service here", "good"]
+    results = ops.analyze_sentiment_batch(texts)
+
+    assert len(ops._classifier.calls) == 1
+    assert [r["sentiment"] for r in results] == [
+        "positive",
+        "neutral",
+        "negative",
+        "positive",
+    ]
+    assert np.allclose([r["overall_sentiment"] for r in results], [0.9, 0.0, -0.8, 0.7])
+    assert results == [ops.analyze_sentiment(t) for t in texts]
+    assert ops._get_label_mapping("sentiment") == ["negative", "neutral", "positive"]
+
+
+def test_only_the_most_extreme_texts_are_highlighted():
+    ops = get_sentiment_ops()
+    texts = ["great product", "fine", "awful service here", "good"]
+    results = ops.analyze_sentiment_batch(
+        texts, highlight=True, max_number_of_highlighted_texts=2
+    )
+
+    assert ops._explainer.calls == [(["great product", "awful service here"], 50, 8)]
+    assert results[0]["highlight_chunk_"] == [{"text": "great", "score": 0.5}]
+    assert "highlight_chunk_" in results[2]
+    assert "highlight_chunk_" not in results[1]
+    assert "highlight_chunk_" not in results[3]
+
+    ops._explainer.calls = []
+    ops.analyze_sentiment_batch(texts * 10, highlight=True)
+    assert len(ops._explainer.calls[0][0]) == 32
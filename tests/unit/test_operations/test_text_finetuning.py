@@ -0,0 +1,105 @@
+"""
+    Testing that fine-tuning data is prepared without holding the dataset in memory
+"""
+import json
+import tracemalloc
+
+from itertools import tee
+
+import pytest
+
+from relevanceai.operations.text_finetuning.supervised_finetuning_ops import (
+    SupervisedTripleLossFinetuneOps,
+)
+from relevanceai.operations.text_finetuning.unsupervised_finetuning_ops import GPLOps
+
+NUMBER_OF_DOCUMENTS = 1_000_000
+NUMBER_OF_LABELS = 10
+
+
+class SyntheticDataset:
+    """Serves synthetic documents chunk by chunk like Dataset.chunk_dataset"""
+
+    def __init__(self, number_of_documents: int):
+        self.number_of_documents = number_of_documents
+
+    def chunk_dataset(self, select_fields=None, chunksize=1000, **kwargs):
+        for start in range(0, self.number_of_documents, chunksize):
+            yield [
+                {
+                    "_id": str(i),
+                    "text": f"document number {i}",
+                    "label": f"label-{i % NUMBER_OF_LABELS}",
+                }
+                for i in range(start, min(start + chunksize, self.number_of_documents))
+            ]
+
+
+def iterate_documents(dataset):
+    for chunk in dataset.chunk_dataset(select_fields=["text"], chunksize=1000):
+        yield from chunk
+
+
+@pytest.mark.slow
+def test_gpl_corpus_is_written_in_bounded_memory(tmp_path):
+    tracemalloc.start()
+    number_of_lines = GPLOps().prepare_data_for_finetuning(
+        documents=iterate_documents(SyntheticDataset(NUMBER_OF_DOCUMENTS)),
+        text_field="text",
+        dir_to_save_corpus=str(tmp_path),
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert number_of_lines == NUMBER_OF_DOCUMENTS
+    # A list of every corpus line alone would take hundreds of MB
+    assert peak < 10 * 1024**2
+    with open(tmp_path / "corpus.jsonl") as f:
+        first = json.loads(f.readline())
+    assert first["_id"] == "0"
+    assert first["text"] == "document number 0"
+    assert first["metadata"] == {"_id": "0", "label": "label-0"}
+
+
+@pytest.mark.slow
+def test_triple_data_is_sampled_in_bounded_memory():
+    documents = iterate_documents(SyntheticDataset(NUMBER_OF_DOCUMENTS))
+    text_documents, label_documents = tee(documents)
+
+    tracemalloc.start()
+    anchors, positives, negatives = SupervisedTripleLossFinetuneOps.build_triple_data(
+        (d["text"] for d in text_documents),
+        (d["label"] for d in label_documents),
+        sample_size_per_label=50,
+        random_state=0,
+    )
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert peak < 10 * 1024**2
+    assert len(anchors) == len(positives) == len(negatives) == 2 * NUMBER_OF_LABELS
+    for i in range(0, len(anchors), 2):
+        label = int(anchors[i].split()[-1]) % NUMBER_OF_LABELS
+        assert int(positives[i].split()[-1]) % NUMBER_OF_LABELS == label
+        assert int(negatives[i].split()[-1]) % NUMBER_OF_LABELS != label
+
+
+def test_labels_with_too_few_texts_are_dropped():
+    texts = ["a", "b", "c", "d", "e", "x", "x", "x", "x", "x", "f", "g", "h", "i", "j"]
+    labels = [0] * 5 + [1] * 5 + [2] * 5
+    anchors, positives, negatives = SupervisedTripleLossFinetuneOps.build_triple_data(
+        texts, labels, random_state=0
+    )
+    assert anchors == ["a", "b", "f", "g"]
+    assert set(positives[:2]) <= {"c", "d", "e"}
+    assert set(negatives[:2]) <= {"h", "i", "j"}
+
+
+def test_texts_and_labels_are_fetched_chunk_by_chunk():
+    ops = SupervisedTripleLossFinetuneOps.__new__(SupervisedTripleLossFinetuneOps)
+    ops.dataset = SyntheticDataset(25)
+    text_data, labels = ops.fetch_text_and_labels_from_dataset(
+        "text", "label", chunksize=10
+    )
+    assert text_data[12] == "document number 12"
+    assert labels[:12] == list(range(10)) + [0, 1]
@@ -0,0 +1,128 @@
+"""
+    Testing CLIP image and video preprocessing with local fixtures and a
+    model that encodes an image as its mean colour
+"""
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+cv2 = pytest.importorskip("cv2")
+clip = pytest.importorskip("clip")
+Image = pytest.importorskip("PIL.Image")
+
+from relevanceai.operations_new.vectorize.models.image.clip.model import (
+    ClipImage2Vec,
+    sample_frames,
+    uniform_frame_indices,
+)
+
+RESOLUTION = 8
+
+
+def preprocess(image):
+    image = image.convert("RGB").resize((RESOLUTION, RESOLUTION))
+    array = np.asarray(image, dtype=np.float32) / 255
+    return torch.from_numpy(array).permute(2, 0, 1)
+
+
+class MockVisual:
+    input_resolution = RESOLUTION
+
+
+class MockModel:
+    visual = MockVisual()
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def encode_image(self, images):
+        self.batch_sizes.append(len(images))
+        return images.mean(dim=(2, 3))
+
+
+@pytest.fixture
+def get_model(monkeypatch):
+    monkeypatch.setattr(clip, "load", lambda url, device: (MockModel(), preprocess))
+    models = []
+
+    def get_model(**kwargs):
+        model = ClipImage2Vec(url="mock", vector_length=3, **kwargs)
+        models.append(model)
+        return model
+
+    yield get_model
+    for model in models:
+        model.close()
+
+
+@pytest.fixture
+def images(tmp_path):
+    colours = [(255, 0, 0), (0, 255, 0), (0, 0, 255)]
+    paths = []
+    for i, colour in enumerate(colours):
+        path = str(tmp_path / f"{i}.png")
+        Image.new("RGB", (32, 24), colour).save(path)
+        paths.append(path)
+    path = str(tmp_path / "grey.png")
+    Image.new("L", (16, 16), 255).save(path)
+    return paths + [path]
+
+
+@pytest.fixture
+def video(tmp_path):
+    """20 frames, black for the first 10 and white for the last 10"""
+    path = str(tmp_path / "video.avi")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (32, 32))
+    for i in range(20):
+        writer.write(np.full((32, 32, 3), 0 if i < 10 else 255, dtype=np.uint8))
+    writer.release()
+    return path
+
+
+@pytest.mark.parametrize("decode_pool", ["thread", "process"])
+def test_bulk_encode_image_in_batches(get_model, images, decode_pool):
+    model = get_model(decode_pool=decode_pool, batch_size=3, prefetch=1)
+    vectors = model.bulk_encode_image(images + [images[0] + ".missing"])
+
+    assert model.model.batch_sizes == [3, 2]
+    assert np.allclose(
+        vectors,
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1], [0, 0, 0]],
+    )
+    assert np.allclose(model.encode_image(images[1]), [0, 1, 0])
+
+
+def test_uniform_frame_indices():
+    assert uniform_frame_indices(20, 3) == [0, 10, 19]
+    assert uniform_frame_indices(2, 3) == [0, 1]
+
+
+def test_sample_frames(video):
+    frames = sample_frames(video, number_of_frames=3)
+    assert [round(frame.mean() / 255) for frame in frames] == [0, 1, 1]
+    keyframes = sample_frames(video, number_of_frames=2, sampling="keyframe")
+    assert [round(frame.mean() / 255) for frame in keyframes] == [0, 1]
+
+
+def test_encode_video_pools_frames(get_model, video):
+    model = get_model(decode_pool="thread", batch_size=4)
+    vector = model.encode_video(video, number_of_frames=10)
+    assert model.model.batch_sizes == [4, 4, 2]
+    assert np.allclose(vector, [0.5] * 3, atol=0.05)
+
+    vector = model.encode_video(
+        video, number_of_frames=2, sampling="keyframe", pooling="max"
+    )
+    assert np.allclose(vector, [1] * 3, atol=0.05)
+    with pytest.raises(ValueError):
+        model.encode_video(video, pooling="median")
+
+
+def test_decode_pool_is_shut_down(monkeypatch, images):
+    monkeypatch.setattr(clip, "load", lambda url, device: (MockModel(), preprocess))
+    with ClipImage2Vec(url="mock", vector_length=3, decode_pool="thread") as model:
+        model.bulk_encode_image(images)
+        executor = model._decode_executor
+    assert model._decode_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(len, [])
@@ -0,0 +1,60 @@
+"""Test that the explainer encodes word combinations in batches
+"""
+import numpy as np
+
+from relevanceai.operations_new.cluster.text.explainer.base import BaseExplainer
+
+
+class CountingEncoder:
+    def __init__(self):
+        self.calls = 0
+        self.texts = []
+
+    def encode(self, text):
+        return self.bulk_encode([text])[0]
+
+    def bulk_encode(self, texts):
+        self.calls += 1
+        self.texts += texts
+        return [[len(t) + 1.0, t.count("a") + 1.0, t.count(" ") + 1.0] for t in texts]
+
+
+def test_explain_many_from_vector_batches_and_caches():
+    encoder = CountingEncoder()
+    explainer = BaseExplainer()
+    explainer.encode_batch_size = 50
+    texts = ["a cat sat on a mat", "a dog ran", "a cat sat on a mat"]
+
+    batched = explainer.explain_many_from_vector(
+        encoder.encode, [3.0, 2.0, 1.0], texts, bulk_encode_fn=encoder.bulk_encode
+    )
+    unique_texts = set(encoder.texts)
+    assert len(encoder.texts) == len(unique_texts)
+    assert encoder.calls == int(np.ceil(len(unique_texts) / 50))
+
+    # Explaining them again only reads from the cache
+    calls = encoder.calls
+    explainer.explain_many_from_vector(
+        encoder.encode, [3.0, 2.0, 1.0], texts, bulk_encode_fn=encoder.bulk_encode
+    )
+    assert encoder.calls == calls
+
+    one_at_a_time = [
+        BaseExplainer().explain_from_vector(encoder.encode, [3.0, 2.0, 1.0], text)
+        for text in texts
+    ]
+    assert batched == one_at_a_time
+
+
+def test_explain_chunk_scores_match_cosine_similarity():
+    encoder = CountingEncoder()
+    explainer = BaseExplainer()
+    results = explainer.explain_chunk(encoder.encode, "a cat", ["a dog ran far"])
+    query_vector = encoder.encode("a cat")
+    for d in results[0]["explain_chunk"]:
+        assert np.isclose(
+            d["_search_score"],
+            explainer.get_cosine_similarity(encoder.encode(d["text"]), query_vector),
+        )
+    scores = [d["_search_score"] for d in results[0]["explain_chunk"]]
+    assert scores == sorted(scores, reverse=True)
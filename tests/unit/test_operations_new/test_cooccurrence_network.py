@@ -0,0 +1,110 @@
+"""
+    Testing that the sparse co-occurrence network matches the previous dense
+    implementation
+"""
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("sklearn")
+
+from sklearn.cluster import AgglomerativeClustering
+
+from relevanceai.operations_new.cooccurrence_network.transform import (
+    CoOccurNetTransform,
+    WordDictionary,
+)
+
+
+def dense_concurrence_matrix(top_ids, texts, word_dict):
+    word_count_mat = []
+    for text in texts:
+        row = [0] * len(top_ids)
+        for word in text:
+            id = word_dict.word2id[word]
+            if id in top_ids:
+                row[top_ids.index(id)] = 1
+        word_count_mat.append(row)
+    word_count_mat = np.array(word_count_mat)
+    return np.dot(word_count_mat.transpose(), word_count_mat)
+
+
+def dense_maximum_spanning_tree(graph):
+    number_of_vertices = len(graph)
+    visited = [False] * number_of_vertices
+    weights = [-sys.maxsize] * number_of_vertices
+    parent = [0] * number_of_vertices
+    weights[0] = sys.maxsize
+    parent[0] = -1
+    for _ in range(number_of_vertices - 1):
+        index, max_weight = -1, -sys.maxsize
+        for i in range(number_of_vertices):
+            if not visited[i] and weights[i] > max_weight:
+                index, max_weight = i, weights[i]
+        visited[index] = True
+        for j in range(number_of_vertices):
+            if graph[j][index] != 0 and not visited[j] and graph[j][index] > weights[j]:
+                weights[j] = graph[j][index]
+                parent[j] = index
+    return parent
+
+
+def dense_clusters_labels(mat):
+    number_of_vertices = len(mat)
+    labels = np.zeros((number_of_vertices, number_of_vertices), dtype=int)
+    labels[:, 0] = np.arange(number_of_vertices)
+    params = dict(linkage="complete")
+    if "metric" in AgglomerativeClustering().get_params():
+        params["metric"] = "precomputed"
+    else:
+        params["affinity"] = "precomputed"
+    children = AgglomerativeClustering(**params).fit(mat).children_
+    for i, merged in enumerate(children):
+        for j in range(number_of_vertices):
+            if labels[j, i] in merged:
+                labels[j, i + 1] = i + number_of_vertices
+            else:
+                labels[j, i + 1] = labels[j, i]
+    for i in range(number_of_vertices):
+        labels[:, i] = np.unique(labels[:, i], return_inverse=True)[1]
+    return labels
+
+
+def get_network_inputs(number_of_concepts, seed):
+    rng = np.random.RandomState(seed)
+    # Integer counts can tie, and tied spanning trees may legitimately differ,
+    # so the seeds are fixed
+    texts = [
+        [f"w{rank}" for rank in np.minimum(rng.zipf(1.3, size=20), 200)]
+        for _ in range(300)
+    ]
+    word_dict = WordDictionary(texts)
+    df_table = word_dict.get_df_table()
+    top_ids = sorted(df_table, key=df_table.get, reverse=True)[:number_of_concepts]
+    return top_ids, texts, word_dict
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_network_matches_dense(seed):
+    transform = CoOccurNetTransform(number_of_concepts=30)
+    top_ids, texts, word_dict = get_network_inputs(30, seed)
+
+    sparse = transform.concurrence_matrix(top_ids, texts, word_dict)
+    dense = dense_concurrence_matrix(top_ids, texts, word_dict)
+    assert np.array_equal(sparse.toarray(), dense)
+
+    # Both trees are rooted at vertex 0, so the parents give the same edges
+    assert transform.maximum_spanning_tree(sparse) == dense_maximum_spanning_tree(
+        dense.tolist()
+    )
+
+    cluster_numbers = range(3, 16)
+    labels = transform.get_clusters_labels(sparse, cluster_numbers)
+    dense_labels = dense_clusters_labels(dense[0][0] - dense)
+    for number_of_clusters in cluster_numbers:
+        assert np.array_equal(
+            labels[number_of_clusters],
+            dense_labels[:, len(top_ids) - number_of_clusters],
+        )
@@ -0,0 +1,112 @@
+"""
+    Testing that batched dimensionality reduction fits once and projects
+    every chunk into the same space
+"""
+import threading
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sklearn")
+pytest.importorskip("joblib")
+
+from relevanceai.operations_new.dr.models.pca import IncrementalPCAModel
+from relevanceai.operations_new.dr.ops import DimReductionOps
+
+
+class MockDataset:
+    def __init__(self, documents):
+        self.documents = documents
+        self.upserted = []
+        self.lock = threading.Lock()
+
+    def chunk_dataset(self, select_fields=None, filters=None, chunksize=None):
+        for i in range(0, len(self.documents), chunksize):
+            yield [dict(d) for d in self.documents[i : i + chunksize]]
+
+    def upsert_documents(self, documents):
+        with self.lock:
+            self.upserted.extend(documents)
+
+
+def get_documents(number_of_documents=60):
+    rng = np.random.RandomState(0)
+    vectors = rng.normal(size=(number_of_documents, 6))
+    return [
+        {"_id": str(i), "sample_vector_": vector.tolist()}
+        for i, vector in enumerate(vectors)
+    ]
+
+
+def reduce_dims(dataset, model_path, **kwargs):
+    ops = DimReductionOps(
+        vector_fields=["sample_vector_"],
+        n_components=2,
+        alias="dr",
+        model_path=model_path,
+        **kwargs,
+    )
+    ops.batch_transform_upsert(dataset, chunksize=7, timeout=0)
+    for thread in threading.enumerate():
+        if thread is not threading.current_thread() and not thread.daemon:
+            thread.join()
+    return ops
+
+
+@pytest.mark.parametrize("model", ["pca", "ipca"])
+def test_batched_chunks_share_one_projection(tmp_path, model):
+    documents = get_documents()
+    dataset = MockDataset(documents)
+    ops = reduce_dims(dataset, str(tmp_path / "model.joblib"), model=model)
+
+    reduced = {d["_id"]: d["dr_vector_"] for d in dataset.upserted}
+    assert len(reduced) == len(documents)
+    expected = ops.model.transform([d["sample_vector_"] for d in documents])
+    assert np.allclose([reduced[d["_id"]] for d in documents], expected)
+
+
+def test_saved_model_is_only_reused_with_the_same_config(tmp_path):
+    model_path = str(tmp_path / "model.joblib")
+    dataset = MockDataset(get_documents())
+    first = reduce_dims(dataset, model_path, model="ipca")
+
+    second = DimReductionOps(
+        vector_fields=["sample_vector_"],
+        n_components=2,
+        alias="dr",
+        model="ipca",
+        model_path=model_path,
+    )
+    assert second.load_model()
+    assert np.allclose(second.model.model.components_, first.model.model.components_)
+
+    different = DimReductionOps(
+        vector_fields=["sample_vector_"],
+        n_components=3,
+        alias="dr",
+        model="ipca",
+        model_path=model_path,
+    )
+    assert not different.load_model()
+
+
+def test_incremental_pca_flush():
+    vectors = get_documents(7)
+    model = IncrementalPCAModel(n_components=5, alias=None)
+    model.partial_fit([d["sample_vector_"] for d in vectors[:3]])
+    # Three rows are fewer than n_components so nothing has been fitted yet
+    assert not hasattr(model.model, "components_")
+    model.partial_fit([d["sample_vector_"] for d in vectors[3:]])
+    model.flush()
+    assert model.model.components_.shape == (5, 6)
+
+    model = IncrementalPCAModel(n_components=2, alias=None)
+    model.partial_fit([d["sample_vector_"] for d in vectors[:3]])
+    model.partial_fit([d["sample_vector_"] for d in vectors[3:4]])
+    # The leftover row is dropped rather than fitted on its own
+    model.flush()
+    assert model.model.n_samples_seen_ == 3
+    assert model._buffer == []
+
+    with pytest.raises(ValueError):
+        IncrementalPCAModel(n_components=2, alias=None).flush()
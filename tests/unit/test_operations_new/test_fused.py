@@ -0,0 +1,57 @@
+"""
+Test that fused operations give the same updates as running them one at a time
+"""
+from relevanceai.operations_new.fused import FusedOperation, FusedStage
+
+
+class Upper:
+    name = "upper"
+
+    def transform(self, documents):
+        return [{"_id": d["_id"], "upper": d["text"].upper()} for d in documents]
+
+
+class Count:
+    name = "count"
+
+    def transform(self, documents):
+        return [
+            {"_id": d["_id"], "_count_": {"upper": len(d["upper"])}} for d in documents
+        ]
+
+
+class Broken:
+    name = "broken"
+
+    def transform(self, documents):
+        raise ValueError
+
+
+def test_stages_run_in_dependency_order():
+    upper = FusedStage(Upper(), input_fields=["text"], output_fields=["upper"])
+    count = FusedStage(Count(), input_fields=["upper"])
+    fused = FusedOperation([count, upper])
+    assert [s.name for s in fused.stages] == ["upper", "count"]
+    assert fused.select_fields == ["text", "upper"]
+
+
+def test_one_merged_update_per_document():
+    upper = FusedStage(
+        Upper(),
+        input_fields=["text"],
+        output_fields=["upper"],
+        skip_existing_outputs=True,
+    )
+    count = FusedStage(Count(), input_fields=["upper"])
+    fused = FusedOperation([upper, count, FusedStage(Broken(), input_fields=[])])
+    documents = [
+        {"_id": "1", "text": "abc"},
+        {"_id": "2", "text": "de", "upper": "DE"},
+    ]
+    timings = {}
+    assert fused.transform(documents, timings=timings) == [
+        {"_id": "1", "upper": "ABC", "_count_.upper": 3},
+        {"_id": "2", "_count_.upper": 2},
+    ]
+    assert set(timings) == {"upper", "count"}
+    assert [s.name for s in fused.stages] == ["upper", "count"]
@@ -0,0 +1,79 @@
+"""Testing batched span decoding and the question answer transform
+"""
+import numpy as np
+
+from relevanceai.operations.text.qa.decode import decode_spans
+from relevanceai.operations_new.question_answer.transform import (
+    QuestionAnswerTransform,
+)
+
+
+def brute_force_span(start_logits, end_logits, context_mask, max_answer_length):
+    def softmax(logits, mask):
+        logits = np.where(mask, logits, -np.inf)
+        exp = np.exp(logits - logits.max())
+        return exp / exp.sum()
+
+    softmax_mask = context_mask.copy()
+    softmax_mask[0] = True
+    start_probs = softmax(start_logits, softmax_mask)
+    end_probs = softmax(end_logits, softmax_mask)
+    best = (-1.0, 0, 0)
+    for i in np.where(context_mask)[0]:
+        for j in np.where(context_mask)[0]:
+            if i <= j < i + max_answer_length:
+                score = start_probs[i] * end_probs[j]
+                if score > best[0]:
+                    best = (score, i, j)
+    return best
+
+
+def test_decode_spans_matches_brute_force():
+    random_state = np.random.RandomState(0)
+    start_logits = random_state.normal(size=(8, 40))
+    end_logits = random_state.normal(size=(8, 40))
+    context_mask = np.zeros((8, 40), dtype=bool)
+    for row, length in enumerate(random_state.randint(5, 30, size=8)):
+        context_mask[row, 10 : 10 + length] = True
+
+    starts, ends, scores = decode_spans(
+        start_logits, end_logits, context_mask, max_answer_length=5
+    )
+    for row in range(8):
+        score, start, end = brute_force_span(
+            start_logits[row], end_logits[row], context_mask[row], 5
+        )
+        assert (starts[row], ends[row]) == (start, end)
+        assert np.isclose(scores[row], score, rtol=1e-5)
+
+
+class MockQAModel:
+    def bulk_question_answer(self, question, contexts):
+        return [
+            {"answer": (c or "")[:3], "score": 0.5, "start": 0, "end": 3}
+            for c in contexts
+        ]
+
+
+def test_question_answer_transform():
+    transform = QuestionAnswerTransform(
+        text_field="text", questions=["What brand", "What colour"]
+    )
+    transform._model = MockQAModel()
+    documents = transform.transform([{"_id": "1", "text": "Nike shoes"}, {"_id": "2"}])
+    assert documents == [
+        {
+            "_id": "1",
+            "_question_": {
+                "what-brand": {"answer": "Nik", "score": 0.5},
+                "what-colour": {"answer": "Nik", "score": 0.5},
+            },
+        },
+        {
+            "_id": "2",
+            "_question_": {
+                "what-brand": {"answer": "", "score": 0.5},
+                "what-colour": {"answer": "", "score": 0.5},
+            },
+        },
+    ]
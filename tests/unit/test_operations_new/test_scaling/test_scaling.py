@@ -0,0 +1,63 @@
+from relevanceai.dataset import Dataset
+
+
+def test_batched_scale_stores_stats(test_dataset: Dataset):
+    test_dataset.scale(
+        vector_fields=["sample_1_vector_"],
+        model="standard",
+        batched=True,
+        chunksize=5,
+    )
+    scaled_field = "sample_1_standardscaler_vector_"
+    assert scaled_field in test_dataset.schema
+    assert scaled_field in test_dataset.metadata["_scaler_"]
+
+
+class MockMetadata:
+    def __init__(self, metadata):
+        self.metadata = metadata
+
+    def to_dict(self):
+        return self.metadata
+
+
+class MockDataset:
+    def __init__(self, documents):
+        self.documents = documents
+        self.metadata = MockMetadata({})
+
+    def chunk_dataset(self, select_fields=None, filters=None, chunksize=None):
+        for i in range(0, len(self.documents), chunksize):
+            yield self.documents[i : i + chunksize]
+
+    def upsert_metadata(self, metadata):
+        self.metadata = MockMetadata(metadata)
+
+
+def test_streamed_statistics_match_a_full_fit():
+    import numpy as np
+    from sklearn.preprocessing import StandardScaler
+
+    from relevanceai.operations_new.scaling.ops import ScaleOps
+
+    vectors = np.random.RandomState(0).normal(3, 2, size=(103, 4))
+    dataset = MockDataset(
+        [{"_id": str(i), "sample_vector_": v.tolist()} for i, v in enumerate(vectors)]
+    )
+    ops = ScaleOps(vector_fields=["sample_vector_"], model="standard", alias=None)
+    ops.fit_dataset(dataset, chunksize=10)
+
+    expected = StandardScaler().fit(vectors)
+    (output_field,) = ops.output_fields
+    stats = dataset.metadata.to_dict()["_scaler_"][output_field]
+    assert stats["stats"]["n_samples_seen_"] == 103
+    assert np.allclose(stats["stats"]["mean_"], expected.mean_)
+    assert np.allclose(stats["stats"]["var_"], expected.var_)
+
+    reloaded = ScaleOps(vector_fields=["sample_vector_"], model="standard", alias=None)
+    assert reloaded.load_stats(dataset)
+    scaled = reloaded.transform(dataset.documents[:5])
+    assert np.allclose(
+        [d[output_field] for d in scaled],
+        expected.transform(vectors[:5]),
+    )
@@ -0,0 +1,155 @@
+"""Test that tracking is batched in the background, can be turned off and
+is free when disabled
+"""
+import importlib
+import threading
+import time
+
+from relevanceai.constants import CONFIG, CONFIG_PATH, Config
+from relevanceai.utils.decorators.analytics import (
+    EventQueue,
+    describe_value,
+    is_tracking_enabled,
+    set_tracking_enabled,
+    track,
+)
+
+# The package re-exports the analytics library under the same name
+analytics_decorators = importlib.import_module("relevanceai.utils.decorators.analytics")
+
+
+class Tracked:
+    dataset_id = "sample_dataset_id"
+
+    @track
+    def method(self, documents, refresh=False):
+        return len(documents)
+
+    def untracked_method(self, documents, refresh=False):
+        return len(documents)
+
+
+def test_disabled_tracking_overhead_is_under_a_microsecond():
+    set_tracking_enabled(False)
+    tracked = Tracked()
+    documents = [{"_id": str(i)} for i in range(1000)]
+    number_of_calls = 100_000
+
+    def time_calls(method):
+        # Take the fastest of a few runs to ignore noise from the machine
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(number_of_calls):
+                method(documents, refresh=True)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    overhead = (
+        time_calls(tracked.method) - time_calls(tracked.untracked_method)
+    ) / number_of_calls
+    assert overhead < 1e-6
+
+
+def test_any_config_can_turn_tracking_off():
+    # Every client has its own config
+    client_config = Config(CONFIG_PATH)
+    set_tracking_enabled(True)
+    try:
+        assert is_tracking_enabled()
+        client_config["mixpanel.is_tracking_enabled"] = False
+        assert not is_tracking_enabled()
+        client_config.reset_to_default()
+        assert is_tracking_enabled() == (
+            str(client_config["mixpanel.is_tracking_enabled"]).lower() == "true"
+        )
+    finally:
+        set_tracking_enabled(False)
+
+
+def test_events_are_not_sent_on_the_callers_thread(monkeypatch):
+    sent = threading.Event()
+    sending_threads = []
+
+    def send(**event):
+        sending_threads.append(threading.current_thread())
+        sent.set()
+
+    monkeypatch.setattr(analytics_decorators.analytics, "track", send)
+    monkeypatch.setattr(analytics_decorators.analytics, "flush", lambda: None)
+    event_queue = EventQueue(batch_size=1, flush_interval=0.01)
+    monkeypatch.setattr(analytics_decorators, "EVENT_QUEUE", event_queue)
+
+    set_tracking_enabled(True)
+    try:
+        assert Tracked().method([{"_id": "1"}]) == 1
+        assert sent.wait(timeout=10)
+    finally:
+        set_tracking_enabled(False)
+
+    assert sending_threads[0] is not threading.current_thread()
+
+
+def test_tracking_can_be_turned_off_in_the_config(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        analytics_decorators.analytics, "track", lambda **event: sent.append(event)
+    )
+    monkeypatch.setattr(analytics_decorators.analytics, "flush", lambda: None)
+    event_queue = EventQueue(flush_interval=60)
+    monkeypatch.setattr(analytics_decorators, "EVENT_QUEUE", event_queue)
+    monkeypatch.setattr(event_queue, "_start", lambda: None)
+    event_queue._thread = object()
+
+    set_tracking_enabled(True)
+    try:
+        Tracked().method([{"_id": "1"}])
+        # Events already queued are dropped once tracking is turned off
+        CONFIG["mixpanel.is_tracking_enabled"] = False
+        Tracked().method([{"_id": "1"}])
+        event_queue.flush()
+    finally:
+        set_tracking_enabled(False)
+
+    assert sent == []
+    assert event_queue._queue.qsize() == 0
+
+
+def test_events_are_batched_and_describe_arguments(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        analytics_decorators.analytics, "track", lambda **event: sent.append(event)
+    )
+    monkeypatch.setattr(analytics_decorators.analytics, "flush", lambda: None)
+    event_queue = EventQueue(maxsize=10, batch_size=4, flush_interval=60)
+    monkeypatch.setattr(analytics_decorators, "EVENT_QUEUE", event_queue)
+    # Keep the background thread from taking events so that the queue fills up
+    monkeypatch.setattr(event_queue, "_start", lambda: None)
+    event_queue._thread = object()
+
+    set_tracking_enabled(True)
+    try:
+        tracked = Tracked()
+        for _ in range(15):
+            tracked.method([{"_id": "1"}, {"_id": "2"}], refresh=True)
+        assert len(sent) == 0
+        assert event_queue.dropped == 5
+        event_queue.flush()
+    finally:
+        set_tracking_enabled(False)
+
+    assert len(sent) == 10
+    assert sent[0]["event"] == "pysdk-method"
+    assert sent[0]["properties"] == {
+        "args": {
+            "documents": {"type": "list", "size": 2},
+            "refresh": {"type": "bool", "value": True},
+        },
+        "dataset_id": "sample_dataset_id",
+    }
+
+
+def test_describe_value_does_not_include_contents():
+    assert describe_value("a secret") == {"type": "str", "size": 8}
+    assert describe_value({"a": 1}) == {"type": "dict", "size": 1}
+    assert describe_value(object()) == {"type": "object"}
@@ -0,0 +1,69 @@
+"""Test running batch functions across chunks of many documents
+"""
+from relevanceai.utils.doc_utils import DocUtils
+from relevanceai.operations.vector.base import Base2Vec
+
+
+def get_documents():
+    return [
+        {"_id": "1", "_chunk_": [{"text": "a"}, {"text": "bb"}]},
+        {"_id": "2"},
+        {"_id": "3", "_chunk_": [{"label": "no text"}, {"text": "ccc"}]},
+    ]
+
+
+def test_run_function_across_chunks_batched():
+    calls = []
+
+    def lengths(values):
+        calls.append(list(values))
+        return [len(v) for v in values]
+
+    documents = DocUtils().run_function_across_chunks_batched(
+        lengths,
+        chunk_field="_chunk_",
+        field="text",
+        output_field="length",
+        docs=get_documents(),
+        batch_size=2,
+    )
+    assert calls == [["a", "bb"], ["ccc"]]
+    assert documents[0]["_chunk_"] == [
+        {"text": "a", "length": 1},
+        {"text": "bb", "length": 2},
+    ]
+    assert documents[2]["_chunk_"] == [
+        {"label": "no text"},
+        {"text": "ccc", "length": 3},
+    ]
+
+
+def test_run_function_across_chunks_batched_returns_results_per_document():
+    results = DocUtils().run_function_across_chunks_batched(
+        lambda values: [v.upper() for v in values],
+        chunk_field="_chunk_",
+        field="text",
+        docs=get_documents(),
+        batch_size=None,
+    )
+    assert results == [["A", "BB"], [], ["CCC"]]
+
+
+class MockEncoder(Base2Vec):
+    def __init__(self):
+        self.__name__ = "mock"
+        self.calls = 0
+
+    def bulk_encode(self, texts):
+        self.calls += 1
+        return [[float(len(t))] for t in texts]
+
+
+def test_encode_chunk_documents_encodes_all_chunks_at_once():
+    encoder = MockEncoder()
+    documents = encoder.encode_chunk_documents(
+        chunk_field="_chunk_", fields=["text"], documents=get_documents()
+    )
+    assert encoder.calls == 1
+    assert documents[0]["_chunk_"][1]["text_mock_chunkvector_"] == [2.0]
+    assert documents[2]["_chunk_"][1]["text_mock_chunkvector_"] == [3.0]
@@ -0,0 +1,57 @@
+"""Testing code for the fetch/process/push pipeline
+"""
+import pytest
+
+from relevanceai.utils.concurrency import pipeline_chunks, prefetch
+
+
+def double_values(documents, factor=2):
+    for d in documents:
+        d["value"] *= factor
+    return documents
+
+
+def make_chunks(n_chunks=10, chunksize=5):
+    for i in range(n_chunks):
+        yield [
+            {"_id": str(j), "value": j}
+            for j in range(i * chunksize, (i + 1) * chunksize)
+        ]
+
+
+def test_pipeline_chunks_processes():
+    pushed = []
+    results, timings = pipeline_chunks(
+        double_values, make_chunks(), pushed.extend, func_args=(3,), max_workers=2
+    )
+    assert sorted(d["value"] for d in pushed) == [i * 3 for i in range(50)]
+    assert timings["chunks"] == 10
+    assert timings["documents"] == 50
+
+
+def test_pipeline_chunks_unpicklable_function_uses_threads():
+    pushed = []
+    with pytest.warns(UserWarning):
+        pipeline_chunks(lambda docs: docs, make_chunks(), pushed.extend)
+    assert len(pushed) == 50
+
+
+def test_pipeline_chunks_raises_worker_errors():
+    def fail(documents):
+        raise ZeroDivisionError
+
+    with pytest.raises(ZeroDivisionError), pytest.warns(UserWarning):
+        pipeline_chunks(fail, make_chunks(), lambda docs: None)
+
+
+def test_prefetch_keeps_order_and_raises_errors():
+    assert list(prefetch(make_chunks(4, 2), size=2)) == list(make_chunks(4, 2))
+
+    def failing():
+        yield 1
+        raise ValueError("Fetch failed")
+
+    iterator = prefetch(failing())
+    assert next(iterator) == 1
+    with pytest.raises(ValueError):
+        next(iterator)
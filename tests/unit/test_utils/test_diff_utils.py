@@ -0,0 +1,29 @@
+"""Testing code for change tracking
+"""
+from relevanceai.utils.doc_utils.diff_utils import DocDiffUtils
+
+
+def test_unchanged_documents_are_skipped():
+    docs = [{"_id": "1", "value": 1, "vector_": [0.1, 0.2]}]
+    snapshots = DocDiffUtils().snapshot_documents(docs)
+    assert DocDiffUtils().diff_documents(snapshots, docs) == []
+
+
+def test_only_changed_fields_are_sent():
+    docs = [
+        {"_id": "1", "value": 1, "nested": {"a": 1, "b": [1, 2]}, "vector_": [0.1]},
+        {"_id": "2", "value": 2, "nested": {"a": 2, "b": [3, 4]}, "vector_": [0.2]},
+    ]
+    snapshots = DocDiffUtils().snapshot_documents(docs)
+    docs[0]["nested"]["b"].append(3)
+    docs[0]["label"] = "new"
+    docs[1]["value"] = True
+    assert DocDiffUtils().diff_documents(snapshots, docs) == [
+        {"_id": "1", "nested.b": [1, 2, 3], "label": "new"},
+        {"_id": "2", "value": True},
+    ]
+
+
+def test_documents_without_snapshot_are_sent_whole():
+    doc = {"_id": "3", "value": 3}
+    assert DocDiffUtils().diff_documents({}, [doc]) == [doc]
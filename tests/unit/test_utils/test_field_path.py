@@ -0,0 +1,203 @@
+"""Test that compiled field paths behave like the get_field/set_field path
+walk and are faster
+"""
+import time
+
+from copy import deepcopy
+
+import pytest
+
+from relevanceai.utils.doc_utils import DocUtils
+from relevanceai.utils.doc_utils.errors import MissingFieldError
+from relevanceai.utils.doc_utils.field_path import (
+    FieldPath,
+    _is_string_integer,
+    get_field_path,
+)
+
+
+def test_get_field_path_is_cached():
+    assert get_field_path("a.b.c") is get_field_path("a.b.c")
+    assert get_field_path("a.b.c").parts == ["a", "b", "c"]
+
+
+def test_field_path_matches_get_field():
+    doc = {
+        "a": {"b": {"c": 1}},
+        "flat.key": 2,
+        "chunk": [{"text": "first"}, {"text": "second"}],
+    }
+    assert DocUtils.get_field("a.b.c", doc) == 1
+    assert DocUtils.get_field("flat.key", doc) == 2
+    assert DocUtils.get_field("chunk.1.text", doc) == "second"
+    assert DocUtils.get_field("a.x", doc, missing_treatment="return_none") is None
+    assert DocUtils.get_field("a.x", doc, missing_treatment="return_empty_string") == ""
+    assert DocUtils.get_field("a.x", doc, missing_treatment=0) == 0
+    with pytest.raises(MissingFieldError):
+        DocUtils.get_field("a.x", doc)
+    assert DocUtils.is_field("a.b.c", doc)
+    assert DocUtils.is_field("flat.key", doc)
+    assert not DocUtils.is_field("a.b.x", doc)
+
+
+def test_get_many_and_set_many():
+    docs = [{"a": {"b": {"c": i}}} for i in range(3)] + [{"a": {}}]
+    path = FieldPath("a.b.c")
+    assert path.get_many(docs, missing_treatment="skip") == [0, 1, 2]
+    assert path.get_many(docs, missing_treatment="return_none") == [0, 1, 2, None]
+
+    path.set_many(docs, [10, 11, 12, 13])
+    assert path.get_many(docs) == [10, 11, 12, 13]
+    with pytest.raises(AssertionError):
+        path.set_many(docs, [1])
+
+    DocUtils().set_field_across_documents("x.y", [1, 2, 3, 4], docs)
+    assert DocUtils().get_field_across_documents("x.y", docs) == [1, 2, 3, 4]
+
+
+# A frozen copy of the path walking get_field, is_field and set_field from
+# before FieldPath, which DocUtils now delegates to
+def baseline_get_field(field, doc, missing_treatment="raise_error"):
+    d = doc
+    for f in field.split("."):
+        try:
+            d = d[f]
+        except KeyError:
+            try:
+                return doc[field]
+            except KeyError:
+                if missing_treatment == "return_none":
+                    return None
+                elif missing_treatment == "return_empty_string":
+                    return ""
+                elif missing_treatment == "raise_error":
+                    raise MissingFieldError("Document is missing " + f + " of " + field)
+                else:
+                    return missing_treatment
+        except TypeError:
+            if _is_string_integer(f):
+                try:
+                    d = d[int(f)]
+                except IndexError:
+                    pass
+            else:
+                if missing_treatment == "return_none":
+                    return None
+                elif missing_treatment == "return_empty_string":
+                    return ""
+                raise MissingFieldError("Document is missing " + f + " of " + field)
+    return d
+
+
+def baseline_is_field(field, doc):
+    d = doc
+    for f in field.split("."):
+        try:
+            d = d[f]
+        except KeyError:
+            try:
+                doc[field]
+                return True
+            except KeyError:
+                try:
+                    d[field]
+                except KeyError:
+                    return False
+        except TypeError:
+            if _is_string_integer(f):
+                try:
+                    d = d[int(f)]
+                except IndexError:
+                    pass
+            else:
+                return False
+    return True
+
+
+def baseline_set_field(field, doc, value):
+    fields = field.split(".")
+    d = doc
+    for i, f in enumerate(fields):
+        if i == len(fields) - 1:
+            d[f] = value
+        else:
+            if f in d.keys():
+                d = d[f]
+            else:
+                d.update({f: {}})
+                d = d[f]
+
+
+def outcome(func, *args, **kwargs):
+    """The result of a call, or the type of error it raised"""
+    try:
+        return ("value", func(*args, **kwargs))
+    except Exception as e:
+        return ("error", type(e))
+
+
+FIELDS = ["a.b.c", "a.b", "a", "flat.key", "chunk.1.text", "chunk.5.text", "a.x.y"]
+DOCS = [
+    {"a": {"b": {"c": 1}}},
+    {"a": {"b": None}},
+    {"a": {"b": [1, 2]}},
+    {"a": {}},
+    {"a": 1},
+    {"a.b.c": "flat", "flat.key": 2},
+    {"a": {"b.c": "partly flat"}},
+    {"chunk": [{"text": "first"}, {"text": "second"}]},
+    {"chunk": [{"text": "first"}]},
+    {},
+]
+
+
+@pytest.mark.parametrize("field", FIELDS)
+def test_field_path_matches_the_baseline_walk(field):
+    path = get_field_path(field)
+    for missing_treatment in ["raise_error", "return_none", "return_empty_string", 0]:
+        expected = [
+            outcome(baseline_get_field, field, doc, missing_treatment) for doc in DOCS
+        ]
+        assert [outcome(path.get, doc, missing_treatment) for doc in DOCS] == expected
+        assert [
+            outcome(DocUtils.get_field, field, doc, missing_treatment) for doc in DOCS
+        ] == expected
+    assert [path.exists(doc) for doc in DOCS] == [
+        baseline_is_field(field, doc) for doc in DOCS
+    ]
+
+    for missing_treatment in ["skip", "return_none", "return_empty_string"]:
+        expected_values = [
+            baseline_get_field(field, doc, missing_treatment=missing_treatment)
+            for doc in DOCS
+            if missing_treatment != "skip" or baseline_is_field(field, doc)
+        ]
+        assert path.get_many(DOCS, missing_treatment=missing_treatment) == (
+            expected_values
+        )
+
+    for doc in DOCS:
+        expected_doc, doc = deepcopy(doc), deepcopy(doc)
+        expected = outcome(baseline_set_field, field, expected_doc, "value")
+        assert outcome(path.set, doc, "value") == expected
+        if expected[0] == "value":
+            assert doc == expected_doc
+
+
+@pytest.mark.slow
+def test_get_many_is_faster_than_the_baseline_walk():
+    docs = [{"a": {"b": {"c": i}}} for i in range(100_000)]
+    path = get_field_path("a.b.c")
+
+    def best_of(func):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    compiled = best_of(lambda: path.get_many(docs))
+    walked = best_of(lambda: [baseline_get_field("a.b.c", d) for d in docs])
+    assert path.get_many(docs) == list(range(100_000))
+    assert compiled < walked
@@ -1,6 +1,7 @@
 """
 Simple tests to ensure import errors don't happen
 """
+import pytest
 
 
 def test_client():
@@ -24,3 +25,80 @@ def test_core():
     from relevanceai.operations.dr.base import DimReduction
 
     assert True
+
+
+def test_import_is_lazy_and_offline():
+    import subprocess
+    import sys
+
+    # Import in a fresh interpreter with the network disabled
+    code = """
+import socket, sys, time
+
+def no_network(*args, **kwargs):
+    raise OSError("Network is disabled")
+
+socket.socket.connect = no_network
+socket.create_connection = no_network
+before = set(sys.modules)
+start = time.perf_counter()
+import relevanceai
+seconds = time.perf_counter() - start
+heavy = [m for m in ("pandas", "numpy", "sklearn", "tqdm", "requests") if m in sys.modules]
+print(seconds, len(set(sys.modules) - before), ",".join(heavy))
+"""
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split(" ")
+    seconds, number_of_modules, heavy_modules = (
+        float(output[0]),
+        int(output[1]),
+        output[2].strip(),
+    )
+    assert seconds < 0.5
+    assert number_of_modules < 50
+    assert heavy_modules == ""
+
+
+def run_in_fresh_interpreter(code: str) -> str:
+    import subprocess
+    import sys
+
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "relevanceai.utils",
+        "relevanceai.dataset",
+        "relevanceai.workflow",
+        "relevanceai.operations",
+        "relevanceai.operations.vector",
+        "relevanceai._api",
+        "relevanceai.client",
+        "relevanceai.operations_new",
+        "relevanceai.operations_new.dataset_ops",
+    ],
+)
+def test_subpackage_can_be_imported_first(module):
+    run_in_fresh_interpreter(f"import {module}")
+
+
+def test_star_import_and_optional_names():
+    output = run_in_fresh_interpreter(
+        """
+import importlib.util
+import relevanceai
+from relevanceai import *
+from relevanceai.operations.vector import LocalVectorIndex
+
+print(Client.__name__, ClusterOps.__name__, mock_documents.__name__)
+if importlib.util.find_spec("jsonshower") is None:
+    assert "show_json" not in relevanceai.__all__
+    assert not hasattr(relevanceai, "show_json")
+"""
+    )
+    assert output.split() == ["Client", "ClusterOps", "mock_documents"]
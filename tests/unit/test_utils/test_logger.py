@@ -0,0 +1,72 @@
+"""Test that loguru handlers are only added when the logging settings change
+"""
+import importlib
+
+from relevanceai._api.batch.insert import BatchInsertClient
+from relevanceai.client.helpers import Credentials
+
+logger_module = importlib.import_module("relevanceai.utils.logger")
+transport_module = importlib.import_module("relevanceai.utils.transport")
+
+
+class MockResponse:
+    status_code = 200
+    content = b""
+
+    def __init__(self, number_of_documents):
+        self.number_of_documents = number_of_documents
+
+    def json(self):
+        return {"inserted": self.number_of_documents, "failed_documents": []}
+
+
+class MockSession:
+    def send(self, request):
+        return MockResponse(number_of_documents=10)
+
+
+def test_write_documents_configures_handlers_once(monkeypatch):
+    monkeypatch.setattr(transport_module, "get_session", lambda: MockSession())
+    added = []
+    add = logger_module.loguru_logger.add
+
+    def counting_add(*args, **kwargs):
+        added.append(args)
+        return add(*args, **kwargs)
+
+    monkeypatch.setattr(logger_module.loguru_logger, "add", counting_add)
+    logger_module._LOGGER_SETTINGS = None
+
+    client = BatchInsertClient(
+        credentials=Credentials(
+            token="project:api_key:us-east-1:firebase_uid",
+            project="project",
+            api_key="api_key",
+            region="us-east-1",
+            firebase_uid="firebase_uid",
+        )
+    )
+    client.config["retries.number_of_retries"] = 1
+    client.config["retries.seconds_between_retries"] = 0
+    documents = [{"_id": str(i), "value": i} for i in range(500)]
+    results = client._write_documents(
+        lambda chunk: client.datasets.bulk_insert(
+            "sample_dataset", chunk, return_documents=True
+        ),
+        documents,
+        chunksize=10,
+    )
+    assert results["inserted"] == 500
+    assert len(added) == 1
+
+    # Handlers are replaced once the logging level changes
+    client.config["logging.logging_level"] = "DEBUG"
+    client._write_documents(
+        lambda chunk: client.datasets.bulk_insert(
+            "sample_dataset", chunk, return_documents=True
+        ),
+        documents,
+        chunksize=10,
+    )
+    assert len(added) == 2
+    logger_module._LOGGER_SETTINGS = None
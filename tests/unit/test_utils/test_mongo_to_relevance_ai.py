@@ -0,0 +1,190 @@
+"""Testing range-paginated MongoDB imports against mongomock
+"""
+import datetime
+import threading
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+from bson import ObjectId
+
+from relevanceai.constants import CONFIG
+from relevanceai.utils.mongo_to_relevance_ai import (
+    MongoImporter,
+    encode_bson_documents,
+)
+
+
+class MockDatasets:
+    def __init__(self, fail_after=None, failing_values=()):
+        self.documents = {}
+        self.fail_after = fail_after
+        self.failing_values = set(failing_values)
+        self.request_sizes = []
+        self.lock = threading.Lock()
+
+    def create(self, dataset_id):
+        if self.documents:
+            return {"message": f"{dataset_id} already exists"}
+        return {"message": "created"}
+
+    def bulk_insert(self, dataset_id, documents):
+        with self.lock:
+            if self.fail_after is not None and len(self.documents) >= self.fail_after:
+                raise ConnectionError("Insert failed")
+            self.request_sizes.append(len(documents))
+            failed = [d for d in documents if d["value"] in self.failing_values]
+            for document in documents:
+                if document["value"] not in self.failing_values:
+                    self.documents[document["_id"]] = document
+        return {
+            "inserted": len(documents) - len(failed),
+            "failed_documents": [{"_id": d["_id"]} for d in failed],
+        }
+
+
+class MockConfig:
+    """CONFIG with some options changed"""
+
+    def __init__(self, **options):
+        self.options = {"retries.number_of_retries": 2, **options}
+
+    def get_option(self, option):
+        if option in self.options:
+            return self.options[option]
+        return CONFIG.get_option(option)
+
+
+class CountingCollection:
+    """Records every query sent to the collection"""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.queries = []
+
+    def find(self, query=None, *args, **kwargs):
+        self.queries.append(query)
+        return self.collection.find(query, *args, **kwargs)
+
+
+def get_importer(collection, datasets):
+    importer = MongoImporter.__new__(MongoImporter)
+    importer.mongo_collection = CountingCollection(collection)
+    importer._datasets_client = datasets
+    importer.config = CONFIG
+    return importer
+
+
+@pytest.fixture
+def collection():
+    collection = mongomock.MongoClient().db.collection
+    collection.insert_many(
+        [{"_id": ObjectId(), "value": i, "nested": {"a": i}} for i in range(95)]
+    )
+    return collection
+
+
+def test_encode_bson_documents():
+    object_id = ObjectId()
+    documents = encode_bson_documents(
+        [
+            {
+                "_id": object_id,
+                "date": datetime.datetime(2022, 1, 2),
+                "nested": {"id": object_id, "score": float("nan")},
+                "values": [1.5, {"b": object_id}],
+            },
+            {"value": 1},
+        ]
+    )
+    assert documents[0] == {
+        "_id": str(object_id),
+        "date": "2022-01-02T00:00:00",
+        "nested-id": str(object_id),
+        "nested-score": "",
+        "values": [1.5, {"b": str(object_id)}],
+    }
+    assert documents[1]["value"] == 1 and "_id" in documents[1]
+
+
+def test_migrate_paginates_by_id(collection):
+    datasets = MockDatasets()
+    importer = get_importer(collection, datasets)
+    importer.migrate("dataset", chunk_size=10, max_workers=3)
+
+    assert len(datasets.documents) == 95
+    assert datasets.documents[str(collection.find_one({"value": 3})["_id"])] == {
+        "_id": str(collection.find_one({"value": 3})["_id"]),
+        "value": 3,
+        "nested-a": 3,
+    }
+    queries = importer.mongo_collection.queries
+    assert queries[0] == {}
+    assert all(list(q["_id"]) == ["$gt"] for q in queries[1:])
+    assert len(queries) == 11
+
+
+def test_migrate_start_idx_and_document_count(collection):
+    datasets = MockDatasets()
+    importer = get_importer(collection, datasets)
+    importer.migrate("dataset", document_count=25, chunk_size=10, start_idx=50)
+    assert sorted(d["value"] for d in datasets.documents.values()) == list(
+        range(50, 75)
+    )
+
+
+def test_migrate_resumes_from_checkpoint(collection, tmp_path):
+    checkpoint_path = str(tmp_path / "import.checkpoint")
+    datasets = MockDatasets(fail_after=40)
+    importer = get_importer(collection, datasets)
+    with pytest.raises(ConnectionError):
+        importer.migrate(
+            "dataset", chunk_size=10, max_workers=1, checkpoint_path=checkpoint_path
+        )
+    checkpoint = MongoImporter.read_checkpoint(checkpoint_path, "dataset")
+    assert checkpoint["number_of_documents"] == 40
+    assert isinstance(checkpoint["last_id"], ObjectId)
+
+    datasets.fail_after = None
+    message = importer.migrate(
+        "dataset", chunk_size=10, checkpoint_path=checkpoint_path
+    )
+    assert message == "Successfully ingested 95 entities to dataset."
+    assert sorted(d["value"] for d in datasets.documents.values()) == list(range(95))
+    assert importer.mongo_collection.queries[-1]["_id"]["$gt"] is not None
+    assert MongoImporter.read_checkpoint(checkpoint_path, "other") is None
+
+
+def test_documents_are_inserted_in_requests_split_by_size(collection):
+    datasets = MockDatasets()
+    importer = get_importer(collection, datasets)
+    importer.config = MockConfig(**{"upload.max_chunk_size": 4})
+    importer.migrate("dataset", chunk_size=10, max_workers=1)
+    assert len(datasets.documents) == 95
+    assert datasets.request_sizes == [4, 4, 2] * 9 + [4, 1]
+
+    # Documents bigger than the target size are sent one at a time
+    datasets = MockDatasets()
+    importer = get_importer(collection, datasets)
+    importer.config = MockConfig(**{"upload.target_chunk_mb": 0.00001})
+    importer.migrate("dataset", chunk_size=10, max_workers=1)
+    assert datasets.request_sizes == [1] * 95
+
+
+def test_checkpoint_stops_before_failed_documents(collection, tmp_path):
+    checkpoint_path = str(tmp_path / "import.checkpoint")
+    datasets = MockDatasets(failing_values={25})
+    importer = get_importer(collection, datasets)
+    importer.config = MockConfig()
+    message = importer.migrate(
+        "dataset", chunk_size=10, max_workers=1, checkpoint_path=checkpoint_path
+    )
+
+    assert message == "Successfully ingested 94 entities to dataset."
+    assert len(datasets.documents) == 94
+    # Both tries of the failed document are sent
+    assert datasets.request_sizes[2:4] == [10, 1]
+    checkpoint = MongoImporter.read_checkpoint(checkpoint_path, "dataset")
+    assert checkpoint["number_of_documents"] == 20
+    assert checkpoint["last_id"] == collection.find_one({"value": 19})["_id"]
@@ -0,0 +1,49 @@
+"""Test that workflows send chunk values to models in batches
+"""
+from relevanceai.workflow.base import Workflow
+
+
+class MockDataset:
+    dataset_id = "dataset"
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.metadata = {}
+        self.kwargs = {}
+
+    def pull_update_push_async(
+        self, dataset_id, update_function, retrieve_chunk_size=100, **kwargs
+    ):
+        self.kwargs = kwargs
+        for i in range(0, len(self.documents), retrieve_chunk_size):
+            update_function(self.documents[i : i + retrieve_chunk_size])
+
+
+def test_fit_dataset_batches_chunk_values():
+    calls = []
+
+    def bulk_len(values):
+        calls.append(len(values))
+        return [len(v) for v in values]
+
+    documents = [
+        {"_id": str(i), "_chunk_": [{"text": "a" * i}, {"text": "b"}]}
+        for i in range(10)
+    ]
+    dataset = MockDataset(documents)
+    workflow = Workflow(len, workflow_alias="length", bulk_func=bulk_len)
+    workflow.fit_dataset(
+        dataset,
+        input_field="text",
+        output_field="length",
+        chunk_field="_chunk_",
+        chunksize=5,
+        log_to_file=False,
+        log_file="workflow.log",
+    )
+    # One call per chunk of 5 documents with 2 values each
+    assert calls == [10, 10]
+    assert documents[3]["_chunk_"][0]["length"] == 3
+    assert dataset.metadata["workflows"][0]["output_field"] == "_chunk_.length"
+    assert dataset.kwargs["log_to_file"] is False
+    assert dataset.kwargs["log_file"] == "workflow.log"